@@ -8,12 +8,14 @@ from app.models.schemas import ChatRequest, ChatResponse
 from app.services.ai_service import AIService
 from app.infrastructure.chat_room_repository import ChatRoomRepository
 from app.infrastructure.conversation_room_repository import ConversationRoomRepository
+from app.infrastructure.ai.embedding_cache import query_embedding_cache
+from app.infrastructure.ai.vector_store import require_vector_store_ready
 
 router = APIRouter(prefix="/api/v1", tags=["AI Chat"])
 
 
-def get_ai_service() -> AIService:
-    """AI 서비스 의존성 주입"""
+async def get_ai_service(_: None = Depends(require_vector_store_ready)) -> AIService:
+    """AI 서비스 의존성 주입 (벡터 저장소 준비 후)"""
     return AIService()
 
 
@@ -51,6 +53,16 @@ async def chat_with_ai(
     )
 
 
+@router.get("/chat/status")
+async def get_chat_status():
+    """
+    채팅 검색 상태 조회
+
+    질의 임베딩 캐시 크기, 적중률, 평균 인코딩 시간과 적중으로 절약한 시간(추정)을 반환합니다.
+    """
+    return {"query_embedding_cache": query_embedding_cache.get_status()}
+
+
 @router.get("/conversations")
 async def get_conversations(
     user_id: str,
@@ -1,16 +1,32 @@
 from fastapi import APIRouter, HTTPException, status, Depends, Request
-from app.models.schemas import CrawlRequest, CrawlResponse
-from app.services.crawl_service import CrawlService
+from fastapi.responses import StreamingResponse
+from app.models.schemas import CrawlJobResponse, CrawlRequest, CrawlResponse
+from app.services.crawl_job_service import CrawlJobService, crawl_job_service
+from app.services.crawl_event_stream import CrawlEventStream
+from app.services.crawl_service import CrawlService, crawl_singleflight
+from app.infrastructure.crawler.browser_pool import browser_pool
+from app.infrastructure.crawler.worker_pool import crawler_worker_pool
+from app.infrastructure.crawler.http_review_fetcher import http_review_fetcher
+from app.infrastructure.ai.embedding_cache import embedding_cache
+from app.infrastructure.ai.vector_store import require_vector_store_ready
+from app.infrastructure.crawler.waits import wait_statistics
+from app.core.config import settings
+from app.utils.rate_limiter import host_rate_limiter
 from loguru import logger
 
 router = APIRouter(prefix="/api/v1", tags=["크롤링"])
 
 
-def get_crawl_service() -> CrawlService:
-    """크롤 서비스 의존성 주입"""
+async def get_crawl_service(_: None = Depends(require_vector_store_ready)) -> CrawlService:
+    """크롤 서비스 의존성 주입 (벡터 저장소 준비 후)"""
     return CrawlService()
 
 
+def get_crawl_job_service() -> CrawlJobService:
+    """크롤링 작업 서비스 의존성 주입"""
+    return crawl_job_service
+
+
 def _validate_crawl_request(request: CrawlRequest):
     errors = []
     # product_url 필수 및 타입 체크
@@ -72,4 +88,124 @@ async def crawl_product_reviews(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"크롤링 중 서버 오류가 발생했습니다: {str(e)}"
-        ) 
\ No newline at end of file
+        )
+
+
+@router.post("/crawl-reviews/stream")
+async def stream_product_reviews(
+    request: CrawlRequest,
+    crawl_service: CrawlService = Depends(get_crawl_service)
+) -> StreamingResponse:
+    """
+    다나와 상품 리뷰 크롤링 (진행 상황 Server-Sent Events 스트리밍)
+    
+    - **product_url**: 다나와 상품 URL
+    - **max_reviews**: 수집할 최대 리뷰 수 (1-1000)
+    
+    `/crawl-reviews` 와 같은 작업을 수행하며 진행 이벤트를 `text/event-stream` 으로 전송합니다.
+    
+    - `page_loaded`, `product_info`, `review_tab`: 페이지 로드 단계
+    - `click`: 더보기 N번째 클릭 (`click`, `reviews_loaded`)
+    - `reviews_extracted`: 지금까지 추출한 리뷰 수
+    - `batch_crawled`, `batch_indexed`: 배치별 수집/임베딩 색인 진행
+    - `chat_ready`: 첫 배치 색인 완료 - 이 시점부터 채팅 가능
+    - `shared`: 같은 상품의 진행 중인 크롤링에 합류 (이후 이벤트는 그 작업의 진행 상황)
+    - `done`: 최종 CrawlResponse, `error`: 오류
+    """
+    errors = _validate_crawl_request(request)
+    if errors:
+        logger.error(f"400 Bad Request 발생 | 전달값: product_url={request.product_url}, max_reviews={request.max_reviews} | errors={errors}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid or missing parameters: {errors}"
+        )
+
+    events = CrawlEventStream()
+    crawl = crawl_service.crawl_product_reviews(
+        request,
+        on_progress=events.on_progress,
+        on_event=events.on_event
+    )
+    return StreamingResponse(
+        events.stream(crawl),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.post("/crawl-jobs", response_model=CrawlJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_crawl_job(
+    request: CrawlRequest,
+    job_service: CrawlJobService = Depends(get_crawl_job_service)
+) -> CrawlJobResponse:
+    """
+    다나와 상품 리뷰 크롤링 작업 등록 (비동기)
+    
+    - **product_url**: 다나와 상품 URL
+    - **max_reviews**: 수집할 최대 리뷰 수 (1-1000)
+    
+    작업 ID를 즉시 반환하고 크롤링은 백그라운드 워커에서 실행합니다.
+    진행 상황과 최종 결과는 `GET /api/v1/crawl-jobs/{job_id}` 로 조회합니다.
+    """
+    errors = _validate_crawl_request(request)
+    if errors:
+        logger.error(f"400 Bad Request 발생 | 전달값: product_url={request.product_url}, max_reviews={request.max_reviews} | errors={errors}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid or missing parameters: {errors}"
+        )
+    if not CrawlService.validate_url(str(request.product_url)):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="유효하지 않은 다나와 URL입니다."
+        )
+    try:
+        return job_service.submit(request)
+    except Exception as e:
+        logger.error(f"크롤링 작업 등록 실패: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"크롤링 작업 등록 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.get("/crawl-jobs/{job_id}", response_model=CrawlJobResponse)
+async def get_crawl_job(
+    job_id: str,
+    job_service: CrawlJobService = Depends(get_crawl_job_service)
+) -> CrawlJobResponse:
+    """
+    크롤링 작업 상태 조회
+    
+    작업 상태(queued/running/succeeded/failed), 진행 단계, 지금까지 찾은 리뷰 수,
+    완료 시 최종 크롤링 결과(CrawlResponse)를 반환합니다.
+    """
+    job = job_service.get_job(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"크롤링 작업을 찾을 수 없습니다: {job_id}"
+        )
+    return job
+
+
+@router.get("/crawler/status")
+async def get_crawler_status():
+    """
+    크롤러 상태 조회
+
+    브라우저 풀 사용 현황과 대기 이름별 실제 대기 시간 통계(횟수, 타임아웃, 평균/p95/최대)를 반환합니다.
+    대기 타임아웃 설정을 운영 데이터로 조정할 때 사용합니다.
+    호스트별 요청 속도 제한 상태(가용 토큰, 대기열 길이, 누적 대기 시간)도 함께 반환합니다.
+    크롤러 워커 프로세스를 쓰는 경우 워커별 작업 수, 메모리, 재시작 횟수를 함께 반환합니다.
+    재크롤링 시 임베딩 캐시 적중/미스 수도 함께 반환합니다.
+    """
+    return {
+        "browser_pool": browser_pool.get_status(),
+        "worker_pool": crawler_worker_pool.get_status(),
+        "http_fast_path": {"enabled": settings.crawler_http_fast_path, **http_review_fetcher.stats},
+        "waits": wait_statistics.snapshot(),
+        "rate_limiter": host_rate_limiter.get_status(),
+        "singleflight": crawl_singleflight.get_status(),
+        "embedding_cache": embedding_cache.get_status()
+    }
@@ -9,6 +9,7 @@ from loguru import logger
 from app.services.crawl_product_review_service import CrawlProductReviewService
 from app.services.special_deals_manage_service import SpecialDealsManageService
 from app.infrastructure.unified_product_repository import unified_product_repository
+from app.infrastructure.ai.vector_store import require_vector_store_ready
 from app.infrastructure.chat_room_repository import ChatRoomRepository
 from app.models.schemas import CrawlRequest
 
@@ -44,8 +45,8 @@ class ProductStatistics(BaseModel):
 router = APIRouter(prefix="/api/v1/products", tags=["Products"])
 
 
-def get_crawl_service() -> CrawlProductReviewService:
-    """크롤링 서비스 의존성 주입"""
+async def get_crawl_service(_: None = Depends(require_vector_store_ready)) -> CrawlProductReviewService:
+    """크롤링 서비스 의존성 주입 (벡터 저장소 준비 후)"""
     return CrawlProductReviewService()
 
 
@@ -13,6 +13,7 @@ from app.models.schemas import (
     SpecialProduct
 )
 from app.services.special_deals_service import special_deals_service
+from app.utils.rate_limiter import host_rate_limiter
 
 router = APIRouter(prefix="/api/v1", tags=["특가상품"])
 
@@ -48,6 +49,9 @@ async def get_image_proxy(
             'Pragma': 'no-cache',
         }
         
+        # 크롤러와 같은 호스트별 속도 제한 공유
+        await host_rate_limiter.acquire(url)
+        
         async with httpx.AsyncClient() as client:
             response = await client.get(url, headers=headers, timeout=10.0)
             
@@ -161,18 +165,20 @@ def get_special_deal_by_id(
 async def process_uncrawled_products(
     background_tasks: BackgroundTasks,
     batch_size: int = Query(5, ge=1, le=20, description="배치 처리할 상품 수"),
+    incremental: bool = Query(True, description="이미 저장된 리뷰는 건너뛰고 새 리뷰만 수집"),
     service = Depends(get_special_deals_service)
 ):
     """
     아직 리뷰가 크롤링되지 않은 특가 상품들을 백그라운드에서 처리
     
     - **batch_size**: 한 번에 처리할 상품 수 (1-20, 기본값: 5)
+    - **incremental**: 증분 크롤링 여부 (기본값: true)
     
     리뷰 크롤링이 완료되지 않은 특가 상품들의 리뷰를 백그라운드에서 수집합니다.
     """
     try:
         # 백그라운드 태스크로 실행
-        background_tasks.add_task(service.process_uncrawled_products, batch_size)
+        background_tasks.add_task(service.process_uncrawled_products, batch_size, incremental)
         
         return {
             "success": True,
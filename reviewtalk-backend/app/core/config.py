@@ -2,7 +2,7 @@
 애플리케이션 설정 및 환경변수 관리
 """
 import os
-from typing import List, Literal
+from typing import Dict, List, Literal
 from pydantic_settings import BaseSettings
 
 
@@ -43,9 +43,88 @@ class Settings(BaseSettings):
     # 크롤링 설정
     crawling_timeout: int = 30
     max_reviews_per_product: int = 50
-    
+    crawl_result_ttl: float = 300.0  # 같은 상품 크롤링 결과 재사용 시간 (초, 0이면 재사용 안 함)
+    crawl_job_workers: int = 2  # 비동기 크롤링 작업(/crawl-jobs) 처리 워커 수
+    crawl_pipeline_queue_size: int = 2  # 크롤링 → 임베딩 단계 사이 대기 배치 수 상한
+    crawl_checkpoint_enabled: bool = True  # 배치 색인마다 체크포인트 저장, 재시도 시 이어서 크롤링
+    crawl_checkpoint_max_age: float = 21600.0  # 이보다 오래된 체크포인트는 무시하고 처음부터 (초, 0이면 제한 없음)
+
+    # 브라우저 풀 설정 (앱 수명주기 동안 Chromium 재사용)
+    browser_pool_enabled: bool = True
+    browser_pool_max_concurrency: int = 3  # 동시에 임대 가능한 페이지 수
+    browser_pool_recycle_pages: int = 50  # 브라우저 1개당 처리 페이지 수 (초과 시 재시작)
+    browser_pool_prewarm_contexts: int = 1  # 시작 시 미리 만들어 둘 컨텍스트 수
+    browser_storage_state_enabled: bool = True  # 쿠키/localStorage 를 파일로 저장해 새 컨텍스트와 재시작 후 재사용
+    browser_storage_state_path: str = "./data/browser_state.json"
+    browser_storage_state_max_age: float = 86400.0  # 이보다 오래된 세션 상태는 쓰지 않음 (초, 0이면 제한 없음)
+    browser_storage_state_refresh: float = 1800.0  # 세션 상태를 다시 저장하는 주기 (초)
+
+    # 크롤러 워커 프로세스 설정 (0 이면 API 프로세스 안에서 크롤링)
+    crawler_worker_processes: int = 0  # 리뷰 크롤링을 실행할 별도 프로세스 수
+    crawler_worker_max_rss_mb: float = 1536.0  # 워커(Chromium 포함) 메모리 상한, 초과 시 재시작 (0이면 검사 안 함)
+    crawler_worker_max_jobs: int = 100  # 워커 1개당 처리 작업 수 (초과 시 재시작)
+
+    # 크롤러 대기 타임아웃 (초) - 조건 충족 시 즉시 반환, 실측값은 /api/v1/crawler/status 참고
+    crawler_page_ready_timeout: float = 10.0  # 페이지 이동 후 핵심 요소 대기
+    crawler_scroll_settle_timeout: float = 0.75  # 스크롤 후 항목 수/문서 높이 변화 대기 (변화 없으면 스크롤 중단)
+    crawler_max_scrolls: int = 10  # 스크롤 횟수 상한
+    crawler_review_tab_timeout: float = 8.0  # 리뷰 탭 클릭 후 리뷰 목록 대기
+    crawler_load_more_timeout: float = 8.0  # 더보기 클릭 후 리뷰 개수 증가 대기
+    crawler_max_more_clicks: int = 40  # 상품 1건당 더보기 클릭 상한 (안전장치, 실제 클릭 수는 전체 리뷰 수로 계산)
+
+    # HTTP 전용 리뷰 수집 (브라우저 없이 httpx 로 HTML 파싱, 실패 시 Playwright 크롤링으로 대체)
+    crawler_http_fast_path: bool = False
+    # 리뷰 목록 HTML 주소 템플릿 ({code}: 상품 코드, {page}: 1부터), 비어 있으면 HTTP 경로를 시도하지 않음
+    # 상품 페이지 HTML 에는 첫 리뷰 몇 개만 들어 있으므로 목록 주소 없이는 거의 항상 브라우저로 대체된다.
+    # 주소는 crawler_replay_mode=record 로 크롤링한 뒤 아카이브 index.json 에서 더보기 XHR 을 찾아 설정한다.
+    crawler_http_review_list_url: str = ""
+    crawler_http_max_pages: int = 10
+
+    # 크롤러 리소스 차단 설정 (크롤링 모드별 차단할 Playwright resource_type)
+    crawler_block_resources: bool = True
+    crawler_blocked_resource_types: Dict[str, List[str]] = {
+        "review": ["image", "media", "font"],
+        "product_info": ["image", "media", "font"],
+        "special_deals": ["image", "media", "font"]
+    }
+    crawler_blocked_url_patterns: List[str] = []  # 광고/트래킹 기본 패턴 외 추가 차단할 URL 정규식
+
+    # 크롤링 기록/재생 (벤치마크용 - record: 응답을 아카이브에 저장, replay: 네트워크 없이 아카이브로 응답)
+    crawler_replay_mode: Literal["off", "record", "replay"] = "off"
+    crawler_replay_archive: str = "./data/crawl_archive"
+    crawler_replay_latency: float = 0.0  # 재생 시 응답마다 추가할 지연 (초)
+
+    # 동시 크롤링 실행기 설정 (특가 상품 리뷰 일괄 크롤링)
+    crawl_executor_max_workers: int = 3  # 동시 크롤링 상품 수 (browser_pool_max_concurrency 이하 권장)
+    crawl_executor_per_host_limit: int = 3  # 같은 호스트 동시 작업 상한
+    crawl_executor_task_timeout: float = 300.0  # 상품 1건 최대 처리 시간 (초)
+
+    # 호스트별 요청 속도 제한 (토큰 버킷: rate=초당 토큰, burst=최대 누적 토큰)
+    rate_limit_enabled: bool = True
+    rate_limit_hosts: Dict[str, Dict[str, float]] = {
+        "m.danawa.com": {"rate": 2.0, "burst": 5},
+        "prod.danawa.com": {"rate": 2.0, "burst": 5},
+        "img.danawa.com": {"rate": 10.0, "burst": 20}
+    }
+    rate_limit_default_rate: float = 2.0  # 목록에 없는 호스트
+    rate_limit_default_burst: int = 5
+
     # ChromaDB 설정
     chroma_db_path: str = "./data/chroma_db"
+    embedding_model_name: str = "intfloat/multilingual-e5-small"
+    embedding_warmup_enabled: bool = True  # 앱 시작 시 Chroma 클라이언트/인코더를 백그라운드에서 미리 로드
+    embedding_warmup_wait_timeout: float = 20.0  # 워밍업 중 요청이 기다리는 최대 시간 (초과 시 503 + Retry-After)
+    embedding_backend: Literal["torch", "onnx"] = "torch"  # onnx: 양자화 ONNX Runtime 모델 (torch 불필요)
+    embedding_onnx_model_path: str = "./data/models/multilingual-e5-small-onnx"  # 로컬 경로 (python -m app.infrastructure.ai.encoders 로 생성)
+    embedding_onnx_file: str = "onnx/model_qint8_avx2.onnx"
+    embedding_onnx_threads: int = 0  # onnxruntime 스레드 수 (0이면 기본값)
+    embedding_max_length: int = 512  # ONNX 토크나이저 최대 토큰 수
+    embedding_batch_size: int = 32  # 인코더 배치 크기
+    vector_store_chunk_size: int = 256  # 리뷰를 이 개수씩 임베딩/upsert (메모리 상한)
+    embedding_cache_enabled: bool = True  # 같은 텍스트의 임베딩을 디스크에 저장해 재크롤링 시 재사용
+    embedding_cache_path: str = "./data/embedding_cache.db"
+    embedding_cache_max_entries: int = 200000  # 초과 시 가장 오래 안 쓰인 벡터부터 삭제 (0이면 제한 없음)
+    query_embedding_cache_size: int = 1024  # 채팅 질의 임베딩 LRU 캐시 크기 (0이면 캐시 안 함)
     
     class Config:
         env_file = ".env"
@@ -93,6 +93,37 @@ CREATE TABLE IF NOT EXISTS conversations (
     FOREIGN KEY (chat_room_id) REFERENCES chat_room(id) ON DELETE CASCADE,
     FOREIGN KEY (chat_user_id) REFERENCES user(user_id) ON DELETE SET NULL
 );
+CREATE TABLE IF NOT EXISTS crawl_jobs (
+    id TEXT PRIMARY KEY,
+    product_url TEXT NOT NULL,
+    max_reviews INTEGER NOT NULL,
+    is_special BOOLEAN DEFAULT FALSE,
+    status TEXT NOT NULL CHECK(status IN ('queued', 'running', 'succeeded', 'failed')),
+    stage TEXT,
+    reviews_found INTEGER DEFAULT 0,
+    result TEXT,
+    error_message TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    finished_at TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_crawl_jobs_status ON crawl_jobs(status);
+CREATE TABLE IF NOT EXISTS crawl_checkpoints (
+    product_id TEXT PRIMARY KEY,
+    product_url TEXT NOT NULL,
+    product_info TEXT,
+    max_reviews INTEGER DEFAULT 0,
+    loaded_count INTEGER DEFAULT 0,
+    batches INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS crawl_checkpoint_reviews (
+    product_id TEXT NOT NULL,
+    review_id TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (product_id, review_id)
+);
     
 """
 
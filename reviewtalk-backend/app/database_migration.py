@@ -17,7 +17,7 @@ def extract_sqlite_path(db_url: str) -> str:
 DB_PATH = Path(extract_sqlite_path(settings.database_url))
 
 # 데이터베이스 스키마 버전 관리
-SCHEMA_VERSION = 3
+SCHEMA_VERSION = 5
 
 # 마이그레이션 스크립트들
 MIGRATIONS = {
@@ -93,6 +93,47 @@ MIGRATIONS = {
             FOREIGN KEY (chat_user_id) REFERENCES user(user_id) ON DELETE SET NULL
         );
         """
+    },
+    4: {
+        "description": "Add crawl_jobs table for asynchronous crawl jobs",
+        "up": """
+        CREATE TABLE IF NOT EXISTS crawl_jobs (
+            id TEXT PRIMARY KEY,
+            product_url TEXT NOT NULL,
+            max_reviews INTEGER NOT NULL,
+            is_special BOOLEAN DEFAULT FALSE,
+            status TEXT NOT NULL CHECK(status IN ('queued', 'running', 'succeeded', 'failed')),
+            stage TEXT,
+            reviews_found INTEGER DEFAULT 0,
+            result TEXT,
+            error_message TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            finished_at TIMESTAMP
+        );
+        CREATE INDEX IF NOT EXISTS idx_crawl_jobs_status ON crawl_jobs(status);
+        """
+    },
+    5: {
+        "description": "Add crawl_checkpoints table for resumable review crawls",
+        "up": """
+        CREATE TABLE IF NOT EXISTS crawl_checkpoints (
+            product_id TEXT PRIMARY KEY,
+            product_url TEXT NOT NULL,
+            product_info TEXT,
+            max_reviews INTEGER DEFAULT 0,
+            loaded_count INTEGER DEFAULT 0,
+            batches INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        CREATE TABLE IF NOT EXISTS crawl_checkpoint_reviews (
+            product_id TEXT NOT NULL,
+            review_id TEXT NOT NULL,
+            data TEXT NOT NULL,
+            PRIMARY KEY (product_id, review_id)
+        );
+        """
     }
 }
 
@@ -232,7 +273,7 @@ def verify_schema():
             cursor = conn.cursor()
             
             # 필수 테이블 확인
-            required_tables = ['users', 'products', 'chat_room', 'reviews', 'conversations']
+            required_tables = ['users', 'products', 'chat_room', 'reviews', 'conversations', 'crawl_jobs', 'crawl_checkpoints', 'crawl_checkpoint_reviews']
             cursor.execute("""
                 SELECT name FROM sqlite_master 
                 WHERE type='table' AND name IN ({})
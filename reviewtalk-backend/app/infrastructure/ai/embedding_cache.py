@@ -0,0 +1,249 @@
+"""
+임베딩 캐시 - (모델명, 정규화한 텍스트 해시) 별 임베딩 벡터를 SQLite BLOB 으로 저장해 재크롤링 시 재계산 방지
+"""
+import hashlib
+import sqlite3
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+from loguru import logger
+
+from app.core.config import settings
+
+
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    dim INTEGER NOT NULL,
+    vector BLOB NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_embedding_cache_last_used ON embedding_cache(last_used);
+"""
+
+# SQLite 바인딩 변수 개수 제한보다 작게 나눠서 조회
+LOOKUP_CHUNK = 500
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화 (유니코드 NFC, 연속 공백 하나로)"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def cache_key(model: str, text: str) -> str:
+    return hashlib.sha256(f"{model}\x00{normalize_text(text)}".encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """임베딩 벡터 영구 캐시
+
+    - path: SQLite 파일 경로 (리뷰 DB 와 분리해 삭제해도 데이터 손실 없음)
+    - max_entries: 저장할 최대 벡터 수, 초과하면 가장 오래 안 쓰인 항목부터 삭제 (0이면 제한 없음)
+
+    저장할 때마다 COUNT(*) 를 하지 않도록 행 수 상한 추정치를 들고 있다가 상한을 넘을 때만 실제 행 수를 세고,
+    삭제는 max_entries 의 5% 만큼 여유를 두고 한 번에 한다. 통계와 추정치는 lock 안에서만 갱신한다.
+    """
+
+    def __init__(self, path: str, max_entries: int = 200000, enabled: bool = True):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self.lock = Lock()
+        self.stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0, "errors": 0}
+        self._initialized = False
+        self._row_estimate = 0  # 행 수 상한 추정치 (INSERT OR REPLACE 로 덮어쓴 행도 더하므로 실제보다 크거나 같음)
+
+    def _connect(self) -> sqlite3.Connection:
+        """lock 을 잡은 상태에서 호출"""
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            conn.executescript(CREATE_TABLE_SQL)
+            self._row_estimate = conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0]
+            self._initialized = True
+        return conn
+
+    def get_many(self, model: str, texts: List[str]) -> Dict[int, np.ndarray]:
+        """캐시에 있는 텍스트의 임베딩 조회 ({texts 인덱스: 벡터})"""
+        if not self.enabled or not texts:
+            return {}
+        keys = [cache_key(model, text) for text in texts]
+        found: Dict[str, np.ndarray] = {}
+        with self.lock:
+            try:
+                conn = self._connect()
+                try:
+                    unique_keys = list(dict.fromkeys(keys))
+                    for start in range(0, len(unique_keys), LOOKUP_CHUNK):
+                        chunk = unique_keys[start:start + LOOKUP_CHUNK]
+                        placeholders = ",".join("?" * len(chunk))
+                        rows = conn.execute(
+                            f"SELECT key, dim, vector FROM embedding_cache WHERE key IN ({placeholders})",
+                            chunk
+                        ).fetchall()
+                        for key, dim, vector in rows:
+                            found[key] = np.frombuffer(vector, dtype=np.float32, count=dim)
+                    if found:
+                        conn.executemany(
+                            "UPDATE embedding_cache SET last_used = ? WHERE key = ?",
+                            [(time.time(), key) for key in found]
+                        )
+                        conn.commit()
+                finally:
+                    conn.close()
+            except sqlite3.Error as e:
+                self.stats["errors"] += 1
+                logger.warning(f"임베딩 캐시 조회 실패: {e}")
+                return {}
+
+            result = {index: found[key] for index, key in enumerate(keys) if key in found}
+            self.stats["hits"] += len(result)
+            self.stats["misses"] += len(texts) - len(result)
+        return result
+
+    def put_many(self, model: str, texts: List[str], vectors: np.ndarray) -> None:
+        """새로 계산한 임베딩 저장 후 상한을 넘으면 오래된 항목 삭제"""
+        if not self.enabled or not texts:
+            return
+        now = time.time()
+        rows = [
+            (cache_key(model, text), model, int(vector.shape[0]), np.asarray(vector, dtype=np.float32).tobytes(), now)
+            for text, vector in zip(texts, vectors)
+        ]
+        with self.lock:
+            try:
+                conn = self._connect()
+                try:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO embedding_cache (key, model, dim, vector, last_used) VALUES (?, ?, ?, ?, ?)",
+                        rows
+                    )
+                    self._row_estimate += len(rows)
+                    evicted = 0
+                    if self.max_entries and self._row_estimate > self.max_entries:
+                        evicted = self._evict(conn)
+                    conn.commit()
+                    self.stats["writes"] += len(rows)
+                    self.stats["evictions"] += evicted
+                finally:
+                    conn.close()
+            except sqlite3.Error as e:
+                self.stats["errors"] += 1
+                # 추정치가 틀어졌을 수 있으므로 다음 연결 때 다시 센다
+                self._initialized = False
+                logger.warning(f"임베딩 캐시 저장 실패: {e}")
+
+    def _evict(self, conn: sqlite3.Connection) -> int:
+        """추정치가 상한을 넘었을 때만 실제 행 수를 세고, 상한의 95% 까지 한 번에 삭제 (lock 을 잡은 상태에서 호출)"""
+        count = conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0]
+        self._row_estimate = count
+        if count <= self.max_entries:
+            return 0
+        overflow = count - (self.max_entries - self.max_entries // 20)
+        conn.execute(
+            "DELETE FROM embedding_cache WHERE key IN "
+            "(SELECT key FROM embedding_cache ORDER BY last_used ASC LIMIT ?)",
+            (overflow,)
+        )
+        self._row_estimate = count - overflow
+        logger.debug(f"🧹 임베딩 캐시 {overflow}개 삭제 (상한 {self.max_entries})")
+        return overflow
+
+    def size(self) -> int:
+        if not self.path.exists():
+            return 0
+        with self.lock:
+            conn = self._connect()
+            try:
+                return conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0]
+            finally:
+                conn.close()
+
+    def get_status(self) -> Dict[str, Any]:
+        with self.lock:
+            stats = dict(self.stats)
+        lookups = stats["hits"] + stats["misses"]
+        return {
+            "enabled": self.enabled,
+            "path": str(self.path),
+            "max_entries": self.max_entries,
+            "hit_rate": round(stats["hits"] / lookups, 3) if lookups else None,
+            **stats
+        }
+
+
+class QueryEmbeddingCache:
+    """채팅 검색 질의 임베딩 LRU 캐시 (메모리)
+
+    "배터리 어때요?" 처럼 사용자/상품을 가리지 않고 반복되는 질문은 인코더를 다시 돌리지 않는다.
+    적중 시 절약한 시간은 미스 때 측정한 평균 인코딩 시간으로 추정한다.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self.lock = Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self._encode_seconds = 0.0
+
+    def get_or_embed(self, query: str, embed: Callable[[str], np.ndarray]) -> np.ndarray:
+        """정규화한 질의의 임베딩 반환 (없으면 embed 로 계산 후 저장)"""
+        key = normalize_text(query)
+        if self.max_entries <= 0:
+            return embed(key)
+
+        with self.lock:
+            vector = self._entries.get(key)
+            if vector is not None:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return vector
+
+        started = time.perf_counter()
+        vector = embed(key)
+        elapsed = time.perf_counter() - started
+
+        with self.lock:
+            self.stats["misses"] += 1
+            self._encode_seconds += elapsed
+            self._entries[key] = vector
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+        return vector
+
+    def clear(self) -> None:
+        with self.lock:
+            self._entries.clear()
+
+    def get_status(self) -> Dict[str, Any]:
+        with self.lock:
+            hits, misses = self.stats["hits"], self.stats["misses"]
+            mean_encode = self._encode_seconds / misses if misses else 0.0
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hit_rate": round(hits / (hits + misses), 3) if hits + misses else None,
+                "mean_encode_ms": round(mean_encode * 1000, 2),
+                "saved_seconds": round(hits * mean_encode, 3),
+                **self.stats
+            }
+
+
+# 전역 임베딩 캐시 (CustomEmbeddingFunction 앞단)
+embedding_cache = EmbeddingCache(
+    settings.embedding_cache_path,
+    max_entries=settings.embedding_cache_max_entries,
+    enabled=settings.embedding_cache_enabled
+)
+
+# 전역 질의 임베딩 캐시 (VectorStore.search_similar_reviews 앞단)
+query_embedding_cache = QueryEmbeddingCache(settings.query_embedding_cache_size)
@@ -0,0 +1,77 @@
+"""
+ChromaDB 임베딩 함수 - 인코더(torch/onnx) 앞단에 임베딩 캐시를 둔 커스텀 구현
+
+chromadb 와 인코더 라이브러리를 불러오므로 VectorStore 생성 시점에만 import 한다.
+"""
+from typing import List, Optional
+
+import numpy as np
+from chromadb import EmbeddingFunction
+
+from app.core.config import settings
+from app.infrastructure.ai.embedding_cache import EmbeddingCache, embedding_cache
+from app.infrastructure.ai.encoders import create_encoder
+
+
+class CustomEmbeddingFunction(EmbeddingFunction):
+    """ChromaDB v0.4.16+ 호환 커스텀 임베딩 함수"""
+    
+    def __init__(self, batch_size: Optional[int] = None, cache: Optional[EmbeddingCache] = None):
+        # 인코더 백엔드(torch/onnx)는 설정으로 선택, model_name 은 임베딩 캐시 키에 사용
+        self.model, self.model_name = create_encoder()
+        self.batch_size = batch_size or settings.embedding_batch_size
+        self.cache = cache or embedding_cache
+    
+    def __call__(self, input):
+        """ChromaDB v0.4.16+ 호환 임베딩 함수"""
+        # input을 리스트로 변환
+        if isinstance(input, str):
+            texts = [input]
+        elif isinstance(input, list):
+            texts = input
+        else:
+            texts = [str(input)]
+        
+        # 채팅 검색 질의는 매번 달라 디스크 캐시에 쌓지 않음 (리뷰 색인은 add_reviews 에서 embed 직접 호출)
+        return self.embed(texts, use_cache=False)
+    
+    def embed(self, texts: List[str], use_cache: bool = True) -> np.ndarray:
+        """텍스트 목록을 (N, dim) float32 배열로 임베딩 (리스트 변환 없이 그대로 반환)
+
+        use_cache 이면 임베딩 캐시에 있는 텍스트는 재계산하지 않고 새로 계산한 벡터만 캐시에 추가한다.
+        """
+        # E5 모델을 위한 prefix 추가
+        formatted_texts = []
+        for text in texts:
+            if not (text.strip().startswith("query:") or text.strip().startswith("passage:")):
+                formatted_texts.append("query: " + text.strip())
+            else:
+                formatted_texts.append(text)
+        
+        if not use_cache or not self.cache.enabled or not formatted_texts:
+            return self._encode(formatted_texts)
+        
+        cached = self.cache.get_many(self.model_name, formatted_texts)
+        if len(cached) == len(formatted_texts):
+            return np.stack([cached[i] for i in range(len(formatted_texts))])
+        
+        missing = [i for i in range(len(formatted_texts)) if i not in cached]
+        encoded = self._encode([formatted_texts[i] for i in missing])
+        self.cache.put_many(self.model_name, [formatted_texts[i] for i in missing], encoded)
+        if not cached:
+            return encoded
+        
+        embeddings = np.empty((len(formatted_texts), encoded.shape[1]), dtype=np.float32)
+        embeddings[missing] = encoded
+        for i, vector in cached.items():
+            embeddings[i] = vector
+        return embeddings
+    
+    def _encode(self, formatted_texts: List[str]) -> np.ndarray:
+        # 임베딩 생성
+        return self.model.encode(
+            formatted_texts,
+            batch_size=self.batch_size,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        ).astype(np.float32, copy=False)
@@ -0,0 +1,135 @@
+"""
+임베딩 인코더 백엔드 - PyTorch SentenceTransformer 또는 int8 양자화 ONNX Runtime
+
+ONNX 백엔드는 torch 를 불러오지 않고 onnxruntime + tokenizers 만 사용한다 (CPU 전용 API 서버용).
+모델은 로컬 경로에서만 읽으므로 먼저 한 번 내보내야 한다 (네트워크/torch 필요, 내보낼 때만):
+    uv pip install onnxruntime "optimum[onnxruntime]"
+    uv run python -m app.infrastructure.ai.encoders --output ./data/models/multilingual-e5-small-onnx
+"""
+import argparse
+import os
+from pathlib import Path
+from typing import Any, List, Tuple
+
+import numpy as np
+from loguru import logger
+
+from app.core.config import settings
+
+
+def mean_pool_normalize(token_embeddings: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+    """패딩을 제외한 토큰 평균 후 L2 정규화 (multilingual-e5 의 Pooling(mean) + Normalize 와 동일)"""
+    mask = attention_mask[..., None].astype(np.float32)
+    summed = (token_embeddings * mask).sum(axis=1)
+    pooled = summed / np.clip(mask.sum(axis=1), 1e-9, None)
+    norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+    return (pooled / np.clip(norms, 1e-12, None)).astype(np.float32, copy=False)
+
+
+class OnnxEncoder:
+    """양자화 ONNX 모델 인코더 (SentenceTransformer.encode 와 같은 호출 형태)
+
+    - model_path: 내보낸 모델 디렉터리 (tokenizer.json 과 onnx 파일 포함)
+    - file_name: model_path 기준 ONNX 파일 경로
+    - max_length: 토큰 최대 길이 (초과분은 잘림)
+    - threads: onnxruntime intra-op 스레드 수 (0이면 onnxruntime 기본값)
+    """
+
+    def __init__(self, model_path: str, file_name: str, max_length: int = 512, threads: int = 0):
+        try:
+            import onnxruntime as ort
+            from tokenizers import Tokenizer
+        except ImportError as e:
+            raise RuntimeError(
+                "ONNX 임베딩 백엔드에는 onnxruntime 이 필요합니다: uv pip install onnxruntime"
+            ) from e
+
+        model_dir = Path(model_path)
+        onnx_path = model_dir / file_name
+        if not onnx_path.exists():
+            raise FileNotFoundError(
+                f"ONNX 모델 파일이 없습니다: {onnx_path} "
+                f"(python -m app.infrastructure.ai.encoders --output {model_dir} 로 먼저 내보내세요)"
+            )
+
+        self.tokenizer = Tokenizer.from_file(str(model_dir / "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=max_length)
+        self.tokenizer.enable_padding()
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if threads:
+            options.intra_op_num_threads = threads
+        self.session = ort.InferenceSession(str(onnx_path), options, providers=["CPUExecutionProvider"])
+        self.input_names = {node.name for node in self.session.get_inputs()}
+        logger.info(f"🧠 ONNX 임베딩 모델 로드: {onnx_path}")
+
+    def encode(
+        self,
+        sentences: List[str],
+        batch_size: int = 32,
+        convert_to_numpy: bool = True,
+        show_progress_bar: bool = False
+    ) -> np.ndarray:
+        if isinstance(sentences, str):
+            sentences = [sentences]
+        if not sentences:
+            dim = self.session.get_outputs()[0].shape[-1]
+            return np.zeros((0, dim if isinstance(dim, int) else 0), dtype=np.float32)
+
+        # 길이가 비슷한 문장끼리 배치해 패딩을 줄이고, 결과는 원래 순서로 되돌림
+        order = sorted(range(len(sentences)), key=lambda i: len(sentences[i]))
+        batches = []
+        for start in range(0, len(order), batch_size):
+            indices = order[start:start + batch_size]
+            encodings = self.tokenizer.encode_batch([sentences[i] for i in indices])
+            input_ids = np.array([encoding.ids for encoding in encodings], dtype=np.int64)
+            attention_mask = np.array([encoding.attention_mask for encoding in encodings], dtype=np.int64)
+            feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+            if "token_type_ids" in self.input_names:
+                feeds["token_type_ids"] = np.zeros_like(input_ids)
+            token_embeddings = self.session.run(None, feeds)[0]
+            batches.append(mean_pool_normalize(token_embeddings, attention_mask))
+
+        embeddings = np.concatenate(batches)
+        result = np.empty_like(embeddings)
+        result[order] = embeddings
+        return result
+
+
+def create_encoder() -> Tuple[Any, str]:
+    """설정된 백엔드의 인코더와 임베딩 캐시 키용 모델 식별자 반환
+
+    양자화 모델은 벡터가 조금씩 달라서 캐시 키에 백엔드와 파일명을 포함한다.
+    """
+    if settings.embedding_backend == "onnx":
+        encoder = OnnxEncoder(
+            settings.embedding_onnx_model_path,
+            settings.embedding_onnx_file,
+            max_length=settings.embedding_max_length,
+            threads=settings.embedding_onnx_threads
+        )
+        return encoder, f"{settings.embedding_model_name}:onnx:{settings.embedding_onnx_file}"
+
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(settings.embedding_model_name), settings.embedding_model_name
+
+
+def export_onnx_model(output_dir: str, quantization: str = "avx2") -> Path:
+    """SentenceTransformer 모델을 ONNX 로 내보내고 int8 동적 양자화 (onnx/model_qint8_<quantization>.onnx)"""
+    from sentence_transformers import SentenceTransformer, export_dynamic_quantized_onnx_model
+
+    model = SentenceTransformer(settings.embedding_model_name, backend="onnx")
+    model.save_pretrained(output_dir)
+    export_dynamic_quantized_onnx_model(model, quantization, output_dir)
+    quantized = Path(output_dir) / "onnx" / f"model_qint8_{quantization}.onnx"
+    logger.info(f"✅ 양자화 ONNX 모델 저장: {quantized} ({os.path.getsize(quantized) / 1e6:.0f}MB)")
+    return quantized
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="임베딩 모델 ONNX 내보내기 + int8 양자화")
+    parser.add_argument("--output", default=settings.embedding_onnx_model_path)
+    parser.add_argument("--quantization", default="avx2", choices=["arm64", "avx2", "avx512", "avx512_vnni"])
+    args = parser.parse_args()
+    export_onnx_model(args.output, args.quantization)
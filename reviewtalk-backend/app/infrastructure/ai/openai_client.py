@@ -1,12 +1,13 @@
 """
 AI 응답 생성 클라이언트 - OpenAI, Google Gemini, 로컬 LLM 지원
 """
-from typing import List, Dict, Any, Optional, Callable
-from openai import OpenAI
-import google.generativeai as genai
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Callable
 from app.core.config import settings
 import logging
 
+if TYPE_CHECKING:
+    from openai import OpenAI
+
 logger = logging.getLogger(__name__)
 
 
@@ -99,20 +100,24 @@ class AIClient:
             logger.error(f"[AIClient.__init__] {self.provider} 초기화 실패: {e}", exc_info=True)
             raise
     
-    def _init_openai(self) -> OpenAI:
+    def _init_openai(self) -> "OpenAI":
         """OpenAI 클라이언트 초기화"""
+        # 선택된 제공업체 SDK 만 import (google.generativeai 는 import 만으로 수백 ms)
+        from openai import OpenAI
         client = OpenAI(api_key=settings.openai_api_key)
         logger.info(f"OpenAI API 키 존재 여부: {bool(settings.openai_api_key)}")
         return client
     
     def _init_gemini(self) -> None:
         """Gemini 클라이언트 초기화"""
+        import google.generativeai as genai
         genai.configure(api_key=settings.gemini_api_key)
         logger.info(f"Gemini API 키 존재 여부: {bool(settings.gemini_api_key)}")
         return None  # Gemini는 나중에 모델 생성 시 객체 생성
     
-    def _init_local_llm(self) -> OpenAI:
+    def _init_local_llm(self) -> "OpenAI":
         """로컬 LLM (Ollama 등) OpenAI 호환 클라이언트 초기화"""
+        from openai import OpenAI
         client = OpenAI(
             base_url=settings.local_llm_base_url,
             api_key=settings.local_llm_api_key
@@ -157,6 +162,7 @@ class AIClient:
     def _generate_gemini_response(self, system_prompt: str, user_prompt: str, temperature: float = None, max_tokens: int = None) -> str:
         """Google Gemini API를 사용한 응답 생성"""
         try:
+            import google.generativeai as genai
             model = genai.GenerativeModel(
                 model_name=self.model,
                 generation_config=genai.types.GenerationConfig(
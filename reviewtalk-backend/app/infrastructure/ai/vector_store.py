@@ -1,56 +1,30 @@
 """
 ChromaDB를 사용한 벡터 저장소 관리
 """
+import asyncio
+import time
 import uuid
-from typing import List, Dict, Any, Optional
-import chromadb
-from chromadb.config import Settings as ChromaSettings
-from chromadb.utils import embedding_functions
-from chromadb import EmbeddingFunction
-from sentence_transformers import SentenceTransformer
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import List, Dict, Any, Optional, Set
+import numpy as np
+from fastapi import HTTPException, status
 from app.core.config import settings
+from app.infrastructure.ai.embedding_cache import QueryEmbeddingCache, query_embedding_cache
 from app.models.schemas import ReviewData
 from loguru import logger
 
-from urllib.parse import urlparse, parse_qs
-from typing import Optional
-from app.utils.url_utils import extract_product_id
-
-
-class CustomEmbeddingFunction(EmbeddingFunction):
-    """ChromaDB v0.4.16+ 호환 커스텀 임베딩 함수"""
-    
-    def __init__(self):
-        self.model = SentenceTransformer("intfloat/multilingual-e5-small")
-    
-    def __call__(self, input):
-        """ChromaDB v0.4.16+ 호환 임베딩 함수"""
-        # input을 리스트로 변환
-        if isinstance(input, str):
-            texts = [input]
-        elif isinstance(input, list):
-            texts = input
-        else:
-            texts = [str(input)]
-        
-        # E5 모델을 위한 prefix 추가
-        formatted_texts = []
-        for text in texts:
-            if not (text.strip().startswith("query:") or text.strip().startswith("passage:")):
-                formatted_texts.append("query: " + text.strip())
-            else:
-                formatted_texts.append(text)
-        
-        # 임베딩 생성
-        embeddings = self.model.encode(formatted_texts)
-        return embeddings.tolist()
-
 
 class VectorStore:
     """ChromaDB를 사용한 벡터 저장소"""
     
-    def __init__(self):
+    def __init__(self, query_cache: Optional[QueryEmbeddingCache] = None):
         """벡터 저장소 초기화"""
+        # chromadb / 인코더는 무거워서 앱 import 시점이 아니라 생성 시점에 불러옴
+        import chromadb
+        from chromadb.config import Settings as ChromaSettings
+        from app.infrastructure.ai.embedding_function import CustomEmbeddingFunction
+        
         self.client = chromadb.PersistentClient(
             path=settings.chroma_db_path,
             settings=ChromaSettings(
@@ -67,9 +41,25 @@ class VectorStore:
             embedding_function=self.embedding_function,
             metadata={"hnsw:space": "cosine"}
         )
+        
+        # 다음 청크 임베딩을 현재 청크 upsert 와 겹쳐 실행하는 워커 스레드
+        self._encoder = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embedding")
+        
+        # 채팅 질의 임베딩 LRU 캐시
+        self.query_cache = query_cache or query_embedding_cache
     
-    def add_reviews(self, reviews: List[ReviewData], product_id: str, product_info: Dict[str, Any] = None) -> None:
-        """리뷰 데이터를 벡터 저장소에 추가"""
+    def add_reviews(
+        self,
+        reviews: List[ReviewData],
+        product_id: str,
+        product_info: Dict[str, Any] = None,
+        chunk_size: Optional[int] = None
+    ) -> None:
+        """리뷰 데이터를 벡터 저장소에 추가
+
+        chunk_size 개씩 임베딩해 upsert 하므로 리뷰가 수천 개여도 임베딩 배열은 청크 크기만큼만 메모리에 올라간다.
+        청크 i 를 upsert 하는 동안 워커 스레드에서 청크 i+1 을 임베딩한다.
+        """
         try:
             documents = []
             metadatas = []
@@ -101,15 +91,29 @@ class VectorStore:
                 metadatas.append(metadata)
                 ids.append(f"review_{metadata['review_id']}")
 
-            logger.info(f"metas : [{metadatas}]")
-
+            logger.debug(f"metas : [{metadatas}]")
 
-            # ChromaDB에 추가
-            self.collection.add(
-                documents=documents,
-                metadatas=metadatas,
-                ids=ids
-            )
+            chunk_size = max(1, chunk_size or settings.vector_store_chunk_size)
+            chunks = [(start, min(start + chunk_size, len(documents))) for start in range(0, len(documents), chunk_size)]
+            
+            pending: Optional[Future] = None
+            for index, (start, end) in enumerate(chunks):
+                embeddings = (
+                    pending.result() if pending is not None
+                    else self.embedding_function.embed(documents[start:end])
+                )
+                # 다음 청크 임베딩을 미리 시작
+                pending = (
+                    self._encoder.submit(self.embedding_function.embed, documents[chunks[index + 1][0]:chunks[index + 1][1]])
+                    if index + 1 < len(chunks) else None
+                )
+                # ChromaDB에 추가 (같은 review_<id> 는 덮어써서 재크롤링/배치 재시도 시 중복 오류 방지)
+                self.collection.upsert(
+                    documents=documents[start:end],
+                    metadatas=metadatas[start:end],
+                    ids=ids[start:end],
+                    embeddings=embeddings
+                )
             
             product_name = product_info.get("product_name", "상품") if product_info else "상품"
             logger.info(f"✅ {product_name}의 {len(reviews)}개 리뷰가 벡터 저장소에 추가되었습니다.")
@@ -135,9 +139,10 @@ class VectorStore:
                 where_filter["product_id"] = product_id_int
             
             logger.info(f"✅ product_id : {product_id_int} ")
-            # 벡터 검색 수행
+            # 벡터 검색 수행 (반복 질문은 캐시된 임베딩으로 인코더 생략)
+            query_embedding = self.embed_query(query)
             results = self.collection.query(
-                query_texts=[query],
+                query_embeddings=[query_embedding],
                 n_results=n_results,
                 where=where_filter if where_filter else None
             )
@@ -159,6 +164,34 @@ class VectorStore:
             logger.error(f"❌ 벡터 검색 오류: {e}")
             return []
     
+    def embed_query(self, query: str) -> np.ndarray:
+        """검색 질의 임베딩 (질의 LRU 캐시 경유)"""
+        return self.query_cache.get_or_embed(
+            query,
+            lambda text: self.embedding_function.embed([text], use_cache=False)[0]
+        )
+    
+    def get_review_ids(self, product_id: str) -> Set[str]:
+        """상품에 이미 저장된 리뷰 ID 집합 반환 (증분 크롤링용)"""
+        try:
+            # product_id 메타데이터가 저장 경로에 따라 int/str 로 섞여 있어 둘 다 조회
+            conditions = [{"product_id": str(product_id)}]
+            if str(product_id).isdigit():
+                conditions.append({"product_id": int(product_id)})
+            where = {"$or": conditions} if len(conditions) > 1 else conditions[0]
+
+            results = self.collection.get(where=where, include=["metadatas"])
+            review_ids = {
+                str(metadata["review_id"])
+                for metadata in results.get("metadatas") or []
+                if metadata and metadata.get("review_id")
+            }
+            logger.info(f"🔎 상품 {product_id}의 기존 리뷰 {len(review_ids)}개 확인")
+            return review_ids
+        except Exception as e:
+            logger.error(f"❌ 기존 리뷰 ID 조회 오류: {e}")
+            return set()
+
     def get_collection_stats(self) -> Dict[str, Any]:
         """컬렉션 통계 정보 반환"""
         try:
@@ -182,10 +215,92 @@ class VectorStore:
 
 # 전역 벡터 저장소 인스턴스 - 지연 초기화
 vector_store = None
+_vector_store_lock = Lock()
 
 def get_vector_store():
-    """벡터 저장소 싱글톤 인스턴스 반환"""
+    """벡터 저장소 싱글톤 인스턴스 반환 (워밍업 스레드와 요청이 동시에 불러도 하나만 생성)"""
     global vector_store
     if vector_store is None:
-        vector_store = VectorStore()
-    return vector_store 
\ No newline at end of file
+        with _vector_store_lock:
+            if vector_store is None:
+                vector_store = VectorStore()
+                # 워밍업이 실패한 뒤 요청 경로에서 다시 로드에 성공하면 준비 상태로 복구
+                vector_store_warmup.recover()
+    return vector_store
+
+
+class VectorStoreWarmup:
+    """앱 시작 시 Chroma 클라이언트와 인코더를 백그라운드에서 준비 (첫 채팅 요청이 모델 로드를 기다리지 않도록)
+
+    state: disabled(워밍업 안 함, 첫 사용 시 로드) / pending / warming / ready / failed
+    """
+
+    def __init__(self):
+        self.state = "pending"
+        self.error: Optional[str] = None
+        self.seconds: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self, enabled: bool = True) -> None:
+        if not enabled:
+            self.state = "disabled"
+            return
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        self.state = "warming"
+        started = time.perf_counter()
+        try:
+            store = await asyncio.to_thread(get_vector_store)
+            # 첫 인코딩(토크나이저/그래프 초기화)까지 미리 실행
+            await asyncio.to_thread(store.embedding_function.embed, ["warm up"], False)
+            self.state = "ready"
+            logger.info(f"🔥 벡터 저장소 워밍업 완료: {time.perf_counter() - started:.1f}s")
+        except Exception as e:
+            self.state = "failed"
+            self.error = str(e)
+            logger.error(f"❌ 벡터 저장소 워밍업 실패 (첫 사용 시 다시 로드): {e}")
+        finally:
+            self.seconds = round(time.perf_counter() - started, 3)
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """워밍업 중이면 이벤트 루프를 막지 않고 최대 timeout 초 대기 (시간 안에 끝나지 않으면 False)
+
+        시간이 초과되어도 워밍업 작업은 취소하지 않고 계속 진행한다.
+        """
+        if self._task is None or self._task.done():
+            return True
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def recover(self) -> None:
+        """워밍업 실패 후 다른 경로에서 벡터 저장소를 불러오면 ready 로 전환 (/health/ready 가 계속 503 을 내지 않도록)"""
+        if self.state == "failed":
+            self.state = "ready"
+            self.error = None
+            logger.info("🔥 벡터 저장소 로드 성공 - 워밍업 실패 상태에서 복구")
+
+    @property
+    def ready(self) -> bool:
+        return self.state in ("ready", "disabled")
+
+    def get_status(self) -> Dict[str, Any]:
+        return {"state": self.state, "seconds": self.seconds, "error": self.error}
+
+
+# 전역 벡터 저장소 워밍업 (lifespan 에서 시작)
+vector_store_warmup = VectorStoreWarmup()
+
+
+async def require_vector_store_ready() -> None:
+    """벡터 저장소가 필요한 API 의존성 - 시작 직후면 워밍업 완료까지 대기하고, 시간 초과 시 503"""
+    if not await vector_store_warmup.wait(settings.embedding_warmup_wait_timeout):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="검색 모델을 불러오는 중입니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": "5"}
+        )
@@ -0,0 +1,123 @@
+import json
+import sqlite3
+from typing import Optional, List, Dict, Any
+from pathlib import Path
+from app.core.config import settings
+from app.models.schemas import ReviewData
+
+def extract_sqlite_path(db_url: str) -> str:
+    if db_url.startswith("sqlite:///"):
+        return db_url.replace("sqlite:///", "")
+    raise ValueError("Only sqlite:/// URLs are supported")
+
+DB_PATH = Path(extract_sqlite_path(settings.database_url))
+
+CHECKPOINT_COLUMNS = "product_id, product_url, product_info, max_reviews, loaded_count, batches, created_at, updated_at"
+
+
+class CrawlCheckpointRepository:
+    """crawl_checkpoints 테이블 CRUD Repository (상품별 크롤링 중간 결과와 더보기 위치 저장)
+
+    리뷰는 crawl_checkpoint_reviews 에 (product_id, review_id) 행으로 배치마다 추가만 하고,
+    더보기 위치(loaded_count)와 크롤링 요청 리뷰 수(max_reviews)는 crawl_checkpoints 에 따로 둔다.
+    """
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or DB_PATH
+
+    def get_checkpoint(self, product_id: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """상품 체크포인트 조회 (max_age 초보다 오래된 체크포인트는 리뷰 순서가 바뀌었을 수 있어 무시)"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            cursor = conn.cursor()
+            query = f"SELECT {CHECKPOINT_COLUMNS} FROM crawl_checkpoints WHERE product_id = ?"
+            params: List[Any] = [str(product_id)]
+            if max_age:
+                query += " AND updated_at >= datetime('now', ?)"
+                params.append(f"-{int(max_age)} seconds")
+            cursor.execute(query, params)
+            row = cursor.fetchone()
+            if not row:
+                return None
+            # 저장 순서(rowid) = 크롤링 순서
+            cursor.execute(
+                "SELECT data FROM crawl_checkpoint_reviews WHERE product_id = ? ORDER BY rowid",
+                (str(product_id),)
+            )
+            return self._row_to_dict(row, [data for (data,) in cursor.fetchall()])
+        finally:
+            conn.close()
+
+    def save_batch(
+        self,
+        product_id: str,
+        product_url: str,
+        product_info: Dict[str, Optional[str]],
+        reviews: List[ReviewData],
+        loaded_count: int,
+        max_reviews: int = 0
+    ) -> None:
+        """색인이 끝난 배치의 리뷰를 체크포인트에 추가하고 더보기 위치(로드된 리뷰 항목 수) 갱신
+
+        이전 배치의 리뷰는 다시 읽거나 쓰지 않으므로 배치당 비용은 새 리뷰 수에만 비례한다.
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            cursor = conn.cursor()
+            cursor.executemany(
+                "INSERT OR IGNORE INTO crawl_checkpoint_reviews (product_id, review_id, data) VALUES (?, ?, ?)",
+                [
+                    (str(product_id), review.review_id, json.dumps(review.model_dump(), ensure_ascii=False))
+                    for review in reviews
+                ]
+            )
+            cursor.execute(
+                """
+                INSERT INTO crawl_checkpoints (product_id, product_url, product_info, max_reviews, loaded_count, batches)
+                VALUES (?, ?, ?, ?, ?, 1)
+                ON CONFLICT(product_id) DO UPDATE SET
+                    product_url = excluded.product_url,
+                    product_info = excluded.product_info,
+                    max_reviews = MAX(max_reviews, excluded.max_reviews),
+                    loaded_count = MAX(loaded_count, excluded.loaded_count),
+                    batches = batches + 1,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                (
+                    str(product_id),
+                    product_url,
+                    json.dumps(product_info, ensure_ascii=False),
+                    max_reviews,
+                    loaded_count
+                )
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def delete_checkpoint(self, product_id: str) -> None:
+        """크롤링이 끝까지 완료되면 체크포인트 삭제"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute("DELETE FROM crawl_checkpoint_reviews WHERE product_id = ?", (str(product_id),))
+            conn.execute("DELETE FROM crawl_checkpoints WHERE product_id = ?", (str(product_id),))
+            conn.commit()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _row_to_dict(row, review_rows: List[str]) -> Dict[str, Any]:
+        return {
+            "product_id": row[0],
+            "product_url": row[1],
+            "product_info": json.loads(row[2]) if row[2] else {},
+            "reviews": [ReviewData(**json.loads(data)) for data in review_rows],
+            "max_reviews": row[3] or 0,
+            "loaded_count": row[4] or 0,
+            "batches": row[5] or 0,
+            "created_at": row[6],
+            "updated_at": row[7],
+        }
+
+
+# 전역 Repository 인스턴스
+crawl_checkpoint_repository = CrawlCheckpointRepository()
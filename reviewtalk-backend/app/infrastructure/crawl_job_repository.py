@@ -0,0 +1,150 @@
+import json
+import sqlite3
+import uuid
+from typing import Optional, List, Dict, Any
+from pathlib import Path
+from app.core.config import settings
+
+def extract_sqlite_path(db_url: str) -> str:
+    if db_url.startswith("sqlite:///"):
+        return db_url.replace("sqlite:///", "")
+    raise ValueError("Only sqlite:/// URLs are supported")
+
+DB_PATH = Path(extract_sqlite_path(settings.database_url))
+
+JOB_COLUMNS = (
+    "id, product_url, max_reviews, is_special, status, stage, reviews_found, "
+    "result, error_message, created_at, updated_at, finished_at"
+)
+
+
+class CrawlJobRepository:
+    """crawl_jobs 테이블 CRUD Repository (비동기 크롤링 작업 상태 영속화)"""
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or DB_PATH
+
+    def create_job(self, product_url: str, max_reviews: int, is_special: bool = False) -> str:
+        """queued 상태의 작업 생성 후 작업 ID 반환"""
+        job_id = uuid.uuid4().hex
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute(
+                """
+                INSERT INTO crawl_jobs (id, product_url, max_reviews, is_special, status, stage)
+                VALUES (?, ?, ?, ?, 'queued', 'queued')
+                """,
+                (job_id, product_url, max_reviews, is_special)
+            )
+            conn.commit()
+            return job_id
+        finally:
+            conn.close()
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        conn = sqlite3.connect(self.db_path)
+        try:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT {JOB_COLUMNS} FROM crawl_jobs WHERE id = ?", (job_id,))
+            row = cursor.fetchone()
+            return self._row_to_dict(row) if row else None
+        finally:
+            conn.close()
+
+    def update_progress(self, job_id: str, stage: str, reviews_found: Optional[int] = None) -> None:
+        """진행 단계와 지금까지 찾은 리뷰 수 갱신"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute(
+                """
+                UPDATE crawl_jobs
+                SET stage = ?, reviews_found = COALESCE(?, reviews_found), updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+                """,
+                (stage, reviews_found, job_id)
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def mark_running(self, job_id: str) -> None:
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute(
+                "UPDATE crawl_jobs SET status = 'running', stage = 'started', updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                (job_id,)
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def mark_finished(
+        self,
+        job_id: str,
+        success: bool,
+        result: Optional[Dict[str, Any]] = None,
+        error_message: Optional[str] = None
+    ) -> None:
+        """작업 종료 기록 (최종 CrawlResponse 는 JSON 으로 저장)"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute(
+                """
+                UPDATE crawl_jobs
+                SET status = ?, stage = 'done',
+                    reviews_found = COALESCE(?, reviews_found),
+                    result = ?, error_message = ?,
+                    updated_at = CURRENT_TIMESTAMP, finished_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+                """,
+                (
+                    "succeeded" if success else "failed",
+                    result.get("reviews_found") if result else None,
+                    json.dumps(result, ensure_ascii=False) if result is not None else None,
+                    error_message,
+                    job_id
+                )
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def requeue_unfinished_jobs(self) -> List[Dict[str, Any]]:
+        """재시작 시 queued/running 작업을 queued 로 되돌리고 생성 순서대로 반환"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                UPDATE crawl_jobs
+                SET status = 'queued', stage = 'queued', updated_at = CURRENT_TIMESTAMP
+                WHERE status = 'running'
+                """
+            )
+            conn.commit()
+            cursor.execute(
+                f"SELECT {JOB_COLUMNS} FROM crawl_jobs WHERE status = 'queued' ORDER BY created_at ASC"
+            )
+            return [self._row_to_dict(row) for row in cursor.fetchall()]
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _row_to_dict(row) -> Dict[str, Any]:
+        return {
+            "id": row[0],
+            "product_url": row[1],
+            "max_reviews": row[2],
+            "is_special": bool(row[3]),
+            "status": row[4],
+            "stage": row[5],
+            "reviews_found": row[6] or 0,
+            "result": json.loads(row[7]) if row[7] else None,
+            "error_message": row[8],
+            "created_at": row[9],
+            "updated_at": row[10],
+            "finished_at": row[11],
+        }
+
+
+# 전역 Repository 인스턴스
+crawl_job_repository = CrawlJobRepository()
@@ -0,0 +1,334 @@
+"""
+Playwright 브라우저 풀 - 앱 수명주기 동안 Chromium 을 재사용하는 공유 풀
+"""
+import asyncio
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Any, List, Optional
+
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
+from loguru import logger
+
+from app.core.config import settings
+from app.infrastructure.crawler.session_state import (
+    SESSION_COLD,
+    SESSION_STORAGE,
+    SESSION_WARM,
+    SessionStateStore,
+    session_state_store,
+)
+
+
+MOBILE_USER_AGENT = 'Mozilla/5.0 (iPhone; CPU iPhone OS 14_7_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.2 Mobile/15E148 Safari/604.1'
+
+BROWSER_LAUNCH_ARGS = [
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+    '--disable-gpu',
+    '--disable-web-security',
+    '--disable-features=VizDisplayCompositor',
+    f'--user-agent={MOBILE_USER_AGENT}'
+]
+
+CONTEXT_OPTIONS = {
+    'viewport': {'width': 375, 'height': 667},  # 모바일 뷰포트
+    'user_agent': MOBILE_USER_AGENT,
+    'extra_http_headers': {
+        'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
+    }
+}
+
+
+class _BrowserSlot:
+    """풀이 관리하는 브라우저 1개와 그 사용 현황"""
+
+    def __init__(self, browser: Browser, generation: int):
+        self.browser = browser
+        self.generation = generation
+        self.pages_served = 0
+        self.active_leases = 0
+        self.idle_contexts: List[BrowserContext] = []
+        self.retired = False
+        self.crashed = False
+        browser.on("disconnected", lambda _: self._mark_crashed())
+
+    def _mark_crashed(self):
+        if not self.retired:
+            self.crashed = True
+
+
+class BrowserPool:
+    """앱 범위 Chromium 풀 (미리 준비된 컨텍스트/페이지를 임대)
+
+    새 컨텍스트는 session_state 에 저장된 쿠키/localStorage 로 시작하고,
+    반납되는 컨텍스트의 상태를 주기적으로 다시 저장해 첫 방문 비용(동의/리다이렉트 등)을 줄인다.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 3,
+        recycle_after_pages: int = 50,
+        prewarm_contexts: int = 1,
+        session_state: Optional[SessionStateStore] = None
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.recycle_after_pages = max(1, recycle_after_pages)
+        self.prewarm_contexts = max(0, min(prewarm_contexts, self.max_concurrency))
+        self.session_state = session_state or session_state_store
+        self._warm_contexts: "weakref.WeakSet[BrowserContext]" = weakref.WeakSet()
+        self._seeded_contexts: "weakref.WeakSet[BrowserContext]" = weakref.WeakSet()
+        self._playwright: Optional[Playwright] = None
+        self._slot: Optional[_BrowserSlot] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._generation = 0
+        self.stats = {
+            "leases": 0,
+            "standalone_leases": 0,
+            "browser_launches": 0,
+            "recycles": 0,
+            "crash_restarts": 0,
+            f"{SESSION_WARM}_leases": 0,
+            f"{SESSION_STORAGE}_leases": 0,
+            f"{SESSION_COLD}_leases": 0
+        }
+
+    @property
+    def is_running(self) -> bool:
+        return self._playwright is not None
+
+    async def start(self):
+        """풀 시작 - Playwright 구동 및 브라우저 예열"""
+        if self.is_running:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._lock = asyncio.Lock()
+        self._playwright = await async_playwright().start()
+        self._slot = await self._launch_slot()
+
+        for _ in range(self.prewarm_contexts):
+            self._slot.idle_contexts.append(await self._new_context(self._slot.browser))
+
+        logger.info(
+            f"✅ 브라우저 풀 시작 (동시 실행 {self.max_concurrency}, "
+            f"{self.recycle_after_pages}페이지마다 재시작, 예열 컨텍스트 {self.prewarm_contexts}개)"
+        )
+
+    async def stop(self):
+        """풀 종료 - 모든 브라우저와 Playwright 정리"""
+        if not self.is_running:
+            return
+
+        try:
+            if self._slot:
+                self._slot.retired = True
+                await self._close_slot(self._slot)
+            await self._playwright.stop()
+        except Exception as e:
+            logger.error(f"브라우저 풀 종료 오류: {e}")
+        finally:
+            self._slot = None
+            self._playwright = None
+            self._loop = None
+            logger.info("🛑 브라우저 풀 종료")
+
+    def get_status(self) -> Dict[str, Any]:
+        """풀 상태 조회"""
+        slot = self._slot
+        return {
+            "is_running": self.is_running,
+            "max_concurrency": self.max_concurrency,
+            "generation": self._generation,
+            "pages_served": slot.pages_served if slot else 0,
+            "active_leases": slot.active_leases if slot else 0,
+            "idle_contexts": len(slot.idle_contexts) if slot else 0,
+            **self.stats,
+            "session_state": self.session_state.get_status()
+        }
+
+    def session_kind(self, context: BrowserContext) -> str:
+        """임대한 컨텍스트의 세션 종류 (warm: 이전 임대에서 재사용, storage: 저장된 세션 상태로 생성, cold: 빈 상태)"""
+        if context in self._warm_contexts:
+            return SESSION_WARM
+        if context in self._seeded_contexts:
+            return SESSION_STORAGE
+        return SESSION_COLD
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[Page]:
+        """크롤링용 페이지 임대
+
+        풀이 시작되지 않았거나 다른 이벤트 루프(스케줄러 스레드 등)에서 호출되면
+        Playwright 객체를 공유할 수 없으므로 1회용 브라우저를 띄워 사용한다.
+        """
+        if not self._owns_current_loop():
+            if self.is_running:
+                logger.warning("⚠️ 브라우저 풀과 다른 이벤트 루프에서 임대 요청 - 1회용 브라우저 사용 (앱 루프에서 실행하세요)")
+            self.stats["standalone_leases"] += 1
+            async with self._standalone_page() as page:
+                yield page
+            return
+
+        async with self._semaphore:
+            slot, context = await self._acquire_context()
+            page = None
+            failed = False
+            self.stats[f"{self.session_kind(context)}_leases"] += 1
+            try:
+                page = await context.new_page()
+                yield page
+            except Exception:
+                failed = True
+                raise
+            finally:
+                await self._release(slot, context, page, failed)
+
+    def _owns_current_loop(self) -> bool:
+        if not self.is_running:
+            return False
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    async def _launch_browser(self, playwright: Playwright) -> Browser:
+        self.stats["browser_launches"] += 1
+        return await playwright.chromium.launch(headless=True, args=BROWSER_LAUNCH_ARGS)
+
+    async def _launch_slot(self) -> _BrowserSlot:
+        self._generation += 1
+        browser = await self._launch_browser(self._playwright)
+        return _BrowserSlot(browser, self._generation)
+
+    async def _acquire_context(self):
+        """현재 브라우저에서 컨텍스트를 꺼내고, 필요하면 브라우저를 교체"""
+        async with self._lock:
+            slot = self._slot
+            if slot.crashed or not slot.browser.is_connected():
+                logger.warning(f"⚠️ 브라우저(세대 {slot.generation}) 비정상 종료 감지 - 재시작")
+                self.stats["crash_restarts"] += 1
+                await self._retire(slot)
+                slot = self._slot = await self._launch_slot()
+            elif slot.pages_served >= self.recycle_after_pages:
+                logger.info(f"♻️ 브라우저(세대 {slot.generation}) {slot.pages_served}페이지 사용 - 교체")
+                self.stats["recycles"] += 1
+                await self._retire(slot)
+                slot = self._slot = await self._launch_slot()
+
+            slot.pages_served += 1
+            slot.active_leases += 1
+            self.stats["leases"] += 1
+            context = slot.idle_contexts.pop() if slot.idle_contexts else None
+
+        if context is None:
+            try:
+                context = await self._new_context(slot.browser)
+            except Exception:
+                slot.active_leases -= 1
+                slot.crashed = True
+                raise
+        return slot, context
+
+    async def _release(self, slot: _BrowserSlot, context: BrowserContext, page: Optional[Page], failed: bool):
+        """임대 반납 - 페이지를 닫고 컨텍스트는 가능하면 재사용"""
+        slot.active_leases -= 1
+        try:
+            if page and not page.is_closed():
+                await page.close()
+            if not failed and self.session_state.needs_refresh():
+                await self.session_state.save(context)
+            reusable = (
+                not failed
+                and not slot.retired
+                and not slot.crashed
+                and len(slot.idle_contexts) < self.max_concurrency
+            )
+            if reusable:
+                self._warm_contexts.add(context)
+                slot.idle_contexts.append(context)
+            else:
+                await context.close()
+        except Exception as e:
+            logger.debug(f"컨텍스트 반납 오류: {e}")
+            if failed:
+                slot.crashed = slot.crashed or not slot.browser.is_connected()
+
+        if slot.retired and slot.active_leases == 0:
+            await self._close_slot(slot)
+
+    async def _new_context(self, browser: Browser) -> BrowserContext:
+        """새 컨텍스트 생성 (저장된 세션 상태가 있으면 쿠키/localStorage 를 불러옴)"""
+        storage_state = self.session_state.load_path()
+        if storage_state:
+            try:
+                context = await browser.new_context(**CONTEXT_OPTIONS, storage_state=storage_state)
+                self._seeded_contexts.add(context)
+                return context
+            except Exception as e:
+                logger.debug(f"세션 상태 불러오기 실패 - 빈 컨텍스트로 시작: {e}")
+        return await browser.new_context(**CONTEXT_OPTIONS)
+
+    async def _retire(self, slot: _BrowserSlot):
+        slot.retired = True
+        if slot.active_leases == 0:
+            await self._close_slot(slot)
+
+    async def _close_slot(self, slot: _BrowserSlot):
+        try:
+            for context in slot.idle_contexts:
+                await context.close()
+            slot.idle_contexts.clear()
+            if slot.browser.is_connected():
+                await slot.browser.close()
+        except Exception as e:
+            logger.debug(f"브라우저(세대 {slot.generation}) 종료 오류: {e}")
+
+    @asynccontextmanager
+    async def _standalone_page(self) -> AsyncIterator[Page]:
+        """풀 밖에서 쓰는 1회용 브라우저 페이지"""
+        playwright = await async_playwright().start()
+        browser = None
+        try:
+            browser = await self._launch_browser(playwright)
+            context = await self._new_context(browser)
+            self.stats[f"{self.session_kind(context)}_leases"] += 1
+            page = await context.new_page()
+            yield page
+            if self.session_state.needs_refresh():
+                await self.session_state.save(context)
+        finally:
+            try:
+                if browser:
+                    await browser.close()
+                await playwright.stop()
+            except Exception as e:
+                logger.error(f"브라우저 종료 오류: {e}")
+
+
+# 전역 브라우저 풀 인스턴스
+browser_pool = BrowserPool(
+    max_concurrency=settings.browser_pool_max_concurrency,
+    recycle_after_pages=settings.browser_pool_recycle_pages,
+    prewarm_contexts=settings.browser_pool_prewarm_contexts
+)
+
+
+async def start_browser_pool():
+    """애플리케이션 시작시 브라우저 풀 구동"""
+    if not settings.browser_pool_enabled:
+        logger.info("ℹ️ 브라우저 풀 비활성화 - 크롤링마다 브라우저를 새로 띄웁니다")
+        return
+    try:
+        await browser_pool.start()
+    except Exception as e:
+        logger.error(f"❌ 브라우저 풀 시작 실패 (1회용 브라우저로 대체): {e}")
+        await browser_pool.stop()
+
+
+async def stop_browser_pool():
+    """애플리케이션 종료시 브라우저 풀 정리"""
+    await browser_pool.stop()
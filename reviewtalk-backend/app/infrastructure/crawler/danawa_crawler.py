@@ -1,48 +1,159 @@
 import asyncio
 import re
 import time
-from typing import List, Optional, Dict, Any
+from dataclasses import dataclass, field
+from typing import AbstractSet, Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urlparse, parse_qs
 
-from playwright.async_api import async_playwright, Page, Browser
+from playwright.async_api import Page
 from loguru import logger
 
-from app.models.schemas import ReviewData
+from app.infrastructure.crawler.browser_pool import BrowserPool, browser_pool
+from app.infrastructure.crawler.metrics import CrawlMetrics
+from app.infrastructure.crawler.pagination import PaginationPlanner, parse_review_count
+from app.infrastructure.crawler.replay import finish_replay_mode, install_replay_mode
+from app.infrastructure.crawler.resource_policy import get_resource_policy, install_resource_policy
+from app.infrastructure.crawler.waits import WaitEngine
+from app.core.config import settings
+from app.utils.rate_limiter import host_rate_limiter
+from app.models.schemas import ProductCrawlResult, ReviewData
+
+
+PRODUCT_NAME_SELECTOR = "#productBlog-productName"
+REVIEW_BUTTON_SELECTOR = "#productBlog-starsButton > div.text__review > span.text__number"
+REVIEW_ITEM_SELECTOR = '[id*="productBlog-opinion-mall-list-listItem-"]'
+REVIEW_ITEM_ID_PREFIX = "productBlog-opinion-mall-list-listItem-"
+MORE_BUTTON_SELECTOR = "#productBlog-opinion-mall-button-viewMore > span"
+
+# 리뷰 목록(start 번째 항목부터)을 브라우저 안에서 한 번에 읽어 JSON 배열로 반환
+# 예: #productBlog-opinion-mall-list-listItem-9123372001990022352 > div
+#     #productBlog-opinion-mall-list-content-9123372001990022352 (리뷰 본문)
+#     #productBlog-opinion-mall-list-listItem-... > div > div > div:nth-child(1) > div > span > span (별점)
+EXTRACT_REVIEWS_SCRIPT = """
+([prefix, start]) => {
+    const datePattern = /\\d{2,4}[.\\-/]\\d{1,2}[.\\-/]\\d{1,2}/;
+    const rows = [];
+    const items = Array.from(document.querySelectorAll(`[id*="${prefix}"]`)).slice(start || 0);
+    for (const item of items) {
+        if (!item.id.startsWith(prefix) || !item.querySelector(':scope > div')) continue;
+        const reviewId = item.id.slice(prefix.length);
+        const textEl = document.getElementById(`productBlog-opinion-mall-list-content-${reviewId}`);
+        const ratingEl = item.querySelector(':scope > div > div > div:nth-child(1) > div > span > span');
+        const dateMatch = (item.innerText || '').match(datePattern);
+        rows.push({
+            id: reviewId,
+            text: textEl ? textEl.innerText : '',
+            rating: ratingEl ? ratingEl.innerText : '',
+            date: dateMatch ? dateMatch[0] : null
+        });
+    }
+    return rows;
+}
+"""
+
+# start 번째 이후에 로드된 리뷰 항목의 리뷰 ID 목록 (증분 크롤링용)
+LOADED_REVIEW_IDS_SCRIPT = """
+([selector, prefix, start]) => Array.from(document.querySelectorAll(selector))
+    .slice(start)
+    .map(item => item.id.startsWith(prefix) ? item.id.slice(prefix.length) : item.id)
+"""
+
+# 로드된 리뷰 항목 수를 MutationObserver 로 증분 집계 (더보기 후 전체 목록을 다시 훑지 않음)
+# 같은 문서에서는 한 번만 설치되고, 이후 호출은 현재 값만 반환한다
+REVIEW_COUNTER_SCRIPT = """
+([selector, prefix]) => {
+    if (window.__reviewTalkCounter) return window.__reviewTalkCounter.count;
+    const counter = { count: document.querySelectorAll(selector).length };
+    const countIn = (node) => node.nodeType !== 1 ? 0
+        : ((node.id || '').includes(prefix) ? 1 : 0) + node.querySelectorAll(selector).length;
+    new MutationObserver((mutations) => {
+        for (const mutation of mutations) {
+            mutation.addedNodes.forEach((node) => { counter.count += countIn(node); });
+            mutation.removedNodes.forEach((node) => { counter.count -= countIn(node); });
+        }
+    }).observe(document.body, { childList: true, subtree: true });
+    window.__reviewTalkCounter = counter;
+    return counter.count;
+}
+"""
+REVIEW_COUNTER_EXPRESSION = "(window.__reviewTalkCounter ? window.__reviewTalkCounter.count : 0)"
+
+# 리뷰 버튼에 표시된 전체 리뷰 수 텍스트
+TOTAL_REVIEW_COUNT_SCRIPT = """
+(selector) => {
+    const element = document.querySelector(selector);
+    return element ? element.textContent : null;
+}
+"""
+
+# 진행 상황 콜백: (단계 이름, 지금까지 로드/수집된 리뷰 수)
+ProgressCallback = Callable[[str, int], None]
+
+
+def extract_product_code(url: str) -> Optional[str]:
+    """다나와 URL에서 상품 코드를 추출"""
+    try:
+        parsed = urlparse(str(url))
+        if 'danawa.com' not in parsed.netloc:
+            return None
+        
+        # URL에서 code 파라미터 추출 (모바일)
+        query_params = parse_qs(parsed.query)
+        if 'code' in query_params:
+            return query_params['code'][0]
+        
+        # URL에서 pcode 파라미터 추출 (데스크톱)
+        if 'pcode' in query_params:
+            return query_params['pcode'][0]
+        
+        # URL 경로에서 상품 코드 추출 시도
+        path_match = re.search(r'/(\d+)/?$', parsed.path)
+        if path_match:
+            return path_match.group(1)
+            
+        return None
+    except Exception:
+        return None
+
+
+@dataclass
+class ReviewBatch:
+    """iter_review_batches 가 반환하는 리뷰 배치 (더보기 1회 분량)"""
+
+    index: int
+    product_id: str
+    product_info: Dict[str, Optional[str]]
+    reviews: List[ReviewData] = field(default_factory=list)  # 증분 모드에서는 새 리뷰만
+    skipped_reviews: int = 0
+    loaded_count: int = 0  # 페이지에 로드된 전체 리뷰 항목 수
 
 
 class DanawaCrawler:
     """모바일 다나와 크롤러 - Playwright 전용"""
     
-    def __init__(self):
-        self.browser: Optional[Browser] = None
+    def __init__(
+        self,
+        pool: Optional[BrowserPool] = None,
+        resource_mode: str = "review",
+        on_progress: Optional[ProgressCallback] = None
+    ):
+        self.pool = pool or browser_pool
+        self.on_progress = on_progress
+        self.resource_policy = get_resource_policy(resource_mode)
         self.page: Optional[Page] = None
-        self.playwright = None
+        self._lease = None
+        self.metrics = CrawlMetrics()
+        self.waits: Optional[WaitEngine] = None
     
     async def __aenter__(self):
-        """비동기 컨텍스트 매니저 진입"""
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(
-            headless=True,
-            args=[
-                '--disable-dev-shm-usage', 
-                '--no-sandbox', 
-                '--disable-gpu',
-                '--disable-web-security',
-                '--disable-features=VizDisplayCompositor',
-                '--user-agent=Mozilla/5.0 (iPhone; CPU iPhone OS 14_7_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.2 Mobile/15E148 Safari/604.1'
-            ]
-        )
-        
-        context = await self.browser.new_context(
-            viewport={'width': 375, 'height': 667},  # 모바일 뷰포트
-            user_agent='Mozilla/5.0 (iPhone; CPU iPhone OS 14_7_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.2 Mobile/15E148 Safari/604.1',
-            extra_http_headers={
-                'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
-            }
-        )
-        
-        self.page = await context.new_page()
+        """비동기 컨텍스트 매니저 진입 - 브라우저 풀에서 페이지 임대"""
+        self._lease = self.pool.lease()
+        self.page = await self._lease.__aenter__()
+        self.waits = WaitEngine(self.page, self.metrics)
+        self.metrics.session = self.pool.session_kind(self.page.context)
+        # 재생 훅을 먼저 설치해야 차단 정책이 먼저 적용되고 허용된 요청만 재생/기록된다
+        await install_replay_mode(self.page, self.metrics)
+        await install_resource_policy(self.page, self.resource_policy, self.metrics)
         
         # 타임아웃 설정
         self.page.set_default_timeout(60000)  # 60초
@@ -50,66 +161,172 @@ class DanawaCrawler:
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """비동기 컨텍스트 매니저 종료"""
+        """비동기 컨텍스트 매니저 종료 - 임대한 페이지 반납"""
         try:
-            if self.page:
-                await self.page.close()
-            if self.browser:
-                await self.browser.close()
-            if self.playwright:
-                await self.playwright.stop()
+            if self._lease:
+                await finish_replay_mode()
+                await self._lease.__aexit__(exc_type, exc_val, exc_tb)
         except Exception as e:
             logger.error(f"브라우저 종료 오류: {e}")
+        finally:
+            self.page = None
+            self.waits = None
+            self._lease = None
     
     def extract_product_code(self, url: str) -> Optional[str]:
         """다나와 URL에서 상품 코드를 추출"""
-        try:
-            parsed = urlparse(str(url))
-            if 'danawa.com' not in parsed.netloc:
-                return None
+        return extract_product_code(url)
+    
+    async def crawl_product(
+        self,
+        product_url: str,
+        max_reviews: int = 100,
+        known_review_ids: Optional[AbstractSet[str]] = None
+    ) -> ProductCrawlResult:
+        """상품 페이지를 한 번만 로드해 상품 정보와 리뷰를 함께 수집
+
+        known_review_ids 가 주어지면 증분 모드로 동작한다. 더보기로 새로 로드된 리뷰가
+        모두 이미 저장된 리뷰이면 클릭을 멈추고, 저장되지 않은 리뷰만 결과에 담는다.
+        """
+        product_code = self.extract_product_code(product_url)
+        product_info: Dict[str, Optional[str]] = {}
+        reviews: List[ReviewData] = []
+
+        # 1. 상품 페이지 로드 (1회)
+        await self._open_product_page(product_url)
+        
+        self._report_progress("page_loaded")
+        
+        # 2. 스크롤하여 콘텐츠 로드
+        with self.metrics.stage("scroll"):
+            await self._scroll_to_load_content(max_reviews)
+        
+        # 3. 같은 DOM 에서 상품 정보 추출
+        logger.info("🔍 상품 정보 추출 중...")
+        with self.metrics.stage("product_info"):
+            product_info = await self._extract_product_info_from_page()
+        self._report_progress("product_info")
+        
+        # 4. 같은 페이지에서 리뷰 수집
+        logger.info("📝 리뷰 크롤링 시작...")
+        reviews = await self._collect_loaded_reviews(max_reviews, known_review_ids)
+        reviews, skipped_reviews = split_known_reviews(reviews, known_review_ids)
+        self._report_progress("reviews_extracted", len(reviews))
+        
+        if known_review_ids is not None:
+            logger.info(f"🎉 새 리뷰 {len(reviews)}개 수집, 기존 리뷰 {skipped_reviews}개 건너뜀")
+        else:
+            logger.info(f"🎉 총 {len(reviews)}개의 리뷰를 수집했습니다!")
+        logger.info(f"⏱️ 크롤링 단계별 시간: {self.metrics.summary()}")
+
+        return ProductCrawlResult(
+            success=True,
+            product_id=product_code or "unknown",
+            **build_product_info(product_code, product_info),
+            reviews=reviews,
+            skipped_reviews=skipped_reviews,
+            metrics=self.metrics.to_dict()
+        )
+    
+    async def iter_review_batches(
+        self,
+        product_url: str,
+        max_reviews: int = 100,
+        known_review_ids: Optional[AbstractSet[str]] = None,
+        resume_from: int = 0
+    ) -> AsyncIterator["ReviewBatch"]:
+        """리뷰를 더보기 단위 배치로 수집하며 바로바로 반환하는 async generator
+
+        첫 배치는 리뷰 탭을 연 직후 보이는 리뷰, 이후 배치는 더보기 클릭마다 새로 로드된 리뷰다.
+        소비자가 배치를 처리(임베딩 등)하는 동안 다음 더보기 클릭을 진행할 수 있다.
+        known_review_ids 가 주어지면 기존 리뷰는 제외하고, 새 리뷰가 없는 배치를 만나면 중단한다.
+        resume_from 이 주어지면 체크포인트 위치(로드된 리뷰 항목 수)까지 추출 없이 더보기만 클릭한 뒤
+        그 이후 리뷰부터 최대 max_reviews 개를 배치로 반환한다.
+        """
+        product_code = self.extract_product_code(product_url)
+        
+        await self._open_product_page(product_url)
+        self._report_progress("page_loaded")
+        
+        with self.metrics.stage("scroll"):
+            await self._scroll_to_load_content(max_reviews)
+        
+        with self.metrics.stage("product_info"):
+            product_info = build_product_info(product_code, await self._extract_product_info_from_page())
+        self._report_progress("product_info")
+        
+        with self.metrics.stage("review_tab"):
+            review_found = await self._navigate_to_mobile_reviews()
+        if not review_found:
+            return
+        
+        collected = 0
+        extracted_until = 0
+        planner = await self._plan_pagination(resume_from + max_reviews)
+        if resume_from > 0:
+            with self.metrics.stage("resume"):
+                await self._fast_forward_to(resume_from, planner)
+            if planner.loaded <= resume_from:
+                logger.info(f"🔚 체크포인트 위치({resume_from}) 이후 로드할 리뷰 없음")
+                self.metrics.pagination = planner.to_dict()
+                return
+            extracted_until = resume_from
+        index = 0
+        while True:
+            # 첫 배치 이후에는 더보기 클릭으로 다음 리뷰 로드 (재개 시 첫 배치는 체크포인트 이후 리뷰)
+            if index > 0:
+                # 짧은 리뷰는 걸러지므로 아직 모자란 리뷰 수만큼 목표를 다시 잡는다
+                planner.target = planner.loaded + (max_reviews - collected)
+                if not planner.should_click():
+                    break
+                with self.metrics.stage("load_more"):
+                    planner.record_click(await self._click_more_once(planner.loaded))
+                if planner.loaded <= extracted_until:
+                    break
+            loaded_count = planner.loaded
             
-            # URL에서 code 파라미터 추출 (모바일)
-            query_params = parse_qs(parsed.query)
-            if 'code' in query_params:
-                return query_params['code'][0]
+            with self.metrics.stage("extract_reviews"):
+                rows = await self.page.evaluate(EXTRACT_REVIEWS_SCRIPT, [REVIEW_ITEM_ID_PREFIX, extracted_until])
+            extracted_until = loaded_count
             
-            # URL에서 pcode 파라미터 추출 (데스크톱)
-            if 'pcode' in query_params:
-                return query_params['pcode'][0]
+            reviews = map_review_rows(rows, max_reviews - collected)
+            collected += len(reviews)
+            new_reviews, skipped = split_known_reviews(reviews, known_review_ids)
+            self._report_progress("reviews_extracted", collected)
             
-            # URL 경로에서 상품 코드 추출 시도
-            path_match = re.search(r'/(\d+)/?$', parsed.path)
-            if path_match:
-                return path_match.group(1)
-                
-            return None
-        except Exception:
-            return None
+            yield ReviewBatch(
+                index=index,
+                product_id=product_code or "unknown",
+                product_info=product_info,
+                reviews=new_reviews,
+                skipped_reviews=skipped,
+                loaded_count=loaded_count
+            )
+            
+            if collected >= max_reviews:
+                logger.info(f"🎯 목표 개수({max_reviews})에 도달! 배치 수집 중단")
+                break
+            if known_review_ids and reviews and not new_reviews:
+                logger.info("🔚 새로 로드된 리뷰가 모두 기존 리뷰 - 배치 수집 중단")
+                break
+            index += 1
+        
+        self.metrics.pagination = planner.to_dict()
+        logger.info(f"⏱️ 배치 크롤링 단계별 시간: {self.metrics.summary()}")
     
     async def crawl_reviews(self, product_url: str, max_reviews: int = 100) -> List[ReviewData]:
         """모바일 다나와 상품 리뷰 크롤링"""
         reviews = []
 
         try:
-            logger.info(f"🚀 모바일 상품 페이지 접근: {product_url}")
-            
             # 모바일 상품 페이지로 이동
-            await self.page.goto(str(product_url), wait_until='domcontentloaded', timeout=60000)
-            await asyncio.sleep(3)
-            logger.info("✅ 모바일 상품 페이지 로드 완료")
+            await self._open_product_page(product_url)
             
             # 페이지 스크롤하여 콘텐츠 로드
-            await self._scroll_to_load_content()
-            
-            # 리뷰 섹션으로 이동
-            review_found = await self._navigate_to_mobile_reviews()
+            with self.metrics.stage("scroll"):
+                await self._scroll_to_load_content(max_reviews)
             
-            if review_found:
-                # 사용자가 설정한 개수만큼 리뷰 로드를 위해 더보기 버튼 반복 클릭
-                await self._click_more_reviews_if_needed(max_reviews)
-                
-                # 리뷰 데이터 추출
-                reviews = await self._extract_mobile_reviews(max_reviews)
+            reviews = await self._collect_loaded_reviews(max_reviews)
             
             logger.info(f"🎉 총 {len(reviews)}개의 리뷰를 수집했습니다!")
 
@@ -136,14 +353,30 @@ class DanawaCrawler:
                 return product_info
             
             # 상품 페이지로 이동 (아직 안했다면)
-            current_url = self.page.url
-            if current_url != product_url:
-                await self.page.goto(str(product_url), wait_until='domcontentloaded', timeout=60000)
-                await asyncio.sleep(3)
+            if self.page.url != str(product_url):
+                await self._open_product_page(product_url)
             
             # 페이지 스크롤하여 모든 콘텐츠 로드
-            await self._scroll_to_load_content()
+            with self.metrics.stage("scroll"):
+                await self._scroll_to_load_content()
+            
+            product_info = await self._extract_product_info_from_page()
             
+        except Exception as e:
+            logger.error(f"❌ 상품 정보 추출 오류: {e}")
+        
+        return product_info
+    
+    async def _extract_product_info_from_page(self) -> Dict[str, Optional[str]]:
+        """현재 로드된 상품 페이지 DOM 에서 상품 정보 추출"""
+        product_info = {
+            'product_name': None,
+            'image_url': None,
+            'price': None,
+            'brand': None
+        }
+        
+        try:
             # 상품명 추출 - 사용자 제공 정확한 선택자
             product_name_selectors = [
                 "#productBlog-productName",  # 사용자 제공 정확한 선택자
@@ -274,14 +507,75 @@ class DanawaCrawler:
         
         return product_info
     
-    async def _scroll_to_load_content(self):
-        """스크롤하여 더 많은 콘텐츠 로드"""
+    async def _open_product_page(self, product_url: str):
+        """상품 페이지로 이동 (페이지 이동 횟수와 시간 기록)"""
+        logger.info(f"🚀 모바일 상품 페이지 접근: {product_url}")
+        with self.metrics.stage("navigate"):
+            self.metrics.navigations += 1
+            await self._throttle(str(product_url))
+            started = time.perf_counter()
+            await self.page.goto(str(product_url), wait_until='domcontentloaded', timeout=60000)
+            await self.waits.for_selector(
+                f"{PRODUCT_NAME_SELECTOR}, {REVIEW_BUTTON_SELECTOR}",
+                name="page_ready",
+                timeout=settings.crawler_page_ready_timeout
+            )
+            # 속도 제한 대기를 뺀 페이지 로드 시간만 세션 종류별로 기록 (warm/cold 비교)
+            self.pool.session_state.record_navigation(self.metrics.session, time.perf_counter() - started)
+        logger.info(f"✅ 모바일 상품 페이지 로드 완료 ({self.metrics.session} 세션)")
+    
+    def _report_progress(self, stage: str, reviews_found: int = 0):
+        """진행 상황 콜백 호출 (콜백 오류는 크롤링에 영향 주지 않음)"""
+        if not self.on_progress:
+            return
+        try:
+            self.on_progress(stage, reviews_found)
+        except Exception as e:
+            logger.debug(f"진행 상황 콜백 오류 ({stage}): {e}")
+    
+    async def _throttle(self, url: str):
+        """다나와 요청(페이지 이동, 리뷰 로드 클릭) 전 호스트별 속도 제한 대기"""
+        delay = await host_rate_limiter.acquire(url)
+        if delay > 0:
+            self.metrics.record_wait("rate_limit", delay, True)
+    
+    async def _collect_loaded_reviews(
+        self,
+        max_reviews: int,
+        known_review_ids: Optional[AbstractSet[str]] = None
+    ) -> List[ReviewData]:
+        """로드된 상품 페이지에서 리뷰 섹션 이동, 더보기 클릭, 리뷰 추출"""
+        reviews = []
+        
+        # 리뷰 섹션으로 이동
+        with self.metrics.stage("review_tab"):
+            review_found = await self._navigate_to_mobile_reviews()
+        
+        if review_found:
+            # 사용자가 설정한 개수만큼 리뷰 로드를 위해 더보기 버튼 반복 클릭
+            with self.metrics.stage("load_more"):
+                await self._click_more_reviews_if_needed(max_reviews, known_review_ids)
+            
+            # 리뷰 데이터 추출
+            with self.metrics.stage("extract_reviews"):
+                reviews = await self._extract_mobile_reviews(max_reviews)
+        
+        return reviews
+    
+    async def _scroll_to_load_content(self, max_reviews: Optional[int] = None):
+        """항목 수/문서 높이가 더 이상 변하지 않을 때까지 스크롤하여 콘텐츠 로드"""
         try:
             logger.info("📜 페이지 스크롤 중...")
-            for i in range(3):
-                await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                await asyncio.sleep(2)
-            logger.info("✅ 스크롤 완료")
+            result = await self.waits.scroll_until_stable(
+                REVIEW_ITEM_SELECTOR,
+                target_items=max_reviews,
+                max_scrolls=settings.crawler_max_scrolls,
+                settle_timeout=settings.crawler_scroll_settle_timeout
+            )
+            self.metrics.scroll = result
+            logger.info(
+                f"✅ 스크롤 완료: {result['scrolls']}회, 대기 {result['wait_seconds']:.2f}s ({result['stop_reason']})"
+            )
         except Exception as e:
             logger.error(f"❌ 스크롤 오류: {e}")
     
@@ -289,17 +583,20 @@ class DanawaCrawler:
         """모바일 사이트에서 리뷰 섹션으로 이동"""
         logger.info("🔍 모바일 리뷰 섹션 찾는 중...")
         
-        # 사용자가 제공한 정확한 리뷰 버튼 셀렉터
-        review_button_selector = "#productBlog-starsButton > div.text__review > span.text__number"
-        
         try:
             # 리뷰 버튼 클릭
-            review_button = await self.page.query_selector(review_button_selector)
+            review_button = await self.page.query_selector(REVIEW_BUTTON_SELECTOR)
             if review_button:
                 logger.info(f"✅ 리뷰 버튼 발견!")
+                await self._throttle(self.page.url)
                 await review_button.click()
-                await asyncio.sleep(3)
+                await self.waits.for_selector(
+                    REVIEW_ITEM_SELECTOR,
+                    name="review_list",
+                    timeout=settings.crawler_review_tab_timeout
+                )
                 logger.info("✅ 리뷰 섹션으로 이동 완료")
+                self._report_progress("review_tab")
                 return True
             else:
                 logger.error("❌ 리뷰 버튼을 찾을 수 없습니다.")
@@ -308,130 +605,121 @@ class DanawaCrawler:
             logger.error(f"❌ 리뷰 탭 클릭 실패: {e}")
             return False
     
-    async def _click_more_reviews_if_needed(self, target_reviews: int):
-        """사용자가 설정한 개수만큼 리뷰를 로드하기 위해 더보기 버튼을 반복 클릭"""
-        logger.info(f"🔍 목표 {target_reviews}개 리뷰 로드를 위한 더보기 버튼 클릭 시작...")
-        
-        # 사용자가 제공한 정확한 펼쳐보기 셀렉터
-        more_button_selector = "#productBlog-opinion-mall-button-viewMore > span"
-        
-        # 기본적으로 30개 정도 보이므로, 추가로 필요한 만큼 더보기 클릭
-        # 한 번 클릭할 때마다 약 30-50개씩 추가 로드됨
-        estimated_clicks = max(1, (target_reviews - 30) // 30)
-        max_clicks = min(estimated_clicks + 2, 20)  # 최대 20번까지만 클릭 (안전장치)
+    async def _click_more_reviews_if_needed(
+        self,
+        target_reviews: int,
+        known_review_ids: Optional[AbstractSet[str]] = None
+    ):
+        """사용자가 설정한 개수만큼 리뷰를 로드하기 위해 더보기 버튼을 반복 클릭
+
+        페이지에 표시된 전체 리뷰 수로 필요한 클릭 수를 계산하고, 리뷰 수가 더 늘지 않으면 중단한다.
+        known_review_ids 가 주어지면 새로 로드된 리뷰가 모두 기존 리뷰일 때 클릭을 중단한다.
+        """
+        planner = await self._plan_pagination(target_reviews)
+        logger.info(
+            f"🔍 목표 {target_reviews}개 리뷰 로드 - 전체 {planner.total if planner.total is not None else '?'}개, "
+            f"현재 {planner.loaded}개, 예상 더보기 클릭 {planner.planned_clicks}회"
+        )
         
-        logger.info(f"📊 예상 더보기 클릭 횟수: {estimated_clicks}, 최대 클릭 횟수: {max_clicks}")
+        # 증분 모드: 첫 화면의 리뷰가 모두 기존 리뷰이면 더보기 불필요
+        if known_review_ids and await self._loaded_reviews_all_known(0, known_review_ids):
+            logger.info("🔚 첫 화면의 리뷰가 모두 기존 리뷰 - 더보기 클릭 생략")
+            return
         
-        click_count = 0
-        for i in range(max_clicks):
+        while planner.should_click():
+            previous_count = planner.loaded
             try:
-                more_button = await self.page.query_selector(more_button_selector)
-                if more_button:
-                    # 버튼이 보이는지 확인
-                    is_visible = await more_button.is_visible()
-                    if is_visible:
-                        logger.info(f"✅ 더보기 버튼 {i+1}번째 클릭!")
-                        await more_button.click()
-                        click_count += 1
-                        await asyncio.sleep(3)  # 로딩 대기
-                        
-                        # 현재 로드된 리뷰 개수 확인
-                        current_reviews = await self.page.query_selector_all('[id*="productBlog-opinion-mall-list-listItem-"]')
-                        current_count = len(current_reviews)
-                        logger.info(f"📝 현재 로드된 리뷰: {current_count}개")
-                        
-                        # 목표 개수에 도달했으면 중단
-                        if current_count >= target_reviews:
-                            logger.info(f"🎯 목표 개수({target_reviews})에 도달! 더보기 클릭 중단")
-                            break
-                    else:
-                        logger.info("🔚 더보기 버튼이 보이지 않음 - 모든 리뷰 로드 완료")
-                        break
-                else:
-                    logger.info("🔚 더보기 버튼을 찾을 수 없음 - 모든 리뷰 로드 완료")
-                    break
-                    
+                planner.record_click(await self._click_more_once(previous_count))
             except Exception as e:
-                logger.error(f"❌ 더보기 버튼 {i+1}번째 클릭 실패: {e}")
+                logger.error(f"❌ 더보기 버튼 {planner.clicks + 1}번째 클릭 실패: {e}")
                 break
+            
+            # 증분 모드: 이번에 로드된 리뷰가 모두 기존 리뷰이면 중단
+            if (
+                known_review_ids
+                and planner.loaded > previous_count
+                and await self._loaded_reviews_all_known(previous_count, known_review_ids)
+            ):
+                logger.info("🔚 새로 로드된 리뷰가 모두 기존 리뷰 - 더보기 클릭 중단")
+                break
+        
+        self.metrics.pagination = planner.to_dict()
+        logger.info(
+            f"🎉 총 {planner.clicks}번의 더보기 클릭 완료 (예상 {planner.planned_clicks}회, "
+            f"로드 {planner.loaded}개, 종료 사유: {planner.stop_reason})"
+        )
+    
+    async def _plan_pagination(self, target_reviews: int) -> PaginationPlanner:
+        """페이지에 표시된 전체 리뷰 수와 현재 로드된 리뷰 수로 더보기 계획 생성"""
+        total_text = await self.page.evaluate(TOTAL_REVIEW_COUNT_SCRIPT, REVIEW_BUTTON_SELECTOR)
+        return PaginationPlanner(
+            target=target_reviews,
+            total=parse_review_count(total_text),
+            loaded=await self._loaded_review_count(),
+            max_clicks=settings.crawler_max_more_clicks
+        )
+    
+    async def _fast_forward_to(self, resume_from: int, planner: PaginationPlanner):
+        """체크포인트 위치까지 리뷰 추출 없이 더보기만 클릭"""
+        logger.info(f"⏩ 체크포인트에서 재개 - 리뷰 {resume_from}개 위치까지 더보기 클릭")
+        while planner.loaded < resume_from and planner.should_click():
+            planner.record_click(await self._click_more_once(planner.loaded))
+        self._report_progress("resumed", planner.loaded)
+    
+    async def _loaded_review_count(self) -> int:
+        """로드된 리뷰 항목 수 (처음 호출 시 증분 카운터 설치)"""
+        return await self.page.evaluate(REVIEW_COUNTER_SCRIPT, [REVIEW_ITEM_SELECTOR, REVIEW_ITEM_ID_PREFIX])
+    
+    async def _click_more_once(self, current_count: int) -> Optional[int]:
+        """더보기 버튼을 한 번 클릭하고 리뷰 개수가 늘어날 때까지 대기
+
+        버튼이 없거나 보이지 않으면(모든 리뷰 로드 완료) None, 아니면 현재 로드된 리뷰 개수를 반환한다.
+        """
+        more_button = await self.page.query_selector(MORE_BUTTON_SELECTOR)
+        if not more_button:
+            logger.info("🔚 더보기 버튼을 찾을 수 없음 - 모든 리뷰 로드 완료")
+            return None
+        if not await more_button.is_visible():
+            logger.info("🔚 더보기 버튼이 보이지 않음 - 모든 리뷰 로드 완료")
+            return None
+        
+        logger.info("✅ 더보기 버튼 클릭!")
+        await self._throttle(self.page.url)
+        await more_button.click()
         
-        logger.info(f"🎉 총 {click_count}번의 더보기 클릭 완료")
+        # 증분 카운터가 늘어날 때까지 대기 후 현재 로드된 리뷰 개수 확인
+        loaded_count = await self.waits.for_value_increase(
+            REVIEW_COUNTER_EXPRESSION,
+            current_count,
+            name="load_more",
+            timeout=settings.crawler_load_more_timeout
+        )
+        logger.info(f"📝 현재 로드된 리뷰: {loaded_count}개")
+        self._report_progress("load_more", loaded_count)
+        return loaded_count
+    
+    async def _loaded_reviews_all_known(self, start: int, known_review_ids: AbstractSet[str]) -> bool:
+        """start 번째 이후 로드된 리뷰가 모두 이미 저장된 리뷰인지 확인"""
+        loaded_ids = await self.page.evaluate(
+            LOADED_REVIEW_IDS_SCRIPT, [REVIEW_ITEM_SELECTOR, REVIEW_ITEM_ID_PREFIX, start]
+        )
+        return bool(loaded_ids) and all(review_id in known_review_ids for review_id in loaded_ids)
     
     async def _extract_mobile_reviews(self, max_reviews: int) -> List[ReviewData]:
-        """모바일 페이지에서 리뷰 데이터 추출"""
+        """모바일 페이지에서 리뷰 데이터 추출 (page.evaluate 1회로 전체 리뷰 수집)"""
         reviews = []
         
         logger.info("🔍 모바일 리뷰 데이터 추출 중...")
         
         try:
-            # 리뷰 컨테이너들 찾기 (동적 ID 패턴)
-            # 사용자 예시: #productBlog-opinion-mall-list-listItem-9123372001990022352 > div
-            review_containers = await self.page.query_selector_all('[id*="productBlog-opinion-mall-list-listItem-"] > div')
-            logger.info(f"📝 발견된 리뷰 컨테이너: {len(review_containers)}개")
+            rows = await self.page.evaluate(EXTRACT_REVIEWS_SCRIPT, [REVIEW_ITEM_ID_PREFIX, 0])
+            logger.info(f"📝 발견된 리뷰 컨테이너: {len(rows)}개")
             
-            if not review_containers:
+            if not rows:
                 logger.error("❌ 리뷰 컨테이너를 찾을 수 없습니다.")
                 return reviews
             
-            review_count = 0
-            for i, container in enumerate(review_containers):
-                if review_count >= max_reviews:
-                    break
-                
-                try:
-                    # 컨테이너의 ID에서 숫자 추출
-                    container_id = await container.get_attribute('id')
-                    if not container_id:
-                        # 부모 요소의 ID에서 추출 시도
-                        parent = await container.query_selector('xpath=..')
-                        if parent:
-                            container_id = await parent.get_attribute('id')
-                    
-                    if container_id and 'productBlog-opinion-mall-list-listItem-' in container_id:
-                        # ID에서 숫자 부분 추출
-                        review_id = container_id.replace('productBlog-opinion-mall-list-listItem-', '')
-                        
-                        # 해당 리뷰의 텍스트 찾기
-                        # 사용자 예시: #productBlog-opinion-mall-list-content-9123372001990022352
-                        text_selector = f"#productBlog-opinion-mall-list-content-{review_id}"
-                        text_element = await self.page.query_selector(text_selector)
-                        
-                        # 별점 찾기 
-                        # 사용자 예시: #productBlog-opinion-mall-list-listItem-9123372001865032107 > div > div > div:nth-child(1) > div > span > span
-                        rating_selector = f"#productBlog-opinion-mall-list-listItem-{review_id} > div > div > div:nth-child(1) > div > span > span"
-                        rating_element = await self.page.query_selector(rating_selector)
-                        
-                        # 리뷰 텍스트 추출
-                        review_text = ""
-                        if text_element:
-                            review_text = await text_element.inner_text()
-                            review_text = review_text.strip()
-                        
-                        # 별점 추출
-                        rating = 0
-                        if rating_element:
-                            rating_text = await rating_element.inner_text()
-                            # 별점 텍스트에서 숫자 추출 (예: "5점" -> 5)
-                            rating_match = re.search(r'(\d+)', rating_text)
-                            if rating_match:
-                                rating = int(rating_match.group(1))
-                        
-                        if review_text and len(review_text) > 10:  # 의미있는 길이의 리뷰만
-                            review_data = ReviewData(
-                                review_id=review_id,
-                                content=review_text,
-                                rating=rating if rating > 0 else None,
-                                author="익명",  # 모바일에서는 작성자 정보 제한적
-                                date=None       # 날짜 정보 추출이 필요하면 별도 셀렉터 필요
-                            )
-                            reviews.append(review_data)
-                            review_count += 1
-                            logger.info(f"📝 리뷰 {review_count}: {review_text[:50]}..." + (f" (★{rating})" if rating > 0 else ""))
-                    
-                except Exception as e:
-                    logger.error(f"❌ 리뷰 {i+1} 추출 오류: {e}")
-                    continue
-            
+            reviews = map_review_rows(rows, max_reviews)
             logger.info(f"🎉 총 {len(reviews)}개의 모바일 리뷰 추출 완료!")
             
         except Exception as e:
@@ -440,48 +728,123 @@ class DanawaCrawler:
         return reviews
 
 
-async def crawl_danawa_reviews(product_url: str, max_reviews: int = 100) -> Dict[str, Any]:
-    """다나와 리뷰 크롤링 메인 함수"""
-    async with DanawaCrawler() as crawler:
+def build_product_info(product_code: Optional[str], raw_info: Dict[str, Optional[str]]) -> Dict[str, Optional[str]]:
+    """페이지에서 추출한 상품 정보를 product_name/product_image/product_price/product_brand 형태로 변환"""
+    product_name = raw_info.get('product_name')
+    if not product_name:
+        product_name = f"다나와 상품 ({product_code})" if product_code else "다나와 상품"
+    return {
+        "product_name": product_name,
+        "product_image": raw_info.get('image_url'),
+        "product_price": raw_info.get('price'),
+        "product_brand": raw_info.get('brand')
+    }
+
+
+def map_review_rows(rows: List[Dict[str, Any]], max_reviews: int) -> List[ReviewData]:
+    """EXTRACT_REVIEWS_SCRIPT 결과(JSON 배열)를 ReviewData 목록으로 변환"""
+    reviews = []
+    
+    for row in rows:
+        if len(reviews) >= max_reviews:
+            break
+        
+        review_text = (row.get('text') or '').strip()
+        if len(review_text) <= 10:  # 의미있는 길이의 리뷰만
+            continue
+        
+        # 별점 텍스트에서 숫자 추출 (예: "5점" -> 5)
+        rating = 0
+        rating_match = re.search(r'(\d+)', row.get('rating') or '')
+        if rating_match:
+            rating = int(rating_match.group(1))
+        
+        try:
+            reviews.append(ReviewData(
+                review_id=row['id'],
+                content=review_text,
+                rating=rating if rating > 0 else None,
+                author="익명",  # 모바일에서는 작성자 정보 제한적
+                date=row.get('date')
+            ))
+        except Exception as e:
+            # 기존 요소별 추출과 같이 검증에 실패한 리뷰(별점 5 초과 등)는 건너뜀
+            logger.error(f"❌ 리뷰 {row.get('id')} 추출 오류: {e}")
+            continue
+        logger.debug(f"📝 리뷰 {len(reviews)}: {review_text[:50]}..." + (f" (★{rating})" if rating > 0 else ""))
+    
+    return reviews
+
+
+def split_known_reviews(
+    reviews: List[ReviewData],
+    known_review_ids: Optional[AbstractSet[str]]
+) -> Tuple[List[ReviewData], int]:
+    """이미 저장된 리뷰를 제외한 새 리뷰 목록과 건너뛴 리뷰 수 반환"""
+    if not known_review_ids:
+        return reviews, 0
+    new_reviews = [review for review in reviews if review.review_id not in known_review_ids]
+    return new_reviews, len(reviews) - len(new_reviews)
+
+
+async def crawl_danawa_product(
+    product_url: str,
+    max_reviews: int = 100,
+    pool: Optional[BrowserPool] = None,
+    known_review_ids: Optional[AbstractSet[str]] = None,
+    on_progress: Optional[ProgressCallback] = None
+) -> ProductCrawlResult:
+    """다나와 상품 크롤링 메인 함수 (페이지 1회 로드로 상품 정보 + 리뷰 수집)
+
+    known_review_ids 를 넘기면 증분 모드로 새 리뷰만 반환한다.
+    on_progress 를 넘기면 단계별 진행 상황(단계 이름, 리뷰 수)을 전달받는다.
+    """
+    async with DanawaCrawler(pool=pool, on_progress=on_progress) as crawler:
         try:
-            # 1. 상품 정보 먼저 추출
-            logger.info("🔍 상품 정보 추출 중...")
-            product_info = await crawler.extract_product_info(product_url)
-            
-            # 2. 리뷰 크롤링
-            logger.info("📝 리뷰 크롤링 시작...")
-            reviews = await crawler.crawl_reviews(product_url, max_reviews)
-            
-            product_code = crawler.extract_product_code(product_url)
-            
-            # 추출된 상품 정보 사용
-            product_name = product_info.get('product_name')
-            if not product_name:
-                product_name = f"다나와 상품 ({product_code})" if product_code else "다나와 상품"
-            
-            # CrawlResponse 스키마에 맞게 반환 (상품 정보 포함)
-            return {
-                "success": True,
-                "product_id": product_code or "unknown",
-                "product_name": product_name,
-                "product_image": product_info.get('image_url'),  # 이미지 URL 추가
-                "product_price": product_info.get('price'),      # 가격 정보 추가
-                "product_brand": product_info.get('brand'),      # 브랜드 정보 추가
-                "total_reviews": len(reviews),
-                "reviews": reviews,  # ReviewData 객체들의 리스트
-                "error_message": None
-            }
+            return await crawler.crawl_product(product_url, max_reviews, known_review_ids)
             
         except Exception as e:
             logger.error(f"크롤링 전체 오류: {e}")
-            return {
-                "success": False,
-                "product_id": "error", 
-                "product_name": "Error",
-                "product_image": None,
-                "product_price": None,
-                "product_brand": None,
-                "total_reviews": 0,
-                "reviews": [],
-                "error_message": str(e)
-            } 
\ No newline at end of file
+            return ProductCrawlResult(
+                success=False,
+                product_id="error",
+                product_name="Error",
+                error_message=str(e),
+                metrics=crawler.metrics.to_dict()
+            )
+
+
+async def iter_danawa_review_batches(
+    product_url: str,
+    max_reviews: int = 100,
+    pool: Optional[BrowserPool] = None,
+    known_review_ids: Optional[AbstractSet[str]] = None,
+    on_progress: Optional[ProgressCallback] = None,
+    resume_from: int = 0
+) -> AsyncIterator[ReviewBatch]:
+    """브라우저 페이지를 임대해 리뷰 배치를 순서대로 반환 (스트리밍 크롤링용, resume_from 위치부터 재개 가능)"""
+    async with DanawaCrawler(pool=pool, on_progress=on_progress) as crawler:
+        async for batch in crawler.iter_review_batches(product_url, max_reviews, known_review_ids, resume_from):
+            yield batch
+
+
+async def crawl_danawa_reviews(
+    product_url: str,
+    max_reviews: int = 100,
+    pool: Optional[BrowserPool] = None
+) -> Dict[str, Any]:
+    """다나와 리뷰 크롤링 함수 (dict 응답 호환용)"""
+    result = await crawl_danawa_product(product_url, max_reviews, pool=pool)
+    
+    # CrawlResponse 스키마에 맞게 반환 (상품 정보 포함)
+    return {
+        "success": result.success,
+        "product_id": result.product_id,
+        "product_name": result.product_name,
+        "product_image": result.product_image,
+        "product_price": result.product_price,
+        "product_brand": result.product_brand,
+        "total_reviews": len(result.reviews),
+        "reviews": result.reviews,  # ReviewData 객체들의 리스트
+        "error_message": result.error_message
+    }
@@ -0,0 +1,309 @@
+"""
+HTTP 전용 다나와 리뷰 수집기 - 브라우저 없이 httpx 로 HTML 을 받아 파싱 (실패 시 Playwright 크롤러로 대체)
+"""
+import asyncio
+import re
+import time
+from typing import AbstractSet, Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import httpx
+from bs4 import BeautifulSoup
+from loguru import logger
+
+from app.core.config import settings
+from app.infrastructure.crawler.browser_pool import MOBILE_USER_AGENT, BrowserPool
+from app.infrastructure.crawler.danawa_crawler import (
+    PRODUCT_NAME_SELECTOR,
+    REVIEW_BUTTON_SELECTOR,
+    REVIEW_ITEM_ID_PREFIX,
+    ProgressCallback,
+    ReviewBatch,
+    build_product_info,
+    crawl_danawa_product,
+    extract_product_code,
+    iter_danawa_review_batches,
+    map_review_rows,
+    split_known_reviews,
+)
+from app.infrastructure.crawler.metrics import CrawlMetrics
+from app.infrastructure.crawler.pagination import parse_review_count
+from app.models.schemas import ProductCrawlResult, ReviewData
+from app.utils.rate_limiter import host_rate_limiter
+
+
+REQUEST_HEADERS = {
+    "User-Agent": MOBILE_USER_AGENT,
+    "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
+}
+
+DATE_PATTERN = re.compile(r"\d{2,4}[.\-/]\d{1,2}[.\-/]\d{1,2}")
+
+# DanawaCrawler._extract_product_info_from_page 와 같은 우선순위의 선택자
+PRODUCT_NAME_SELECTORS = [PRODUCT_NAME_SELECTOR, ".product_title", ".product-title", ".prod_name", "h1"]
+IMAGE_SELECTORS = [
+    "#productBlog-image-item-0 > span > img",
+    ".thumb_area img",
+    ".swiper-slide img",
+    "img[src*='danawa']",
+    "img[data-src*='danawa']"
+]
+PRICE_SELECTORS = [".price_real", ".price_current", ".price", "[class*='price']"]
+BRAND_SELECTORS = [".brand_name", ".brand", "[class*='brand']", ".manufacturer"]
+
+
+class HttpFastPathError(Exception):
+    """HTTP 경로로 리뷰를 충분히 얻지 못함 (Playwright 크롤러로 대체해야 함)"""
+
+
+def parse_review_rows(html: str) -> List[Dict[str, Any]]:
+    """리뷰 목록 HTML 에서 EXTRACT_REVIEWS_SCRIPT 와 같은 형태의 행(id, text, rating, date) 추출"""
+    soup = BeautifulSoup(html, "html.parser")
+    rows = []
+    for item in soup.select(f'[id^="{REVIEW_ITEM_ID_PREFIX}"]'):
+        if item.find("div", recursive=False) is None:
+            continue
+        review_id = item["id"][len(REVIEW_ITEM_ID_PREFIX):]
+        text_el = soup.find(id=f"productBlog-opinion-mall-list-content-{review_id}")
+        rating_el = item.select_one(":scope > div > div > div:nth-child(1) > div > span > span")
+        date_match = DATE_PATTERN.search(item.get_text(" ", strip=True))
+        rows.append({
+            "id": review_id,
+            "text": text_el.get_text(" ", strip=True) if text_el else "",
+            "rating": rating_el.get_text(strip=True) if rating_el else "",
+            "date": date_match.group(0) if date_match else None
+        })
+    return rows
+
+
+def parse_reviews_html(html: str, max_reviews: int = 100) -> List[ReviewData]:
+    """리뷰 목록 HTML 을 DanawaCrawler 와 같은 ReviewData 목록으로 변환"""
+    return map_review_rows(parse_review_rows(html), max_reviews)
+
+
+def parse_product_info_html(html: str) -> Dict[str, Optional[str]]:
+    """상품 페이지 HTML 에서 상품 정보(product_name, image_url, price, brand) 추출"""
+    soup = BeautifulSoup(html, "html.parser")
+    product_info: Dict[str, Optional[str]] = {"product_name": None, "image_url": None, "price": None, "brand": None}
+
+    for selector in PRODUCT_NAME_SELECTORS:
+        element = soup.select_one(selector)
+        if element and element.get_text(strip=True):
+            product_info["product_name"] = element.get_text(" ", strip=True)
+            break
+
+    for selector in IMAGE_SELECTORS:
+        element = soup.select_one(selector)
+        image_url = element and (element.get("src") or element.get("data-src"))
+        if image_url and re.search(r"\.(jpe?g|png|webp)", image_url.lower()):
+            if image_url.startswith("//"):
+                image_url = f"https:{image_url}"
+            elif image_url.startswith("/"):
+                image_url = f"https://img.danawa.com{image_url}"
+            product_info["image_url"] = image_url
+            break
+
+    for selector in PRICE_SELECTORS:
+        element = soup.select_one(selector)
+        if element and "원" in element.get_text():
+            product_info["price"] = element.get_text(strip=True)
+            break
+
+    for selector in BRAND_SELECTORS:
+        element = soup.select_one(selector)
+        if element and element.get_text(strip=True):
+            product_info["brand"] = element.get_text(strip=True)
+            break
+
+    return product_info
+
+
+def parse_total_review_count(html: str) -> Optional[int]:
+    """리뷰 버튼의 전체 리뷰 수 (예: "1,234" → 1234)"""
+    element = BeautifulSoup(html, "html.parser").select_one(REVIEW_BUTTON_SELECTOR)
+    return parse_review_count(element.get_text()) if element else None
+
+
+class HttpReviewFetcher:
+    """keep-alive 연결을 재사용하는 httpx 기반 리뷰 수집기
+
+    상품 페이지 HTML 에 포함된 리뷰와 settings.crawler_http_review_list_url 의 리뷰 목록 페이지를
+    차례로 받아 파싱한다. 전체 리뷰 수 대비 필요한 만큼 얻지 못하면 HttpFastPathError.
+    """
+
+    def __init__(self, timeout: Optional[float] = None, max_connections: int = 10):
+        self.timeout = settings.crawling_timeout if timeout is None else timeout
+        self.limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.stats = {"fast_path": 0, "fallbacks": 0}
+
+    def _new_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            headers=REQUEST_HEADERS,
+            timeout=self.timeout,
+            limits=self.limits,
+            follow_redirects=True
+        )
+
+    def _get_client(self) -> Tuple[httpx.AsyncClient, bool]:
+        """현재 이벤트 루프용 클라이언트와 호출 후 닫아야 하는지 여부
+
+        연결 풀은 처음 사용한 이벤트 루프에 묶이므로 다른 루프(스케줄러 스레드)에서는 1회용 클라이언트를 쓴다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed:
+            self._client = self._new_client()
+            self._loop = loop
+        if self._loop is loop:
+            return self._client, False
+        return self._new_client(), True
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._loop = None
+
+    async def _get_html(self, client: httpx.AsyncClient, url: str, metrics: CrawlMetrics) -> str:
+        delay = await host_rate_limiter.acquire(url)
+        if delay > 0:
+            metrics.record_wait("rate_limit", delay, True)
+        response = await client.get(url)
+        response.raise_for_status()
+        metrics.record_request("document", blocked=False, size=len(response.content))
+        return response.text
+
+    async def fetch_product(
+        self,
+        product_url: str,
+        max_reviews: int = 100,
+        known_review_ids: Optional[AbstractSet[str]] = None
+    ) -> ProductCrawlResult:
+        """상품 정보와 리뷰를 HTTP 요청만으로 수집"""
+        metrics = CrawlMetrics()
+        product_code = extract_product_code(product_url)
+        client, owned = self._get_client()
+        try:
+            with metrics.stage("navigate"):
+                metrics.navigations += 1
+                html = await self._get_html(client, str(product_url), metrics)
+            with metrics.stage("extract_reviews"):
+                product_info = parse_product_info_html(html)
+                total_reviews = parse_total_review_count(html)
+                rows = parse_review_rows(html)
+
+            list_url = settings.crawler_http_review_list_url
+            page = 1
+            while list_url and product_code and len(rows) < max_reviews and page <= settings.crawler_http_max_pages:
+                with metrics.stage("load_more"):
+                    page_html = await self._get_html(client, list_url.format(code=product_code, page=page), metrics)
+                page_rows = parse_review_rows(page_html)
+                seen = {row["id"] for row in rows}
+                page_rows = [row for row in page_rows if row["id"] not in seen]
+                if not page_rows:
+                    break
+                rows.extend(page_rows)
+                page += 1
+        finally:
+            if owned:
+                await client.aclose()
+
+        reviews = map_review_rows(rows, max_reviews)
+        expected = min(max_reviews, total_reviews) if total_reviews is not None else None
+        if not reviews and expected != 0:
+            raise HttpFastPathError("HTML 에서 리뷰를 찾을 수 없습니다")
+        # 짧은 리뷰는 걸러지므로 로드한 행 수 기준으로 부족 여부 판단
+        if expected is not None and len(rows) < expected:
+            raise HttpFastPathError(f"리뷰 {len(rows)}/{expected}개만 수집됨")
+
+        reviews, skipped_reviews = split_known_reviews(reviews, known_review_ids)
+        result_metrics = metrics.to_dict()
+        result_metrics["mode"] = "http"
+        return ProductCrawlResult(
+            success=True,
+            product_id=product_code or "unknown",
+            **build_product_info(product_code, product_info),
+            reviews=reviews,
+            skipped_reviews=skipped_reviews,
+            metrics=result_metrics
+        )
+
+
+# 전역 HTTP 리뷰 수집기 인스턴스
+http_review_fetcher = HttpReviewFetcher()
+
+
+async def _try_fast_path(
+    product_url: str,
+    max_reviews: int,
+    known_review_ids: Optional[AbstractSet[str]]
+) -> Optional[ProductCrawlResult]:
+    # 목록 주소가 없으면 상품 페이지 리뷰만으로는 부족해 대체될 뿐이므로 요청(과 속도 제한 토큰)을 아낀다
+    if not settings.crawler_http_fast_path or not settings.crawler_http_review_list_url:
+        return None
+    started = time.perf_counter()
+    try:
+        result = await http_review_fetcher.fetch_product(product_url, max_reviews, known_review_ids)
+        http_review_fetcher.stats["fast_path"] += 1
+        logger.info(f"⚡ HTTP 경로로 리뷰 {len(result.reviews)}개 수집 ({time.perf_counter() - started:.2f}s)")
+        return result
+    except (HttpFastPathError, httpx.HTTPError) as e:
+        http_review_fetcher.stats["fallbacks"] += 1
+        logger.info(f"↩️ HTTP 경로 실패 - 브라우저 크롤링으로 대체: {e}")
+        return None
+    except Exception as e:
+        # 잘못된 목록 주소 템플릿(KeyError/IndexError), 예상 밖의 마크업 등도 크롤링 실패 대신 브라우저로 대체
+        http_review_fetcher.stats["fallbacks"] += 1
+        logger.warning(f"↩️ HTTP 경로 오류 - 브라우저 크롤링으로 대체: {type(e).__name__}: {e}")
+        return None
+
+
+async def crawl_product_with_fallback(
+    product_url: str,
+    max_reviews: int = 100,
+    pool: Optional[BrowserPool] = None,
+    known_review_ids: Optional[AbstractSet[str]] = None,
+    on_progress: Optional[ProgressCallback] = None
+) -> ProductCrawlResult:
+    """HTTP 경로를 먼저 시도하고 실패하면 crawl_danawa_product 로 크롤링"""
+    result = await _try_fast_path(product_url, max_reviews, known_review_ids)
+    if result is not None:
+        if on_progress:
+            on_progress("reviews_extracted", len(result.reviews))
+        return result
+    return await crawl_danawa_product(
+        product_url, max_reviews, pool=pool, known_review_ids=known_review_ids, on_progress=on_progress
+    )
+
+
+async def iter_review_batches_with_fallback(
+    product_url: str,
+    max_reviews: int = 100,
+    pool: Optional[BrowserPool] = None,
+    known_review_ids: Optional[AbstractSet[str]] = None,
+    on_progress: Optional[ProgressCallback] = None,
+    resume_from: int = 0
+) -> AsyncIterator[ReviewBatch]:
+    """HTTP 경로가 성공하면 배치 1개로 반환하고, 실패하면 iter_danawa_review_batches 로 크롤링
+
+    체크포인트 위치(resume_from)는 브라우저 DOM 기준이므로 재개할 때는 HTTP 경로를 건너뛴다.
+    """
+    result = await _try_fast_path(product_url, max_reviews, known_review_ids) if resume_from <= 0 else None
+    if result is not None:
+        if on_progress:
+            on_progress("reviews_extracted", len(result.reviews))
+        yield ReviewBatch(
+            index=0,
+            product_id=result.product_id,
+            product_info=result.product_info,
+            reviews=result.reviews,
+            skipped_reviews=result.skipped_reviews,
+            loaded_count=len(result.reviews) + result.skipped_reviews
+        )
+        return
+    async for batch in iter_danawa_review_batches(
+        product_url, max_reviews, pool=pool, known_review_ids=known_review_ids, on_progress=on_progress,
+        resume_from=resume_from
+    ):
+        yield batch
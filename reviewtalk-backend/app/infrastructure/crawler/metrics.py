@@ -0,0 +1,91 @@
+"""
+크롤링 측정 지표 - 단계별 소요 시간, 페이지 이동 횟수, 대기 시간 기록
+"""
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator
+
+
+@dataclass
+class CrawlMetrics:
+    """크롤링 1회 동안의 측정 지표"""
+
+    navigations: int = 0
+    session: str = ""  # 브라우저 세션 종류 (warm / storage / cold)
+    stages: Dict[str, float] = field(default_factory=dict)
+    waits: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    requests_allowed: int = 0
+    requests_blocked: int = 0
+    bytes_loaded: int = 0  # 허용된 요청의 실제 수신 바이트 (헤더 + 인코딩된 본문)
+    bytes_by_type: Dict[str, int] = field(default_factory=dict)
+    blocked_by_type: Dict[str, int] = field(default_factory=dict)
+    pagination: Dict[str, Any] = field(default_factory=dict)  # 마지막 더보기 계획 (PaginationPlanner.to_dict)
+    scroll: Dict[str, Any] = field(default_factory=dict)  # 마지막 스크롤 결과 (WaitEngine.scroll_until_stable)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """블록 실행 시간을 단계 이름으로 누적 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + (time.perf_counter() - started)
+
+    def record_wait(self, name: str, elapsed: float, satisfied: bool) -> None:
+        """대기 이름별 횟수, 누적/최대 시간, 타임아웃 수 기록"""
+        wait = self.waits.setdefault(name, {"count": 0, "total": 0.0, "max": 0.0, "timeouts": 0})
+        wait["count"] += 1
+        wait["total"] += elapsed
+        wait["max"] = max(wait["max"], elapsed)
+        if not satisfied:
+            wait["timeouts"] += 1
+
+    def record_request(self, resource_type: str, blocked: bool, size: int = 0) -> None:
+        """네트워크 요청 기록 (차단된 요청은 타입별 건수, 허용된 요청은 타입별 수신 바이트 누적)
+
+        차단된 요청은 응답을 받지 않으므로 절약한 바이트는 여기서 추정하지 않는다.
+        차단 정책을 끈 실행(allow_all)의 bytes_by_type 과 비교해 측정한다 (benchmarks/bench_resource_blocking.py).
+        """
+        if blocked:
+            self.requests_blocked += 1
+            self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+        else:
+            self.requests_allowed += 1
+            self.bytes_loaded += size
+            self.bytes_by_type[resource_type] = self.bytes_by_type.get(resource_type, 0) + size
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "navigations": self.navigations,
+            "session": self.session,
+            "stages": {name: round(seconds, 3) for name, seconds in self.stages.items()},
+            "waits": {
+                name: {
+                    "count": wait["count"],
+                    "total_seconds": round(wait["total"], 3),
+                    "max_seconds": round(wait["max"], 3),
+                    "timeouts": wait["timeouts"]
+                }
+                for name, wait in self.waits.items()
+            },
+            "network": {
+                "requests_allowed": self.requests_allowed,
+                "requests_blocked": self.requests_blocked,
+                "blocked_by_type": dict(self.blocked_by_type),
+                "bytes_loaded": self.bytes_loaded,
+                "bytes_by_type": dict(self.bytes_by_type)
+            },
+            "pagination": dict(self.pagination),
+            "scroll": dict(self.scroll),
+            "total_seconds": round(sum(self.stages.values()), 3)
+        }
+
+    def summary(self) -> str:
+        """로그용 한 줄 요약"""
+        stages = ", ".join(f"{name}={seconds:.2f}s" for name, seconds in self.stages.items())
+        wait_total = sum(wait["total"] for wait in self.waits.values())
+        return (
+            f"페이지 이동 {self.navigations}회 | {stages} | 대기 합계 {wait_total:.2f}s | "
+            f"요청 허용 {self.requests_allowed}건 / 차단 {self.requests_blocked}건, 수신 {self.bytes_loaded / 1024:.0f}KB"
+        )
@@ -0,0 +1,104 @@
+"""
+더보기 페이지네이션 계획 - 전체 리뷰 수와 클릭당 증가량으로 필요한 클릭 수를 계산하고 정체를 감지
+"""
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+
+# 클릭당 증가량을 아직 모를 때 쓰는 기본값 (모바일 다나와는 보통 30개씩 로드)
+DEFAULT_PAGE_SIZE = 30
+
+
+def parse_review_count(text: Optional[str]) -> Optional[int]:
+    """리뷰 버튼에 표시된 전체 리뷰 수 텍스트를 정수로 변환 (예: "1,234" → 1234)"""
+    digits = re.sub(r"[^\d]", "", text or "")
+    return int(digits) if digits else None
+
+
+@dataclass
+class PaginationPlanner:
+    """더보기 클릭 계획
+
+    - target: 로드할 리뷰 항목 수 목표
+    - total: 페이지에 표시된 전체 리뷰 수 (모르면 None)
+    - loaded: 현재 로드된 리뷰 항목 수
+    - max_clicks: 안전장치용 최대 클릭 수
+    - stall_limit: 리뷰 수가 늘지 않은 클릭이 연속으로 이만큼 나오면 중단
+    """
+
+    target: int
+    total: Optional[int] = None
+    loaded: int = 0
+    max_clicks: int = 40
+    stall_limit: int = 1
+    clicks: int = 0
+    stalls: int = 0
+    exhausted: bool = False  # 더보기 버튼이 사라짐 (모든 리뷰 로드 완료)
+    initial: int = field(init=False)
+    planned_clicks: int = field(init=False)
+
+    def __post_init__(self):
+        self.initial = self.loaded
+        self.planned_clicks = self.remaining_clicks()
+
+    @property
+    def goal(self) -> int:
+        """실제로 로드할 수 있는 목표 개수 (전체 리뷰 수를 넘지 않음)"""
+        return min(self.target, self.total) if self.total is not None else self.target
+
+    @property
+    def page_size(self) -> int:
+        """클릭당 증가량 (관측값이 있으면 평균, 없으면 첫 화면 리뷰 수)"""
+        if self.clicks and self.loaded > self.initial:
+            return max(1, math.ceil((self.loaded - self.initial) / self.clicks))
+        return self.initial or DEFAULT_PAGE_SIZE
+
+    def remaining_clicks(self) -> int:
+        """목표까지 남은 클릭 수"""
+        return max(0, math.ceil((self.goal - self.loaded) / self.page_size))
+
+    def should_click(self) -> bool:
+        return (
+            not self.exhausted
+            and self.loaded < self.goal
+            and self.clicks < self.max_clicks
+            and self.stalls < self.stall_limit
+        )
+
+    def record_click(self, loaded: Optional[int]) -> None:
+        """클릭 결과 반영 (None 이면 더보기 버튼 없음)"""
+        if loaded is None:
+            self.exhausted = True
+            return
+        self.clicks += 1
+        if loaded > self.loaded:
+            self.loaded = loaded
+            self.stalls = 0
+        else:
+            self.stalls += 1
+
+    @property
+    def stop_reason(self) -> str:
+        if self.loaded >= self.goal:
+            return "total_reached" if self.total is not None and self.loaded >= self.total else "target_reached"
+        if self.exhausted:
+            return "no_more_button"
+        if self.stalls >= self.stall_limit:
+            return "stalled"
+        if self.clicks >= self.max_clicks:
+            return "max_clicks"
+        return "in_progress"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "target": self.target,
+            "total": self.total,
+            "loaded": self.loaded,
+            "planned_clicks": self.planned_clicks,
+            "clicks": self.clicks,
+            "stalls": self.stalls,
+            "page_size": self.page_size,
+            "stop_reason": self.stop_reason
+        }
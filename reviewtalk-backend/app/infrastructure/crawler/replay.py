@@ -0,0 +1,182 @@
+"""
+크롤링 기록/재생 - 실제 사이트 응답(페이지, XHR)을 로컬 아카이브에 저장하고 네트워크 없이 재생
+"""
+import asyncio
+import hashlib
+import json
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Optional, Set
+
+from playwright.async_api import Page, Request, Response, Route
+from loguru import logger
+
+from app.core.config import settings
+from app.infrastructure.crawler.metrics import CrawlMetrics
+
+
+# 기록하지 않는 응답 헤더 (재생 시 본문 길이/인코딩이 달라짐)
+_SKIPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "set-cookie"}
+
+
+def request_key(method: str, url: str, post_data: Optional[str] = None) -> str:
+    """요청 식별 키 (메서드 + URL + POST 본문)"""
+    raw = f"{method.upper()} {url}\n{post_data or ''}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class CrawlArchive:
+    """요청 키별 응답(상태, 헤더, 본문)을 저장하는 디렉터리 아카이브
+
+    구조: <path>/index.json (키 → 메타데이터), <path>/bodies/<키> (응답 본문)
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.bodies_dir = self.path / "bodies"
+        self.index_path = self.path / "index.json"
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.lock = Lock()
+        self._pending: Set["asyncio.Future"] = set()  # 본문을 받는 중인 응답 기록 작업
+        if self.index_path.exists():
+            self.entries = json.loads(self.index_path.read_text(encoding="utf-8"))
+
+    def get(self, method: str, url: str, post_data: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        return self.entries.get(request_key(method, url, post_data))
+
+    def read_body(self, entry: Dict[str, Any]) -> bytes:
+        body_path = self.bodies_dir / entry["key"]
+        return body_path.read_bytes() if body_path.exists() else b""
+
+    def put(
+        self,
+        method: str,
+        url: str,
+        post_data: Optional[str],
+        status: int,
+        headers: Dict[str, str],
+        body: bytes,
+        resource_type: str
+    ) -> None:
+        key = request_key(method, url, post_data)
+        with self.lock:
+            self.bodies_dir.mkdir(parents=True, exist_ok=True)
+            (self.bodies_dir / key).write_bytes(body)
+            self.entries[key] = {
+                "key": key,
+                "method": method.upper(),
+                "url": url,
+                "status": status,
+                "headers": {k: v for k, v in headers.items() if k.lower() not in _SKIPPED_HEADERS},
+                "resource_type": resource_type,
+                "size": len(body)
+            }
+
+    def save(self) -> None:
+        with self.lock:
+            self.path.mkdir(parents=True, exist_ok=True)
+            self.index_path.write_text(json.dumps(self.entries, ensure_ascii=False, indent=1), encoding="utf-8")
+
+    def track(self, future: "asyncio.Future") -> None:
+        """응답 기록 작업 등록 (flush 가 끝날 때까지 기다림)"""
+        with self.lock:
+            self._pending.add(future)
+        future.add_done_callback(self._untrack)
+
+    def _untrack(self, future: "asyncio.Future") -> None:
+        with self.lock:
+            self._pending.discard(future)
+
+    async def flush(self) -> None:
+        """현재 루프에서 진행 중인 응답 기록이 끝나길 기다린 뒤 인덱스 저장"""
+        loop = asyncio.get_running_loop()
+        with self.lock:
+            pending = [future for future in self._pending if future.get_loop() is loop]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        self.save()
+
+
+_archives: Dict[str, CrawlArchive] = {}
+_archives_lock = Lock()
+
+
+def get_archive(path: Optional[str] = None) -> CrawlArchive:
+    """경로별 아카이브 싱글톤 (여러 크롤러가 같은 아카이브에 기록/재생)"""
+    path = path or settings.crawler_replay_archive
+    with _archives_lock:
+        if path not in _archives:
+            _archives[path] = CrawlArchive(path)
+        return _archives[path]
+
+
+async def install_replay_mode(
+    page: Page,
+    metrics: CrawlMetrics,
+    mode: Optional[str] = None,
+    archive: Optional[CrawlArchive] = None,
+    latency: Optional[float] = None
+) -> None:
+    """설정(crawler_replay_mode)에 따라 페이지에 기록 또는 재생 훅 설치
+
+    - record: 허용된 요청의 응답을 아카이브에 저장 (크롤링은 실제 사이트로 진행)
+    - replay: 아카이브에서 응답을 찾아 latency 초 지연 후 반환, 없는 요청은 차단 (네트워크 사용 안 함)
+
+    리소스 차단 정책보다 먼저 설치해야 차단 정책이 먼저 적용되고 허용된 요청만 재생된다.
+    """
+    mode = mode or settings.crawler_replay_mode
+    if mode == "off":
+        return
+    archive = archive or get_archive()
+
+    if mode == "record":
+        page.on("response", lambda response: archive.track(asyncio.ensure_future(_record_response(response, archive))))
+        # 페이지 반납 전에 finish_replay_mode 로 기록을 마치지만, 그 밖의 경로로 닫혀도 대기 중인 기록까지 저장
+        page.on("close", lambda _: asyncio.ensure_future(archive.flush()))
+        logger.info(f"📼 크롤링 기록 모드: {archive.path}")
+        return
+
+    delay = settings.crawler_replay_latency if latency is None else latency
+
+    async def replay(route: Route, request: Request):
+        entry = archive.get(request.method, request.url, request.post_data)
+        if entry is None:
+            metrics.record_request(request.resource_type, blocked=True)
+            logger.debug(f"📼 아카이브에 없는 요청 차단: {request.url}")
+            await route.abort()
+            return
+        if delay > 0:
+            await asyncio.sleep(delay)
+        body = archive.read_body(entry)
+        await route.fulfill(status=entry["status"], headers=entry["headers"], body=body)
+
+    await page.route("**/*", replay)
+    logger.info(f"📼 크롤링 재생 모드: {archive.path} (응답 지연 {delay * 1000:.0f}ms, 기록 {len(archive.entries)}건)")
+
+
+async def finish_replay_mode(mode: Optional[str] = None, archive: Optional[CrawlArchive] = None) -> None:
+    """기록 모드면 진행 중인 응답 기록을 마치고 아카이브 저장 (페이지를 닫기 전에 호출해야 본문을 받을 수 있음)"""
+    mode = mode or settings.crawler_replay_mode
+    if mode != "record":
+        return
+    try:
+        await (archive or get_archive()).flush()
+    except Exception as e:
+        logger.warning(f"📼 아카이브 저장 실패: {e}")
+
+
+async def _record_response(response: Response, archive: CrawlArchive) -> None:
+    request = response.request
+    try:
+        body = b"" if 300 <= response.status < 400 else await response.body()
+        archive.put(
+            request.method,
+            request.url,
+            request.post_data,
+            response.status,
+            await response.all_headers(),
+            body,
+            request.resource_type
+        )
+    except Exception as e:
+        logger.debug(f"📼 응답 기록 실패 ({request.url}): {e}")
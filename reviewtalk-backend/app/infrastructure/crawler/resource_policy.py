@@ -0,0 +1,104 @@
+"""
+크롤러 네트워크 리소스 차단 정책 - 크롤링 모드별로 불필요한 요청을 차단
+"""
+import re
+from dataclasses import dataclass, field
+from typing import FrozenSet, Pattern, Tuple
+
+from playwright.async_api import Page, Request, Route
+from loguru import logger
+
+from app.core.config import settings
+from app.infrastructure.crawler.metrics import CrawlMetrics
+
+
+# 광고/트래킹 스크립트 (텍스트 추출에 필요 없음)
+AD_TRACKER_PATTERNS: Tuple[str, ...] = (
+    r"google-analytics\.com",
+    r"googletagmanager\.com",
+    r"googlesyndication\.com",
+    r"doubleclick\.net",
+    r"facebook\.(net|com)/tr",
+    r"connect\.facebook\.net",
+    r"wcs\.naver\.(net|com)",
+    r"criteo\.(com|net)",
+    r"scorecardresearch\.com",
+    r"dable\.io",
+    r"mobon\.net",
+    r"ad\.danawa\.com",
+    r"adsvc\.danawa\.com",
+    r"/ads?/",
+)
+
+
+@dataclass(frozen=True)
+class ResourcePolicy:
+    """리소스 타입/URL 패턴 기반 요청 차단 정책"""
+
+    name: str
+    blocked_resource_types: FrozenSet[str]
+    blocked_url_patterns: Tuple[str, ...] = ()
+    _compiled: Tuple[Pattern, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_compiled", tuple(re.compile(p) for p in self.blocked_url_patterns))
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        if resource_type in self.blocked_resource_types:
+            return True
+        return any(pattern.search(url) for pattern in self._compiled)
+
+
+# 차단 없음 (비교 측정용)
+ALLOW_ALL_POLICY = ResourcePolicy(name="allow_all", blocked_resource_types=frozenset())
+
+
+def get_resource_policy(mode: str) -> ResourcePolicy:
+    """크롤링 모드(review / product_info / special_deals)별 차단 정책 생성
+
+    모드별 차단 리소스 타입은 settings.crawler_blocked_resource_types 로 설정한다.
+    스타일시트는 is_visible / inner_text 결과에 영향을 주므로 기본값에서 차단하지 않는다.
+    """
+    if not settings.crawler_block_resources or mode == ALLOW_ALL_POLICY.name:
+        return ALLOW_ALL_POLICY
+    return ResourcePolicy(
+        name=mode,
+        blocked_resource_types=frozenset(settings.crawler_blocked_resource_types.get(mode, [])),
+        blocked_url_patterns=AD_TRACKER_PATTERNS + tuple(settings.crawler_blocked_url_patterns)
+    )
+
+
+async def install_resource_policy(page: Page, policy: ResourcePolicy, metrics: CrawlMetrics) -> None:
+    """페이지에 요청 가로채기 정책을 설치하고 차단/허용 요청 수와 수신 바이트를 기록"""
+    page.on("requestfinished", lambda request: _record_finished(request, metrics))
+    if not (policy.blocked_resource_types or policy.blocked_url_patterns):
+        return
+
+    async def handle(route: Route, request: Request):
+        try:
+            if policy.should_block(request.resource_type, request.url):
+                metrics.record_request(request.resource_type, blocked=True)
+                await route.abort()
+            else:
+                # 먼저 설치된 핸들러(기록/재생)가 있으면 넘기고, 없으면 네트워크로 진행
+                await route.fallback()
+        except Exception as e:
+            logger.debug(f"요청 가로채기 처리 오류: {e}")
+
+    await page.route("**/*", handle)
+    logger.debug(f"🛡️ 리소스 차단 정책 적용: {policy.name}")
+
+
+async def _record_finished(request: Request, metrics: CrawlMetrics) -> None:
+    """완료된 요청의 실제 수신 크기 기록
+
+    content-length 헤더는 chunked/압축 응답에서 빠지는 경우가 많아 Playwright 가 측정한
+    전송 크기(헤더 + 인코딩된 본문)를 사용한다.
+    """
+    try:
+        sizes = await request.sizes()
+        size = max(0, sizes.get("responseHeadersSize", 0)) + max(0, sizes.get("responseBodySize", 0))
+    except Exception as e:
+        logger.debug(f"응답 크기 측정 실패: {e}")
+        size = 0
+    metrics.record_request(request.resource_type, blocked=False, size=size)
@@ -0,0 +1,113 @@
+"""
+브라우저 세션 상태 저장소 - 쿠키/localStorage 를 파일로 저장해 새 컨텍스트와 재시작 후에도 재사용
+"""
+import os
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from threading import Lock
+from typing import Any, Deque, Dict, Optional
+
+from playwright.async_api import BrowserContext
+from loguru import logger
+
+from app.core.config import settings
+
+
+# 세션 종류: 재사용한 컨텍스트 / 저장된 세션 상태로 만든 새 컨텍스트 / 빈 새 컨텍스트
+SESSION_WARM = "warm"
+SESSION_STORAGE = "storage"
+SESSION_COLD = "cold"
+
+
+class SessionStateStore:
+    """Playwright storage_state 파일 관리
+
+    - path: 저장 파일 경로 (워커 프로세스끼리 공유해도 되도록 임시 파일에 쓴 뒤 교체)
+    - max_age: 이보다 오래된 파일은 새 컨텍스트에 쓰지 않음 (초)
+    - refresh_interval: 마지막 저장 후 이 시간이 지나면 반납되는 컨텍스트의 상태로 다시 저장 (초)
+    """
+
+    def __init__(self, path: str, max_age: float = 86400.0, refresh_interval: float = 1800.0, enabled: bool = True):
+        self.path = Path(path)
+        self.max_age = max_age
+        self.refresh_interval = refresh_interval
+        self.enabled = enabled
+        self._last_saved: Optional[float] = None
+        self._navigations: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=200))
+        self.lock = Lock()
+        self.stats = {"saves": 0, "save_errors": 0}
+
+    def _file_age(self) -> Optional[float]:
+        try:
+            return time.time() - self.path.stat().st_mtime
+        except OSError:
+            return None
+
+    def load_path(self) -> Optional[str]:
+        """새 컨텍스트에 넘길 storage_state 파일 경로 (없거나 오래되면 None)"""
+        if not self.enabled:
+            return None
+        age = self._file_age()
+        if age is None or (self.max_age and age > self.max_age):
+            return None
+        return str(self.path)
+
+    def needs_refresh(self) -> bool:
+        if not self.enabled:
+            return False
+        last_saved = self._last_saved
+        if last_saved is None:
+            # 재시작 직후에는 파일 수정 시각 기준 (다른 워커 프로세스가 저장했을 수 있음)
+            age = self._file_age()
+            return age is None or age >= self.refresh_interval
+        return time.time() - last_saved >= self.refresh_interval
+
+    async def save(self, context: BrowserContext) -> bool:
+        """컨텍스트의 쿠키/localStorage 를 파일로 저장"""
+        self._last_saved = time.time()
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            await context.storage_state(path=str(tmp_path))
+            os.replace(tmp_path, self.path)
+            self.stats["saves"] += 1
+            logger.debug(f"💾 브라우저 세션 상태 저장: {self.path}")
+            return True
+        except Exception as e:
+            self.stats["save_errors"] += 1
+            logger.debug(f"브라우저 세션 상태 저장 실패: {e}")
+            return False
+
+    def record_navigation(self, session: str, seconds: float) -> None:
+        """세션 종류별 상품 페이지 로드 시간 기록 (warm/cold 비교용)"""
+        with self.lock:
+            self._navigations[session].append(seconds)
+
+    def get_status(self) -> Dict[str, Any]:
+        file_age = self._file_age()
+        with self.lock:
+            navigations = {
+                session: {
+                    "count": len(samples),
+                    "mean_seconds": round(sum(samples) / len(samples), 3)
+                }
+                for session, samples in self._navigations.items()
+                if samples
+            }
+        return {
+            "enabled": self.enabled,
+            "path": str(self.path),
+            "file_age_seconds": round(file_age, 1) if file_age is not None else None,
+            "navigations": navigations,
+            **self.stats
+        }
+
+
+# 전역 세션 상태 저장소 (브라우저 풀과 워커 프로세스가 같은 파일을 공유)
+session_state_store = SessionStateStore(
+    settings.browser_storage_state_path,
+    max_age=settings.browser_storage_state_max_age,
+    refresh_interval=settings.browser_storage_state_refresh,
+    enabled=settings.browser_storage_state_enabled
+)
@@ -1,67 +1,104 @@
 """
 다나와 오늘의 특가 페이지 크롤러
 """
-import asyncio
 import re
+import time
 from typing import List, Optional, Dict, Any
 from urllib.parse import urljoin
 
-from playwright.async_api import async_playwright, Page, Browser
+from playwright.async_api import Page
 from loguru import logger
 
+from app.infrastructure.crawler.browser_pool import BrowserPool, browser_pool
+from app.infrastructure.crawler.metrics import CrawlMetrics
+from app.infrastructure.crawler.replay import finish_replay_mode, install_replay_mode
+from app.infrastructure.crawler.resource_policy import get_resource_policy, install_resource_policy
+from app.infrastructure.crawler.waits import WaitEngine
+from app.core.config import settings
+from app.utils.rate_limiter import host_rate_limiter
 from app.models.schemas import SpecialProduct
 
 
+CONTAINER_SELECTOR = "#cmPick-category-container"
+# 문서의 경로: #cmPick-category-item-42124 > div > a
+ITEM_SELECTOR = f"{CONTAINER_SELECTOR} [id*='cmPick-category-item-'] > div > a"
+
+# 특가 상품 카드(최대 limit 개)를 브라우저 안에서 한 번에 읽어 JSON 배열로 반환
+# 가격 문자열도 같은 패스에서 정규화한다 (할인율 "12%", 가격 "12,340원")
+# 예: a > div.box__thumbnail > img (이미지)
+#     a > div.box__info > div.box__title (상품명)
+#     a > div.box__info > div.box__price (할인율, 특가, 원래 가격 순)
+EXTRACT_SPECIAL_PRODUCTS_SCRIPT = """
+([selector, limit]) => {
+    const pricePattern = /[\\d,]+원/g;
+    const firstPrice = (element) => {
+        const match = element ? (element.innerText || '').match(/[\\d,]+원/) : null;
+        return match ? match[0] : null;
+    };
+    return Array.from(document.querySelectorAll(selector)).slice(0, limit).map((link) => {
+        const image = link.querySelector('div.box__thumbnail > img');
+        const title = link.querySelector('div.box__info > div.box__title');
+        const priceContainer = link.querySelector('div.box__info > div.box__price');
+        const priceText = (priceContainer || link).innerText || '';
+        const prices = priceText.match(pricePattern) || [];
+        const discount = priceText.match(/(\\d+)%/);
+        let price = prices[0] || null;
+        let originalPrice = prices[1] || null;
+        if (!price && priceContainer) {
+            price = firstPrice(priceContainer.querySelector('span.price, .price_current, .price-current'));
+            originalPrice = firstPrice(priceContainer.querySelector('span.price_origin, .price-origin, .original-price'));
+        }
+        return {
+            url: link.getAttribute('href'),
+            image: image ? image.getAttribute('src') : null,
+            title: title ? (title.innerText || '').trim() : null,
+            price: price,
+            original_price: originalPrice,
+            discount_rate: discount ? `${discount[1]}%` : null
+        };
+    });
+}
+"""
+
+
 class SpecialDealsCrawler:
     """다나와 오늘의 특가 페이지 크롤러"""
     
-    def __init__(self):
-        self.browser: Optional[Browser] = None
+    def __init__(self, pool: Optional[BrowserPool] = None, resource_mode: str = "special_deals"):
+        self.pool = pool or browser_pool
+        self.resource_policy = get_resource_policy(resource_mode)
         self.page: Optional[Page] = None
-        self.playwright = None
+        self._lease = None
+        self.metrics = CrawlMetrics()
+        self.waits: Optional[WaitEngine] = None
         self.base_url = "https://m.danawa.com"
         self.special_deals_url = "https://m.danawa.com/leftPanel/cmPick.html"
     
     async def __aenter__(self):
-        """비동기 컨텍스트 매니저 진입"""
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(
-            headless=True,
-            args=[
-                '--disable-dev-shm-usage', 
-                '--no-sandbox', 
-                '--disable-gpu',
-                '--disable-web-security',
-                '--disable-features=VizDisplayCompositor',
-                '--user-agent=Mozilla/5.0 (iPhone; CPU iPhone OS 14_7_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.2 Mobile/15E148 Safari/604.1'
-            ]
-        )
-        
-        context = await self.browser.new_context(
-            viewport={'width': 375, 'height': 667},  # 모바일 뷰포트
-            user_agent='Mozilla/5.0 (iPhone; CPU iPhone OS 14_7_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.2 Mobile/15E148 Safari/604.1',
-            extra_http_headers={
-                'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
-            }
-        )
-        
-        self.page = await context.new_page()
+        """비동기 컨텍스트 매니저 진입 - 브라우저 풀에서 페이지 임대"""
+        self._lease = self.pool.lease()
+        self.page = await self._lease.__aenter__()
+        self.waits = WaitEngine(self.page, self.metrics)
+        self.metrics.session = self.pool.session_kind(self.page.context)
+        # 재생 훅을 먼저 설치해야 차단 정책이 먼저 적용되고 허용된 요청만 재생/기록된다
+        await install_replay_mode(self.page, self.metrics)
+        await install_resource_policy(self.page, self.resource_policy, self.metrics)
         self.page.set_default_timeout(60000)  # 60초
         
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """비동기 컨텍스트 매니저 종료"""
+        """비동기 컨텍스트 매니저 종료 - 임대한 페이지 반납"""
         try:
-            if self.page:
-                await self.page.close()
-            if self.browser:
-                await self.browser.close()
-            if self.playwright:
-                await self.playwright.stop()
+            if self._lease:
+                await finish_replay_mode()
+                await self._lease.__aexit__(exc_type, exc_val, exc_tb)
         except Exception as e:
             logger.error(f"브라우저 종료 오류: {e}")
+        finally:
+            self.page = None
+            self.waits = None
+            self._lease = None
     
     async def crawl_special_deals(self, max_products: int = 50) -> List[SpecialProduct]:
         """다나와 오늘의 특가 상품 크롤링"""
@@ -71,135 +108,112 @@ class SpecialDealsCrawler:
             logger.info(f"🚀 다나와 특가 페이지 접근: {self.special_deals_url}")
             
             # 특가 페이지로 이동
-            await self.page.goto(self.special_deals_url, wait_until='domcontentloaded', timeout=60000)
-            await asyncio.sleep(3)
+            with self.metrics.stage("navigate"):
+                self.metrics.navigations += 1
+                delay = await host_rate_limiter.acquire(self.special_deals_url)
+                if delay > 0:
+                    self.metrics.record_wait("rate_limit", delay, True)
+                await self.page.goto(self.special_deals_url, wait_until='domcontentloaded', timeout=60000)
+                await self.waits.for_selector(
+                    CONTAINER_SELECTOR,
+                    name="deals_ready",
+                    timeout=settings.crawler_page_ready_timeout
+                )
             logger.info("✅ 특가 페이지 로드 완료")
             
             # 페이지 스크롤하여 콘텐츠 로드
-            await self._scroll_to_load_content()
+            with self.metrics.stage("scroll"):
+                await self._scroll_to_load_content(max_products)
             
             # 특가 상품 목록 크롤링
-            products = await self._extract_special_products(max_products)
+            with self.metrics.stage("extract_products"):
+                products = await self._extract_special_products(max_products)
             
             logger.info(f"🎉 총 {len(products)}개의 특가 상품을 수집했습니다!")
+            logger.info(f"⏱️ 크롤링 단계별 시간: {self.metrics.summary()}")
             
         except Exception as e:
             logger.error(f"❌ 특가 상품 크롤링 오류: {e}")
             
         return products
     
-    async def _scroll_to_load_content(self):
-        """스크롤하여 더 많은 콘텐츠 로드"""
+    async def _scroll_to_load_content(self, max_products: Optional[int] = None):
+        """특가 카드 수/문서 높이가 더 이상 변하지 않거나 max_products 개가 로드될 때까지 스크롤"""
         try:
             logger.info("📜 페이지 스크롤 중...")
-            for i in range(5):  # 특가 상품이 많을 수 있으므로 더 많이 스크롤
-                await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                await asyncio.sleep(2)
-            logger.info("✅ 스크롤 완료")
+            result = await self.waits.scroll_until_stable(
+                ITEM_SELECTOR,
+                target_items=max_products,
+                max_scrolls=settings.crawler_max_scrolls,
+                settle_timeout=settings.crawler_scroll_settle_timeout
+            )
+            self.metrics.scroll = result
+            logger.info(
+                f"✅ 스크롤 완료: {result['scrolls']}회, 대기 {result['wait_seconds']:.2f}s, "
+                f"상품 {result['items']}개 ({result['stop_reason']})"
+            )
         except Exception as e:
             logger.error(f"❌ 스크롤 오류: {e}")
     
     async def _extract_special_products(self, max_products: int) -> List[SpecialProduct]:
-        """특가 상품 정보 추출"""
+        """특가 상품 정보 추출 (page.evaluate 1회로 전체 카드 수집)"""
         products = []
         
         try:
-            # 특가 상품 컨테이너 선택자 (문서에서 제공된 경로 기반)
-            container_selector = "#cmPick-category-container"
-            
             # 컨테이너가 로드될 때까지 대기
-            await self.page.wait_for_selector(container_selector, timeout=30000)
-            
-            # 특가 상품 아이템들 선택
-            # 문서의 경로: #cmPick-category-item-42124 > div > a
-            # 일반화된 선택자 사용
-            item_selector = f"{container_selector} [id*='cmPick-category-item-'] > div > a"
-            
-            # 모든 특가 상품 링크 수집
-            product_links = await self.page.query_selector_all(item_selector)
-            logger.info(f"🔍 발견된 특가 상품 링크: {len(product_links)}개")
+            await self.page.wait_for_selector(CONTAINER_SELECTOR, timeout=30000)
             
-            # 최대 개수만큼 처리
-            process_count = min(len(product_links), max_products)
+            rows = await self.page.evaluate(EXTRACT_SPECIAL_PRODUCTS_SCRIPT, [ITEM_SELECTOR, max_products])
+            logger.info(f"🔍 발견된 특가 상품 카드: {len(rows)}개")
             
-            for i in range(process_count):
-                try:
-                    link = product_links[i]
-                    
-                    # 상품 정보 추출
-                    product_info = await self._extract_product_info_from_link(link, i)
-                    
-                    if product_info:
-                        products.append(product_info)
-                        logger.info(f"✅ 상품 {i+1}/{process_count}: {product_info.product_name}")
-                    
-                    # 각 상품 처리 후 짧은 대기
-                    await asyncio.sleep(0.5)
-                    
-                except Exception as e:
-                    logger.error(f"❌ 상품 {i+1} 처리 오류: {e}")
-                    continue
+            products = self.map_product_rows(rows)
+            for i, product in enumerate(products):
+                logger.debug(f"✅ 상품 {i+1}/{len(products)}: {product.product_name}")
             
         except Exception as e:
             logger.error(f"❌ 특가 상품 추출 오류: {e}")
         
         return products
     
-    async def _extract_product_info_from_link(self, link_element, index: int) -> Optional[SpecialProduct]:
-        """개별 상품 링크에서 정보 추출"""
-        try:
-            # 상품 URL 추출
-            product_url = await link_element.get_attribute('href')
+    def map_product_rows(self, rows: List[Dict[str, Any]]) -> List[SpecialProduct]:
+        """EXTRACT_SPECIAL_PRODUCTS_SCRIPT 결과(JSON 배열)를 SpecialProduct 목록으로 변환"""
+        products = []
+        
+        for index, row in enumerate(rows):
+            # 상품 URL 추출 (상대 경로를 절대 경로로 변환)
+            product_url = row.get('url')
             if not product_url:
-                return None
-            
-            # 상대 경로를 절대 경로로 변환
+                continue
             if product_url.startswith('/'):
                 product_url = urljoin(self.base_url, product_url)
             
             # 상품 ID 추출 (URL에서)
             product_id = self._extract_product_id_from_url(product_url)
             if not product_id:
-                product_id = f"special_{index}_{int(asyncio.get_event_loop().time())}"
-            
-            # 상품 이미지 URL 추출 (구체적인 선택자 사용)
-            image_url = None
-            img_element = await link_element.query_selector("div.box__thumbnail > img")
-            if img_element:
-                image_url = await img_element.get_attribute('src')
-                if image_url and image_url.startswith('/'):
-                    image_url = urljoin(self.base_url, image_url)
-                elif image_url and image_url.startswith('//'):
-                    image_url = f"https:{image_url}"
-            
-            # 상품명 추출 (구체적인 선택자 사용)
-            product_name = None
-            title_element = await link_element.query_selector("div.box__info > div.box__title")
-            if title_element:
-                product_name = await title_element.inner_text()
-                product_name = product_name.strip() if product_name else None
+                product_id = f"special_{index}_{int(time.time())}"
             
-            # 가격 정보 추출 (구체적인 선택자 사용)
-            price_info = await self._extract_detailed_price_info(link_element)
+            image_url = row.get('image')
+            if image_url and image_url.startswith('//'):
+                image_url = f"https:{image_url}"
+            elif image_url and image_url.startswith('/'):
+                image_url = urljoin(self.base_url, image_url)
             
-            return SpecialProduct(
+            products.append(SpecialProduct(
                 product_id=product_id,
-                product_name=product_name or f"특가상품 {index+1}",
+                product_name=row.get('title') or f"특가상품 {index+1}",
                 product_url=product_url,
                 image_url=image_url,
-                price=price_info.get('price'),
-                original_price=price_info.get('original_price'),
-                discount_rate=price_info.get('discount_rate'),
+                price=row.get('price'),
+                original_price=row.get('original_price'),
+                discount_rate=row.get('discount_rate'),
                 brand=None,  # 특가 페이지에서는 브랜드 정보가 제한적
                 category="특가상품",
                 rating=None,
                 review_count=0,
                 is_crawled=False
-            )
-            
-        except Exception as e:
-            logger.error(f"❌ 상품 정보 추출 오류: {e}")
-            return None
+            ))
+        
+        return products
     
     def _extract_product_id_from_url(self, url: str) -> Optional[str]:
         """URL에서 상품 ID 추출"""
@@ -222,104 +236,12 @@ class SpecialDealsCrawler:
             return None
         except:
             return None
-    
-    async def _extract_text_from_element(self, element, description: str) -> Optional[str]:
-        """요소에서 텍스트 추출"""
-        try:
-            text = await element.inner_text()
-            return text.strip() if text else None
-        except:
-            return None
-    
-    async def _extract_price_info(self, element) -> Dict[str, Optional[str]]:
-        """가격 정보 추출 (기존 방식)"""
-        price_info = {
-            'price': None,
-            'original_price': None,
-            'discount_rate': None
-        }
-        
-        try:
-            # 가격 관련 텍스트 추출 시도
-            text_content = await element.inner_text()
-            
-            # 원 단위 가격 추출
-            price_matches = re.findall(r'[\d,]+원', text_content)
-            if price_matches:
-                price_info['price'] = price_matches[0]
-                if len(price_matches) > 1:
-                    price_info['original_price'] = price_matches[1]
-            
-            # 할인율 추출
-            discount_match = re.search(r'(\d+)%', text_content)
-            if discount_match:
-                price_info['discount_rate'] = f"{discount_match.group(1)}%"
-                
-        except Exception as e:
-            logger.debug(f"가격 정보 추출 오류: {e}")
-        
-        return price_info
-    
-    async def _extract_detailed_price_info(self, element) -> Dict[str, Optional[str]]:
-        """구체적인 선택자를 사용한 가격 정보 추출"""
-        price_info = {
-            'price': None,
-            'original_price': None,
-            'discount_rate': None
-        }
-        
-        try:
-            # 가격 컨테이너 찾기
-            price_container = await element.query_selector("div.box__info > div.box__price")
-            if not price_container:
-                # 대체 방법으로 기존 방식 사용
-                return await self._extract_price_info(element)
-            
-            # 가격 컨테이너 내의 모든 텍스트 가져오기
-            price_text = await price_container.inner_text()
-            
-            # 할인율 추출
-            discount_match = re.search(r'(\d+)%', price_text)
-            if discount_match:
-                price_info['discount_rate'] = f"{discount_match.group(1)}%"
-            
-            # 가격 정보 추출 (여러 패턴 시도)
-            price_matches = re.findall(r'[\d,]+원', price_text)
-            if price_matches:
-                if len(price_matches) >= 2:
-                    # 첫 번째가 할인 가격, 두 번째가 원래 가격인 경우가 많음
-                    price_info['price'] = price_matches[0]
-                    price_info['original_price'] = price_matches[1]
-                else:
-                    price_info['price'] = price_matches[0]
-            
-            # 더 구체적인 선택자로 시도
-            if not price_info['price']:
-                # 현재 가격 찾기
-                current_price_elem = await price_container.query_selector("span.price, .price_current, .price-current")
-                if current_price_elem:
-                    current_price_text = await current_price_elem.inner_text()
-                    price_match = re.search(r'([\d,]+원)', current_price_text)
-                    if price_match:
-                        price_info['price'] = price_match.group(1)
-                
-                # 원래 가격 찾기
-                original_price_elem = await price_container.query_selector("span.price_origin, .price-origin, .original-price")
-                if original_price_elem:
-                    original_price_text = await original_price_elem.inner_text()
-                    price_match = re.search(r'([\d,]+원)', original_price_text)
-                    if price_match:
-                        price_info['original_price'] = price_match.group(1)
-                
-        except Exception as e:
-            logger.debug(f"상세 가격 정보 추출 오류: {e}")
-            # 오류 발생시 기존 방식으로 대체
-            return await self._extract_price_info(element)
-        
-        return price_info
 
 
-async def crawl_special_deals(max_products: int = 50) -> List[SpecialProduct]:
+async def crawl_special_deals(
+    max_products: int = 50,
+    pool: Optional[BrowserPool] = None
+) -> List[SpecialProduct]:
     """다나와 특가 상품 크롤링 함수"""
-    async with SpecialDealsCrawler() as crawler:
+    async with SpecialDealsCrawler(pool=pool) as crawler:
         return await crawler.crawl_special_deals(max_products) 
\ No newline at end of file
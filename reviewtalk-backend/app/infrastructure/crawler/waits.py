@@ -0,0 +1,197 @@
+"""
+크롤러 대기 엔진 - 고정 sleep 대신 조건이 충족되는 즉시 반환하는 대기 계층
+"""
+import asyncio
+import time
+from collections import defaultdict, deque
+from threading import Lock
+from typing import Awaitable, Callable, Deque, Dict, Any, Optional
+
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+from loguru import logger
+
+from app.infrastructure.crawler.metrics import CrawlMetrics
+
+
+# 스크롤 수렴 판단용 현재 상태 (항목 수, 문서 높이)
+SCROLL_STATE_SCRIPT = """
+(selector) => ({
+    count: selector ? document.querySelectorAll(selector).length : 0,
+    height: document.body.scrollHeight
+})
+"""
+
+# 스크롤 후 항목 수나 문서 높이가 늘었는지
+SCROLL_CHANGED_SCRIPT = """
+([selector, count, height]) => document.body.scrollHeight > height
+    || (!!selector && document.querySelectorAll(selector).length > count)
+"""
+
+
+class WaitStatistics:
+    """프로세스 전체 대기 시간 통계 (타임아웃 튜닝용)"""
+
+    def __init__(self, max_samples: int = 500):
+        self.max_samples = max_samples
+        self._samples: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=self.max_samples))
+        self._timeouts: Dict[str, int] = defaultdict(int)
+        self._counts: Dict[str, int] = defaultdict(int)
+        self.lock = Lock()
+
+    def record(self, name: str, elapsed: float, satisfied: bool) -> None:
+        with self.lock:
+            self._samples[name].append(elapsed)
+            self._counts[name] += 1
+            if not satisfied:
+                self._timeouts[name] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """대기 이름별 횟수, 타임아웃 수, 평균/p95/최대 소요 시간"""
+        with self.lock:
+            result = {}
+            for name, samples in self._samples.items():
+                ordered = sorted(samples)
+                p95_index = max(0, int(len(ordered) * 0.95) - 1)
+                result[name] = {
+                    "count": self._counts[name],
+                    "timeouts": self._timeouts[name],
+                    "mean_seconds": round(sum(ordered) / len(ordered), 3),
+                    "p95_seconds": round(ordered[p95_index], 3),
+                    "max_seconds": round(ordered[-1], 3)
+                }
+            return result
+
+
+# 전역 대기 통계 인스턴스
+wait_statistics = WaitStatistics()
+
+
+class WaitEngine:
+    """페이지 상태 기반 대기 (조건 충족 즉시 반환, 실제 대기 시간 기록)"""
+
+    def __init__(self, page: Page, metrics: CrawlMetrics):
+        self.page = page
+        self.metrics = metrics
+
+    async def for_selector(self, selector: str, name: str, timeout: float = 10.0, state: str = "attached") -> bool:
+        """선택자에 해당하는 요소가 나타날 때까지 대기"""
+        async def condition():
+            await self.page.wait_for_selector(selector, state=state, timeout=timeout * 1000)
+        return await self._timed(name, timeout, condition)
+
+    async def for_count_increase(self, selector: str, previous: int, name: str, timeout: float = 10.0) -> int:
+        """선택자 요소 개수가 previous 보다 커질 때까지 대기 후 현재 개수 반환"""
+        async def condition():
+            await self.page.wait_for_function(
+                "([selector, previous]) => document.querySelectorAll(selector).length > previous",
+                arg=[selector, previous],
+                timeout=timeout * 1000
+            )
+        await self._timed(name, timeout, condition)
+        return await self.page.evaluate("(selector) => document.querySelectorAll(selector).length", selector)
+
+    async def for_value_increase(self, expression: str, previous: int, name: str, timeout: float = 10.0) -> int:
+        """페이지 JS 식(expression)의 값이 previous 보다 커질 때까지 대기 후 현재 값 반환
+
+        DOM 을 다시 훑지 않는 카운터(예: MutationObserver 로 유지하는 값)를 기다릴 때 사용한다.
+        """
+        async def condition():
+            await self.page.wait_for_function(
+                f"(previous) => ({expression}) > previous",
+                arg=previous,
+                timeout=timeout * 1000
+            )
+        await self._timed(name, timeout, condition)
+        return await self.page.evaluate(f"() => {expression}")
+
+    async def scroll_until_stable(
+        self,
+        item_selector: Optional[str] = None,
+        target_items: Optional[int] = None,
+        max_scrolls: int = 10,
+        settle_timeout: float = 1.0,
+        name: str = "scroll"
+    ) -> Dict[str, Any]:
+        """페이지 끝까지 스크롤을 반복하되 항목 수/문서 높이가 더 이상 변하지 않으면 즉시 중단
+
+        target_items 가 주어지면 item_selector 항목이 그만큼 로드된 시점에 중단한다.
+        스크롤 횟수, 대기 시간, 마지막 항목 수/높이, 종료 사유를 반환한다.
+        """
+        started = time.perf_counter()
+        waited = 0.0
+        scrolls = 0
+        reason = "max_scrolls"
+        state = await self.page.evaluate(SCROLL_STATE_SCRIPT, item_selector)
+        while scrolls < max_scrolls:
+            if target_items and state["count"] >= target_items:
+                reason = "target_reached"
+                break
+            await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            scrolls += 1
+
+            async def condition():
+                await self.page.wait_for_function(
+                    SCROLL_CHANGED_SCRIPT,
+                    arg=[item_selector, state["count"], state["height"]],
+                    timeout=settle_timeout * 1000
+                )
+            wait_started = time.perf_counter()
+            changed = await self._timed(f"{name}_settle", settle_timeout, condition)
+            waited += time.perf_counter() - wait_started
+            state = await self.page.evaluate(SCROLL_STATE_SCRIPT, item_selector)
+            if not changed:
+                reason = "converged"
+                break
+
+        return {
+            "scrolls": scrolls,
+            "wait_seconds": round(waited, 3),
+            "total_seconds": round(time.perf_counter() - started, 3),
+            "items": state["count"],
+            "height": state["height"],
+            "stop_reason": reason
+        }
+
+    async def for_network_idle(self, name: str, timeout: float = 5.0) -> bool:
+        """네트워크 요청이 잠잠해질 때까지 대기"""
+        async def condition():
+            await self.page.wait_for_load_state("networkidle", timeout=timeout * 1000)
+        return await self._timed(name, timeout, condition)
+
+    async def until(
+        self,
+        predicate: Callable[[], Awaitable[bool]],
+        name: str,
+        timeout: float = 10.0,
+        initial_delay: float = 0.1,
+        max_delay: float = 1.0,
+        backoff: float = 2.0
+    ) -> bool:
+        """임의 조건을 지수 백오프로 폴링하며 대기"""
+        async def condition():
+            delay = initial_delay
+            deadline = time.perf_counter() + timeout
+            while not await predicate():
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    raise PlaywrightTimeoutError(f"{name} 조건 대기 시간 초과")
+                await asyncio.sleep(min(delay, remaining))
+                delay = min(delay * backoff, max_delay)
+        return await self._timed(name, timeout, condition)
+
+    async def _timed(self, name: str, timeout: float, condition: Callable[[], Awaitable[Optional[Any]]]) -> bool:
+        started = time.perf_counter()
+        satisfied = True
+        try:
+            await condition()
+        except PlaywrightTimeoutError:
+            satisfied = False
+        elapsed = time.perf_counter() - started
+
+        self.metrics.record_wait(name, elapsed, satisfied)
+        wait_statistics.record(name, elapsed, satisfied)
+        if satisfied:
+            logger.debug(f"⏳ 대기 [{name}] {elapsed:.2f}s")
+        else:
+            logger.debug(f"⌛ 대기 [{name}] 시간 초과 ({timeout:.1f}s)")
+        return satisfied
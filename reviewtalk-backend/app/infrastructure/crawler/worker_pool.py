@@ -0,0 +1,492 @@
+"""
+크롤러 워커 프로세스 풀 - Playwright 크롤링을 API 프로세스 밖(별도 프로세스)에서 실행
+
+각 워커 프로세스는 자체 이벤트 루프와 브라우저 풀을 갖고 작업을 1건씩 처리한다.
+API 프로세스와는 Pipe 로 메시지를 주고받는다.
+    API → 워커: ("crawl", kind, url, max_reviews, known_review_ids) / ("stop",)
+    워커 → API: ("progress", stage, count) / ("batch", ReviewBatch) / ("result", ProductCrawlResult)
+                / ("done",) / ("error", message)
+"""
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from typing import AbstractSet, Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from app.core.config import settings
+from app.infrastructure.crawler.browser_pool import BrowserPool, browser_pool
+from app.infrastructure.crawler.danawa_crawler import ProgressCallback, ReviewBatch
+from app.infrastructure.crawler.http_review_fetcher import (
+    crawl_product_with_fallback,
+    http_review_fetcher,
+    iter_review_batches_with_fallback,
+)
+from app.models.schemas import ProductCrawlResult
+from app.utils.rate_limiter import host_rate_limiter
+
+
+# fork 는 부모의 이벤트 루프/스레드 상태를 복제하므로 항상 spawn 사용
+_mp_context = multiprocessing.get_context("spawn")
+
+
+def process_tree_rss_mb(pid: int) -> float:
+    """프로세스와 모든 하위 프로세스(Chromium 포함)의 RSS 합계 (MB, /proc 이 없으면 0)"""
+    try:
+        parents: Dict[int, int] = {}
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat") as f:
+                    stat = f.read()
+                parents[int(entry)] = int(stat[stat.rfind(")") + 2:].split()[1])
+            except (OSError, ValueError, IndexError):
+                continue
+
+        tree = {pid}
+        changed = True
+        while changed:
+            children = {child for child, parent in parents.items() if parent in tree and child not in tree}
+            tree |= children
+            changed = bool(children)
+
+        page_size = os.sysconf("SC_PAGE_SIZE")
+        total = 0
+        for member in tree:
+            try:
+                with open(f"/proc/{member}/statm") as f:
+                    total += int(f.read().split()[1]) * page_size
+            except (OSError, ValueError, IndexError):
+                continue
+        return total / (1024 * 1024)
+    except OSError:
+        return 0.0
+
+
+class _WorkerProcess:
+    """워커 프로세스 1개와 연결 파이프"""
+
+    def __init__(self, index: int, worker_count: int):
+        self.index = index
+        self.worker_count = worker_count
+        self.process = None
+        self.conn = None
+        self.jobs = 0
+        self.generation = 0
+        self.last_rss_mb = 0.0
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.process.pid if self.process else None
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+    def start(self):
+        parent_conn, child_conn = _mp_context.Pipe()
+        self.process = _mp_context.Process(
+            target=_worker_main,
+            args=(child_conn, self.worker_count),
+            name=f"crawler-worker-{self.index}",
+            daemon=True
+        )
+        self.process.start()
+        # 자식 쪽 연결을 닫아야 워커가 죽었을 때 recv 가 EOFError 로 끝난다
+        child_conn.close()
+        self.conn = parent_conn
+        self.jobs = 0
+        self.generation += 1
+        self.last_rss_mb = 0.0
+
+    def stop(self, graceful: bool = True, timeout: float = 10.0):
+        """워커 종료 (graceful 이면 stop 메시지로 브라우저를 정리하게 한 뒤 대기)"""
+        if self.process is None:
+            return
+        try:
+            if graceful and self.process.is_alive():
+                self.conn.send(("stop",))
+                self.process.join(timeout)
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join(5)
+            if self.process.is_alive():
+                self.process.kill()
+                self.process.join(5)
+        except Exception as e:
+            logger.debug(f"크롤러 워커 {self.index} 종료 오류: {e}")
+        finally:
+            try:
+                self.conn.close()
+            except Exception:
+                pass
+            self.process = None
+            self.conn = None
+
+
+class CrawlerWorkerPool:
+    """별도 프로세스에서 크롤링을 실행하는 워커 풀
+
+    - workers: 워커 프로세스 수 (0 이면 비활성화, 기존처럼 API 프로세스 안에서 크롤링)
+    - max_rss_mb: 작업 후 워커(브라우저 포함) 메모리가 이 값을 넘으면 워커를 재시작
+    - max_jobs: 워커 1개가 처리할 최대 작업 수 (초과 시 재시작)
+
+    작업 도중 워커가 죽으면 해당 작업은 실패로 끝나고 워커는 새로 띄운다.
+    유휴 워커가 없으면 대기자 Future 를 등록하고, 워커가 반납되면 대기자의 루프로 넘겨준다
+    (워커 교체 스레드나 다른 이벤트 루프에서 반납해도 안전).
+    워커가 도는 동안 API 프로세스의 호스트 속도 제한은 워커 수 + 1 등분 중 1몫으로 줄인다.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        max_rss_mb: Optional[float] = None,
+        max_jobs: Optional[int] = None
+    ):
+        self.workers = max(0, settings.crawler_worker_processes if workers is None else workers)
+        self.max_rss_mb = settings.crawler_worker_max_rss_mb if max_rss_mb is None else max_rss_mb
+        self.max_jobs = max(1, max_jobs or settings.crawler_worker_max_jobs)
+        self._workers: List[_WorkerProcess] = []
+        self._idle: Deque[_WorkerProcess] = deque()
+        self._waiters: Deque["asyncio.Future[_WorkerProcess]"] = deque()
+        self._running = False
+        self.stats = {"jobs": 0, "failed_jobs": 0, "crash_restarts": 0, "memory_recycles": 0, "job_recycles": 0}
+        self.lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    async def start(self):
+        """워커 프로세스 구동"""
+        if not self.enabled or self._running:
+            return
+        self._workers = [_WorkerProcess(index, self.workers) for index in range(self.workers)]
+        for worker in self._workers:
+            worker.start()
+            self._idle.append(worker)
+        # 워커마다 속도 제한기가 따로 있으므로 API 프로세스도 한 몫만 사용해 호스트별 전체 속도를 유지
+        host_rate_limiter.scale(1 / (self.workers + 1))
+        self._running = True
+        logger.info(
+            f"✅ 크롤러 워커 프로세스 {self.workers}개 시작 "
+            f"(메모리 상한 {self.max_rss_mb:.0f}MB, 워커당 작업 {self.max_jobs}건마다 재시작)"
+        )
+
+    async def stop(self):
+        """모든 워커 프로세스 종료"""
+        if not self._running:
+            return
+        self._running = False
+        host_rate_limiter.scale(self.workers + 1)
+        with self.lock:
+            waiters, self._waiters = list(self._waiters), deque()
+        for waiter in waiters:
+            self._call_in_loop(waiter, self._fail_waiter, waiter)
+        await asyncio.gather(*(asyncio.to_thread(worker.stop) for worker in self._workers))
+        self._idle = deque()
+        logger.info("🛑 크롤러 워커 프로세스 종료")
+
+    async def iter_review_batches(
+        self,
+        product_url: str,
+        max_reviews: int = 100,
+        known_review_ids: Optional[AbstractSet[str]] = None,
+        on_progress: Optional[ProgressCallback] = None,
+        resume_from: int = 0
+    ) -> AsyncIterator[ReviewBatch]:
+        """워커 프로세스에서 iter_review_batches_with_fallback 를 실행하고 배치를 순서대로 반환"""
+        async for kind, payload in self._run_job(
+            "batches", product_url, max_reviews, known_review_ids, on_progress, resume_from
+        ):
+            if kind == "batch":
+                yield payload
+
+    async def crawl_product(
+        self,
+        product_url: str,
+        max_reviews: int = 100,
+        known_review_ids: Optional[AbstractSet[str]] = None,
+        on_progress: Optional[ProgressCallback] = None
+    ) -> ProductCrawlResult:
+        """워커 프로세스에서 crawl_product_with_fallback 를 실행 (워커 오류는 실패 결과로 반환)"""
+        result = None
+        try:
+            # done 메시지까지 끝까지 읽어야 워커가 정상 종료된 것으로 보고 재사용한다
+            async for kind, payload in self._run_job("product", product_url, max_reviews, known_review_ids, on_progress):
+                if kind == "result":
+                    result = payload
+            if result is None:
+                raise RuntimeError("크롤러 워커가 결과 없이 종료되었습니다")
+            return result
+        except Exception as e:
+            logger.error(f"크롤링 전체 오류: {e}")
+            return ProductCrawlResult(success=False, product_id="error", product_name="Error", error_message=str(e))
+
+    async def _run_job(
+        self,
+        kind: str,
+        product_url: str,
+        max_reviews: int,
+        known_review_ids: Optional[AbstractSet[str]],
+        on_progress: Optional[ProgressCallback],
+        resume_from: int = 0
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        if not self._running:
+            raise RuntimeError("크롤러 워커 풀이 시작되지 않았습니다")
+
+        worker = await self._acquire()
+        finished = False
+        succeeded = False
+        try:
+            known = set(known_review_ids) if known_review_ids is not None else None
+            worker.conn.send(("crawl", kind, str(product_url), max_reviews, known, resume_from))
+            while True:
+                try:
+                    message = await asyncio.to_thread(worker.conn.recv)
+                except (EOFError, OSError):
+                    raise RuntimeError(f"크롤러 워커 {worker.index} 프로세스가 비정상 종료되었습니다")
+
+                if message[0] == "progress":
+                    if on_progress:
+                        try:
+                            on_progress(message[1], message[2])
+                        except Exception as e:
+                            logger.debug(f"진행 상황 콜백 오류 ({message[1]}): {e}")
+                elif message[0] == "error":
+                    finished = True
+                    raise RuntimeError(message[1])
+                elif message[0] == "done":
+                    finished = True
+                    succeeded = True
+                    return
+                else:
+                    yield message[0], message[1]
+        finally:
+            self._release(worker, finished, succeeded)
+
+    async def _acquire(self) -> _WorkerProcess:
+        with self.lock:
+            if self._idle:
+                worker = self._idle.popleft()
+                waiter = None
+            else:
+                waiter = asyncio.get_running_loop().create_future()
+                self._waiters.append(waiter)
+
+        if waiter is not None:
+            try:
+                worker = await waiter
+            except asyncio.CancelledError:
+                # 워커를 넘겨받은 직후 취소되었으면 워커를 잃어버리지 않도록 다시 반납
+                if waiter.done() and not waiter.cancelled() and waiter.exception() is None:
+                    self._put_idle(waiter.result())
+                raise
+
+        if not worker.is_alive():
+            logger.warning(f"💥 크롤러 워커 {worker.index} 가 유휴 중 종료됨 - 재시작")
+            with self.lock:
+                self.stats["crash_restarts"] += 1
+            await asyncio.to_thread(self._restart, worker)
+        return worker
+
+    @staticmethod
+    def _restart(worker: _WorkerProcess):
+        worker.stop(graceful=False)
+        worker.start()
+
+    def _put_idle(self, worker: _WorkerProcess):
+        """워커를 가장 오래 기다린 대기자에게 넘기거나 유휴 큐에 반납 (어느 스레드에서든 호출 가능)"""
+        with self.lock:
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                if not waiter.done() and self._call_in_loop(waiter, self._hand_over, waiter, worker):
+                    return
+            self._idle.append(worker)
+
+    @staticmethod
+    def _call_in_loop(waiter: "asyncio.Future", callback, *args) -> bool:
+        try:
+            waiter.get_loop().call_soon_threadsafe(callback, *args)
+            return True
+        except RuntimeError:
+            # 대기자의 루프가 이미 닫힘
+            return False
+
+    def _hand_over(self, waiter: "asyncio.Future[_WorkerProcess]", worker: _WorkerProcess):
+        # 대기자의 루프에서 실행 - 그 사이 취소된 대기자면 다음 대기자에게 넘김
+        if waiter.done():
+            self._put_idle(worker)
+        else:
+            waiter.set_result(worker)
+
+    @staticmethod
+    def _fail_waiter(waiter: "asyncio.Future"):
+        if not waiter.done():
+            waiter.set_exception(RuntimeError("크롤러 워커 풀이 종료되었습니다"))
+
+    def _release(self, worker: _WorkerProcess, finished: bool, succeeded: bool = True):
+        """작업 종료 후 워커를 유휴 큐에 반납하거나 백그라운드에서 교체"""
+        worker.jobs += 1
+        with self.lock:
+            self.stats["jobs"] += 1
+            if not (finished and succeeded):
+                self.stats["failed_jobs"] += 1
+
+        if not self._running:
+            return
+
+        if not finished:
+            # 작업 중 죽었거나, 취소/타임아웃으로 중간에 멈춘 워커는 상태를 알 수 없으므로 교체
+            self._recycle(worker, "crash_restarts", graceful=False)
+        elif worker.jobs >= self.max_jobs:
+            self._recycle(worker, "job_recycles")
+        elif self.max_rss_mb > 0 and worker.pid is not None:
+            # /proc 전체를 훑는 측정은 이벤트 루프를 막지 않도록 별도 스레드에서 한 뒤 반납
+            threading.Thread(target=self._check_memory, args=(worker,), daemon=True).start()
+        else:
+            self._put_idle(worker)
+
+    def _check_memory(self, worker: _WorkerProcess):
+        worker.last_rss_mb = process_tree_rss_mb(worker.pid) if worker.pid is not None else 0.0
+        if worker.last_rss_mb > self.max_rss_mb:
+            self._recycle(worker, "memory_recycles")
+        else:
+            self._put_idle(worker)
+
+    def _recycle(self, worker: _WorkerProcess, reason: str, graceful: bool = True):
+        """워커를 백그라운드 스레드에서 재시작한 뒤 반납"""
+        with self.lock:
+            self.stats[reason] += 1
+        logger.info(
+            f"♻️ 크롤러 워커 {worker.index} 재시작 ({reason}, 작업 {worker.jobs}건, 메모리 {worker.last_rss_mb:.0f}MB)"
+        )
+        threading.Thread(target=self._replace, args=(worker, graceful), daemon=True).start()
+
+    def _replace(self, worker: _WorkerProcess, graceful: bool):
+        worker.stop(graceful=graceful)
+        if self._running:
+            worker.start()
+            self._put_idle(worker)
+
+    def get_status(self) -> Dict[str, Any]:
+        """워커 풀 상태 조회"""
+        with self.lock:
+            stats = dict(self.stats)
+        return {
+            "enabled": self.enabled,
+            "is_running": self._running,
+            "workers": [
+                {
+                    "index": worker.index,
+                    "pid": worker.pid,
+                    "alive": worker.is_alive(),
+                    "generation": worker.generation,
+                    "jobs": worker.jobs,
+                    "last_rss_mb": round(worker.last_rss_mb, 1)
+                }
+                for worker in self._workers
+            ],
+            "idle_workers": len(self._idle),
+            "waiting_jobs": len(self._waiters),
+            "max_rss_mb": self.max_rss_mb,
+            "max_jobs": self.max_jobs,
+            **stats
+        }
+
+
+def _worker_main(conn, worker_count: int):
+    """워커 프로세스 진입점"""
+    try:
+        asyncio.run(_serve(conn, worker_count))
+    except KeyboardInterrupt:
+        pass
+
+
+async def _serve(conn, worker_count: int):
+    # 워커마다 속도 제한기가 따로 있으므로 API 프로세스 몫 1개를 포함해 워커 수 + 1 로 나눠 전체 속도를 유지
+    host_rate_limiter.scale(1 / (worker_count + 1))
+
+    pool = BrowserPool(
+        max_concurrency=1,
+        recycle_after_pages=settings.browser_pool_recycle_pages,
+        prewarm_contexts=1
+    )
+    await pool.start()
+    logger.info(f"🧵 크롤러 워커 프로세스 준비 (pid {os.getpid()})")
+
+    def send_progress(stage: str, count: int):
+        conn.send(("progress", stage, count))
+
+    try:
+        while True:
+            try:
+                message = await asyncio.to_thread(conn.recv)
+            except (EOFError, OSError):
+                break
+            if message[0] == "stop":
+                break
+
+            _, kind, product_url, max_reviews, known_review_ids, resume_from = message
+            started = time.perf_counter()
+            try:
+                if kind == "product":
+                    result = await crawl_product_with_fallback(
+                        product_url, max_reviews, pool=pool,
+                        known_review_ids=known_review_ids, on_progress=send_progress
+                    )
+                    conn.send(("result", result))
+                else:
+                    async for batch in iter_review_batches_with_fallback(
+                        product_url, max_reviews, pool=pool,
+                        known_review_ids=known_review_ids, on_progress=send_progress,
+                        resume_from=resume_from
+                    ):
+                        conn.send(("batch", batch))
+                conn.send(("done",))
+            except Exception as e:
+                logger.error(f"❌ 크롤러 워커 작업 오류: {e}")
+                conn.send(("error", str(e)))
+            logger.debug(f"🧵 크롤러 워커 작업 완료 ({time.perf_counter() - started:.1f}s): {product_url}")
+    finally:
+        await http_review_fetcher.close()
+        await pool.stop()
+
+
+# 전역 크롤러 워커 풀 인스턴스 (settings.crawler_worker_processes=0 이면 비활성화)
+crawler_worker_pool = CrawlerWorkerPool()
+
+
+def crawl_capacity() -> int:
+    """동시에 실행해도 브라우저가 늘어나지 않는 크롤링 수
+
+    워커 프로세스를 쓰면 워커 수(워커당 페이지 1개), 아니면 API 프로세스 브라우저 풀의 동시 임대 수.
+    풀이 꺼져 있어도 같은 상한을 적용해 1회용 Chromium 이 그 이상 뜨지 않게 한다.
+    """
+    if crawler_worker_pool.is_running:
+        return crawler_worker_pool.workers
+    return browser_pool.max_concurrency
+
+
+async def start_crawler_worker_pool():
+    """애플리케이션 시작시 크롤러 워커 프로세스 구동"""
+    if not crawler_worker_pool.enabled:
+        return
+    try:
+        await crawler_worker_pool.start()
+    except Exception as e:
+        logger.error(f"❌ 크롤러 워커 프로세스 시작 실패 (API 프로세스에서 크롤링): {e}")
+        await crawler_worker_pool.stop()
+        crawler_worker_pool.workers = 0
+
+
+async def stop_crawler_worker_pool():
+    """애플리케이션 종료시 크롤러 워커 프로세스 정리"""
+    await crawler_worker_pool.stop()
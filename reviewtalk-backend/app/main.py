@@ -8,9 +8,20 @@ from app.core.config import settings
 from app.api.routes import crawl, chat, chat_room, account, special_deals, products  # 신규 계정 라우터 import
 from app.database import init_database  # 데이터베이스 모듈 import
 from app.utils.scheduler import init_scheduler, shutdown_scheduler
+from app.infrastructure.crawler.browser_pool import start_browser_pool, stop_browser_pool
+from app.infrastructure.crawler.worker_pool import start_crawler_worker_pool, stop_crawler_worker_pool
+from app.infrastructure.crawler.http_review_fetcher import http_review_fetcher
+from app.services.crawl_job_service import crawl_job_service
+from app.infrastructure.ai.vector_store import vector_store_warmup
+from fastapi.responses import JSONResponse
 from loguru import logger
+import asyncio
 import os
 import logging
+import time
+
+# 앱 모듈 로드가 끝난 시각 (/health 의 uptime 기준)
+APP_LOADED = time.time()
 
 # logs 디렉터리 생성
 os.makedirs("logs", exist_ok=True)
@@ -47,10 +58,24 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to initialize database: {e}")
         raise
 
+    # 임베딩 모델/Chroma 클라이언트는 백그라운드에서 로드 (준비 전에도 서버는 요청을 받음)
+    vector_store_warmup.start(settings.embedding_warmup_enabled)
+
+    # 크롤러 브라우저 풀 구동
+    await start_browser_pool()
+    await start_crawler_worker_pool()
+
+    # 비동기 크롤링 작업 워커 구동 (재시작 전 미완료 작업 재등록)
+    await crawl_job_service.start()
+
     yield
 
     # Shutdown
     logger.info("Shutting down ReviewTalk API...")
+    await crawl_job_service.stop()
+    await stop_crawler_worker_pool()
+    await http_review_fetcher.close()
+    await stop_browser_pool()
 
 
 def create_app() -> FastAPI:
@@ -87,8 +112,8 @@ def create_app() -> FastAPI:
     async def startup_event():
         """애플리케이션 시작시 실행"""
         logger.info("🚀 ReviewTalk API 서버 시작")
-        # 자동 크롤링 스케줄러 초기화
-        init_scheduler()
+        # 자동 크롤링 스케줄러 초기화 (작업은 이 이벤트 루프에서 실행해 브라우저 풀 공유)
+        init_scheduler(asyncio.get_running_loop())
 
     @app.on_event("shutdown")
     async def shutdown_event():
@@ -116,12 +141,25 @@ async def root():
 
 @app.get("/health", tags=["Health"])
 async def health_check():
-    """헬스 체크 엔드포인트"""
+    """헬스 체크 엔드포인트 (liveness - 프로세스가 응답하면 항상 healthy, 준비 상태는 ready 로 따로 표시)"""
     return {
         "status": "healthy",
         "app_name": settings.app_name,
-        "version": settings.version
+        "version": settings.version,
+        "uptime_seconds": round(time.time() - APP_LOADED, 3),
+        "ready": vector_store_warmup.ready,
+        "components": {"vector_store": vector_store_warmup.get_status()}
+    }
+
+
+@app.get("/health/ready", tags=["Health"])
+async def readiness_check():
+    """준비 상태 체크 (readiness - 벡터 저장소 워밍업이 끝나야 200, 그 전에는 503)"""
+    body = {
+        "ready": vector_store_warmup.ready,
+        "components": {"vector_store": vector_store_warmup.get_status()}
     }
+    return JSONResponse(status_code=200 if body["ready"] else 503, content=body)
 
 
 if __name__ == "__main__":
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Literal, Optional
 from pydantic import BaseModel, HttpUrl, Field
 
 
@@ -18,6 +18,28 @@ class ReviewData(BaseModel):
     date: Optional[str] = Field(None, description="작성일")
 
 
+class ProductCrawlResult(BaseModel):
+    success: bool = Field(..., description="크롤링 성공 여부")
+    product_id: str = Field(..., description="상품 코드")
+    product_name: str = Field(..., description="상품명")
+    product_image: Optional[str] = Field(None, description="상품 이미지 URL")
+    product_price: Optional[str] = Field(None, description="상품 가격")
+    product_brand: Optional[str] = Field(None, description="브랜드명")
+    reviews: List[ReviewData] = Field(default_factory=list, description="수집된 리뷰 목록 (증분 모드에서는 새 리뷰만)")
+    skipped_reviews: int = Field(default=0, description="증분 모드에서 이미 저장되어 건너뛴 리뷰 수")
+    error_message: Optional[str] = Field(None, description="에러 메시지")
+    metrics: dict = Field(default_factory=dict, description="크롤링 단계별 측정 지표")
+
+    @property
+    def product_info(self) -> dict:
+        return {
+            "product_name": self.product_name,
+            "product_image": self.product_image,
+            "product_price": self.product_price,
+            "product_brand": self.product_brand
+        }
+
+
 class CrawlResponse(BaseModel):
     success: bool = Field(..., description="크롤링 성공 여부")
     message: str = Field(..., description="처리 결과 메시지")
@@ -27,6 +49,20 @@ class CrawlResponse(BaseModel):
     error_message: Optional[str] = Field(None, description="에러 메시지")
 
 
+
+class CrawlJobResponse(BaseModel):
+    job_id: str = Field(..., description="크롤링 작업 ID")
+    status: Literal["queued", "running", "succeeded", "failed"] = Field(..., description="작업 상태")
+    stage: Optional[str] = Field(None, description="현재 진행 단계")
+    reviews_found: int = Field(default=0, description="지금까지 찾은 리뷰 수")
+    product_url: str = Field(..., description="다나와 상품 URL")
+    result: Optional[CrawlResponse] = Field(None, description="완료 시 최종 크롤링 결과")
+    error_message: Optional[str] = Field(None, description="에러 메시지")
+    created_at: Optional[str] = Field(None, description="생성일시")
+    updated_at: Optional[str] = Field(None, description="최근 갱신일시")
+    finished_at: Optional[str] = Field(None, description="종료일시")
+
+
 # AI 채팅 관련 스키마
 class ChatRequest(BaseModel):
     user_id: str = Field(..., description="사용자 ID")
@@ -78,6 +114,7 @@ class CrawlSpecialProductsRequest(BaseModel):
     max_products: int = Field(default=50, ge=1, le=100, description="수집할 최대 특가 상품 수")
     crawl_reviews: bool = Field(default=True, description="각 상품의 리뷰도 함께 크롤링할지 여부")
     max_reviews_per_product: int = Field(default=100, ge=1, le=500, description="상품당 수집할 최대 리뷰 수")
+    incremental: bool = Field(default=True, description="이미 저장된 리뷰를 만나면 더보기를 멈추고 새 리뷰만 저장할지 여부")
 
 
 class CrawlSpecialProductsResponse(BaseModel):
@@ -85,6 +122,9 @@ class CrawlSpecialProductsResponse(BaseModel):
     total_products: int = Field(..., description="수집된 특가 상품 수")
     products_with_reviews: int = Field(..., description="리뷰까지 수집된 상품 수")
     total_reviews: int = Field(..., description="수집된 총 리뷰 수")
+    new_reviews: int = Field(default=0, description="새로 저장된 리뷰 수")
+    skipped_reviews: int = Field(default=0, description="이미 저장되어 건너뛴 리뷰 수")
+    failed_products: int = Field(default=0, description="리뷰 크롤링에 실패하거나 시간 초과된 상품 수")
     error_message: Optional[str] = Field(None, description="에러 메시지")
 
 
@@ -0,0 +1,76 @@
+"""
+크롤링 진행 이벤트 스트림 - 크롤러/색인 단계의 진행 상황을 Server-Sent Events 형식으로 변환
+"""
+import asyncio
+import json
+from typing import Any, AsyncIterator, Awaitable, Dict, Optional
+
+from loguru import logger
+
+from app.models.schemas import CrawlResponse
+
+
+_DONE = object()
+
+
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    """SSE 메시지 1건 (event + JSON data)"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+class CrawlEventStream:
+    """크롤링 1건의 진행 콜백을 받아 SSE 문자열로 내보내는 어댑터
+
+    - DanawaCrawler 진행 단계: page_loaded, product_info, review_tab, click(더보기 N번째), reviews_extracted
+    - 색인 파이프라인: batch_crawled, batch_indexed, chat_ready(첫 배치 색인 완료 - 채팅 가능)
+    - shared: 같은 상품의 진행 중인 크롤링에 합류
+    - 종료: done(최종 CrawlResponse) 또는 error
+    """
+
+    def __init__(self, heartbeat_seconds: float = 15.0):
+        self.heartbeat_seconds = heartbeat_seconds
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.clicks = 0
+        self.chat_ready = False
+
+    def on_progress(self, stage: str, reviews_found: int):
+        """DanawaCrawler 진행 콜백"""
+        if stage == "load_more":
+            self.clicks += 1
+            self.queue.put_nowait(("click", {"click": self.clicks, "reviews_loaded": reviews_found}))
+        else:
+            self.queue.put_nowait((stage, {"reviews_found": reviews_found}))
+
+    def on_event(self, event: str, data: Dict[str, Any]):
+        """CrawlIndexPipeline 이벤트 콜백"""
+        self.queue.put_nowait((event, data))
+        if event == "batch_indexed" and data.get("indexed") and not self.chat_ready:
+            self.chat_ready = True
+            self.queue.put_nowait(("chat_ready", {"indexed": data["indexed"]}))
+
+    async def stream(self, crawl: Awaitable[CrawlResponse]) -> AsyncIterator[str]:
+        """crawl 을 백그라운드로 실행하며 이벤트를 SSE 로 내보내고, 끝나면 done/error 로 종료
+
+        클라이언트 연결이 끊겨도 크롤링/색인 작업은 끝까지 진행된다.
+        """
+        task = asyncio.ensure_future(crawl)
+        task.add_done_callback(lambda _: self.queue.put_nowait((_DONE, None)))
+        yield format_sse("started", {})
+
+        while True:
+            try:
+                event, data = await asyncio.wait_for(self.queue.get(), timeout=self.heartbeat_seconds)
+            except asyncio.TimeoutError:
+                # 프록시 유휴 타임아웃 방지
+                yield ": keep-alive\n\n"
+                continue
+            if event is _DONE:
+                break
+            yield format_sse(event, data)
+
+        try:
+            response: Optional[CrawlResponse] = task.result()
+            yield format_sse("done", response.model_dump())
+        except Exception as e:
+            logger.error(f"❌ 크롤링 스트림 오류: {e}")
+            yield format_sse("error", {"error_message": str(e)})
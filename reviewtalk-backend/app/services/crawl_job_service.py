@@ -0,0 +1,106 @@
+"""
+비동기 크롤링 작업 서비스 - 작업 접수 즉시 ID 반환, 백그라운드 워커가 크롤링 후 상태를 SQLite 에 기록
+"""
+import asyncio
+from typing import List, Optional
+
+from loguru import logger
+
+from app.core.config import settings
+from app.infrastructure.crawl_job_repository import crawl_job_repository
+from app.models.schemas import CrawlJobResponse, CrawlRequest, CrawlResponse
+from app.services.crawl_service import CrawlService
+
+
+class CrawlJobService:
+    """크롤링 작업 큐와 백그라운드 워커 관리"""
+
+    def __init__(self, workers: Optional[int] = None):
+        self.repository = crawl_job_repository
+        self.workers = max(1, workers or settings.crawl_job_workers)
+        self.queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self):
+        """워커 구동 및 재시작 전 미완료 작업 재등록"""
+        if self._tasks:
+            return
+        self.queue = asyncio.Queue()
+        pending = self.repository.requeue_unfinished_jobs()
+        for job in pending:
+            self.queue.put_nowait(job["id"])
+        self._tasks = [asyncio.create_task(self._worker(i)) for i in range(self.workers)]
+        logger.info(f"🧾 크롤링 작업 워커 {self.workers}개 시작 (재등록된 작업 {len(pending)}개)")
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("🧾 크롤링 작업 워커 종료")
+
+    def submit(self, request: CrawlRequest) -> CrawlJobResponse:
+        """작업을 queued 상태로 저장하고 큐에 등록"""
+        if self.queue is None:
+            raise RuntimeError("크롤링 작업 워커가 시작되지 않았습니다.")
+        job_id = self.repository.create_job(str(request.product_url), request.max_reviews, request.is_special)
+        self.queue.put_nowait(job_id)
+        logger.info(f"🧾 크롤링 작업 등록: {job_id} ({request.product_url})")
+        return self.get_job(job_id)
+
+    def get_job(self, job_id: str) -> Optional[CrawlJobResponse]:
+        job = self.repository.get_job(job_id)
+        if not job:
+            return None
+        return CrawlJobResponse(
+            job_id=job["id"],
+            status=job["status"],
+            stage=job["stage"],
+            reviews_found=job["reviews_found"],
+            product_url=job["product_url"],
+            result=CrawlResponse(**job["result"]) if job["result"] else None,
+            error_message=job["error_message"],
+            created_at=job["created_at"],
+            updated_at=job["updated_at"],
+            finished_at=job["finished_at"]
+        )
+
+    async def _worker(self, index: int):
+        while True:
+            job_id = await self.queue.get()
+            try:
+                await self._run_job(job_id)
+            except Exception as e:
+                logger.error(f"❌ 크롤링 작업 처리 오류 ({job_id}): {e}")
+                self.repository.mark_finished(job_id, False, error_message=str(e))
+            finally:
+                self.queue.task_done()
+
+    async def _run_job(self, job_id: str):
+        job = self.repository.get_job(job_id)
+        if not job or job["status"] != "queued":
+            return
+
+        logger.info(f"🧾 크롤링 작업 시작: {job_id}")
+        self.repository.mark_running(job_id)
+        request = CrawlRequest(
+            product_url=job["product_url"],
+            max_reviews=job["max_reviews"],
+            is_special=job["is_special"]
+        )
+
+        def on_progress(stage: str, reviews_found: int):
+            self.repository.update_progress(job_id, stage, reviews_found or None)
+
+        response = await CrawlService().crawl_product_reviews(request, on_progress=on_progress)
+        self.repository.mark_finished(
+            job_id,
+            response.success,
+            result=response.model_dump(),
+            error_message=response.error_message
+        )
+        logger.info(f"🧾 크롤링 작업 종료: {job_id} (성공: {response.success}, 리뷰 {response.reviews_found}개)")
+
+
+# 전역 서비스 인스턴스
+crawl_job_service = CrawlJobService()
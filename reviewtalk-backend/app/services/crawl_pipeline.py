@@ -0,0 +1,198 @@
+"""
+크롤링 → 임베딩/색인 스트리밍 파이프라인 - 더보기 배치가 도착하는 대로 벡터 저장소에 upsert
+"""
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import AbstractSet, Any, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from app.core.config import settings
+from app.infrastructure.ai.vector_store import get_vector_store
+from app.infrastructure.crawler.danawa_crawler import ProgressCallback, ReviewBatch, iter_danawa_review_batches
+from app.infrastructure.crawler.http_review_fetcher import iter_review_batches_with_fallback
+from app.infrastructure.crawler.worker_pool import crawler_worker_pool
+from app.models.schemas import ReviewData
+
+
+# 파이프라인 이벤트 콜백: (이벤트 이름, 이벤트 데이터)
+PipelineEventCallback = Callable[[str, Dict[str, Any]], None]
+
+_END = object()
+
+
+@dataclass
+class PipelineResult:
+    """스트리밍 크롤링/색인 결과"""
+
+    success: bool
+    product_id: str
+    product_info: Dict[str, Optional[str]] = field(default_factory=dict)
+    reviews: List[ReviewData] = field(default_factory=list)
+    skipped_reviews: int = 0
+    indexed_reviews: int = 0
+    resumed_reviews: int = 0  # 체크포인트에서 이어받은 (이미 색인된) 리뷰 수
+    batches: int = 0
+    first_indexed_seconds: Optional[float] = None  # 첫 배치 색인 완료까지 걸린 시간 (채팅 가능 시점)
+    total_seconds: float = 0.0
+    error_message: Optional[str] = None
+
+
+class CrawlIndexPipeline:
+    """크롤러(생산자)와 임베딩/색인(소비자)을 bounded queue 로 연결
+
+    브라우저가 다음 더보기를 클릭하는 동안 이전 배치의 임베딩이 워커 스레드에서 진행된다.
+    큐가 가득 차면 크롤러가 대기하므로 메모리 사용량이 배치 queue_size 개로 제한된다.
+    checkpoints 가 주어지면 색인한 배치마다 체크포인트를 저장하고, 다음 실행은 그 위치부터 이어서 크롤링한다.
+    """
+
+    def __init__(self, vector_store=None, queue_size: Optional[int] = None, checkpoints=None):
+        self.vector_store = vector_store or get_vector_store()
+        self.queue_size = max(1, queue_size or settings.crawl_pipeline_queue_size)
+        self.checkpoints = checkpoints
+
+    async def run(
+        self,
+        product_url: str,
+        product_id: Any,
+        max_reviews: int = 100,
+        known_review_ids: Optional[AbstractSet[str]] = None,
+        on_progress: Optional[ProgressCallback] = None,
+        on_event: Optional[PipelineEventCallback] = None
+    ) -> PipelineResult:
+        """product_url 을 크롤링하며 배치마다 product_id 로 벡터 저장소에 upsert"""
+        started = time.perf_counter()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        result = PipelineResult(success=False, product_id=str(product_id))
+        resume_from, checkpointing = self._restore_checkpoint(product_id, max_reviews, result)
+
+        def emit(event: str, **data):
+            if not on_event:
+                return
+            try:
+                on_event(event, data)
+            except Exception as e:
+                logger.debug(f"파이프라인 이벤트 콜백 오류 ({event}): {e}")
+
+        async def produce():
+            # 크롤링 오류는 기록만 하고 이미 수집한 배치는 소비자가 끝까지 색인하도록 한다
+            # 워커 프로세스 풀이 켜져 있으면 크롤링은 별도 프로세스에서 실행하고 배치만 받아온다
+            if crawler_worker_pool.is_running:
+                iter_batches = crawler_worker_pool.iter_review_batches
+            elif settings.crawler_http_fast_path:
+                iter_batches = iter_review_batches_with_fallback
+            else:
+                iter_batches = iter_danawa_review_batches
+            remaining = max_reviews - result.resumed_reviews
+            if remaining <= 0:
+                await queue.put(_END)
+                return
+            try:
+                async for batch in iter_batches(
+                    product_url,
+                    remaining,
+                    known_review_ids=known_review_ids,
+                    on_progress=on_progress,
+                    resume_from=resume_from
+                ):
+                    result.product_info = batch.product_info
+                    result.skipped_reviews += batch.skipped_reviews
+                    emit("batch_crawled", batch=batch.index, reviews=len(batch.reviews), loaded=batch.loaded_count)
+                    await queue.put(batch)
+            except Exception as e:
+                logger.error(f"❌ 스트리밍 크롤링 오류: {e}")
+                result.error_message = str(e)
+            await queue.put(_END)
+
+        async def consume():
+            while True:
+                batch = await queue.get()
+                if batch is _END:
+                    return
+                await self._index_batch(batch, product_id, result)
+                if checkpointing:
+                    self._save_checkpoint(product_id, product_url, batch, max_reviews)
+                if result.first_indexed_seconds is None and result.indexed_reviews:
+                    result.first_indexed_seconds = time.perf_counter() - started
+                    logger.info(f"💬 첫 배치 색인 완료 - 채팅 가능 ({result.first_indexed_seconds:.1f}s)")
+                emit("batch_indexed", batch=batch.index, indexed=result.indexed_reviews)
+
+        producer = asyncio.create_task(produce())
+        consumer = asyncio.create_task(consume())
+        try:
+            await asyncio.gather(producer, consumer)
+            result.success = result.error_message is None
+        except Exception as e:
+            # 색인 오류 시 크롤링도 중단
+            logger.error(f"❌ 스트리밍 색인 오류: {e}")
+            result.error_message = str(e)
+            for task in (producer, consumer):
+                task.cancel()
+            await asyncio.gather(producer, consumer, return_exceptions=True)
+
+        if result.success and checkpointing:
+            self._clear_checkpoint(product_id)
+        result.total_seconds = time.perf_counter() - started
+        logger.info(
+            f"🚰 파이프라인 완료: 배치 {result.batches}개, 색인 {result.indexed_reviews}개, "
+            f"건너뜀 {result.skipped_reviews}개, {result.total_seconds:.1f}s"
+        )
+        return result
+
+    def _restore_checkpoint(self, product_id: Any, max_reviews: int, result: PipelineResult) -> Tuple[int, bool]:
+        """체크포인트의 리뷰를 결과에 채우고 (재개할 더보기 위치(로드된 리뷰 항목 수), 체크포인트 기록 여부) 반환
+
+        더 많은 리뷰를 요청한 크롤링이 남긴 체크포인트는 이번 요청보다 많은 리뷰를 담고 있을 수 있으므로
+        복원하지 않고, 그 크롤링이 이어갈 수 있도록 이번 실행에서는 저장/삭제도 하지 않는다.
+        """
+        if self.checkpoints is None:
+            return 0, False
+        try:
+            checkpoint = self.checkpoints.get_checkpoint(str(product_id), settings.crawl_checkpoint_max_age)
+        except Exception as e:
+            logger.warning(f"⚠️ 크롤링 체크포인트 조회 실패: {e}")
+            return 0, True
+        if not checkpoint:
+            return 0, True
+        if (checkpoint.get("max_reviews") or 0) > max_reviews:
+            logger.info(
+                f"⏭️ 리뷰 {checkpoint['max_reviews']}개 크롤링의 체크포인트는 {max_reviews}개 요청에 사용하지 않음"
+            )
+            return 0, False
+        result.product_info = checkpoint["product_info"]
+        result.reviews.extend(checkpoint["reviews"])
+        result.indexed_reviews = result.resumed_reviews = len(checkpoint["reviews"])
+        logger.info(
+            f"⏯️ 체크포인트에서 재개: 색인된 리뷰 {result.resumed_reviews}개, "
+            f"더보기 위치 {checkpoint['loaded_count']}"
+        )
+        return checkpoint["loaded_count"], True
+
+    def _save_checkpoint(self, product_id: Any, product_url: str, batch: ReviewBatch, max_reviews: int):
+        if self.checkpoints is None:
+            return
+        try:
+            self.checkpoints.save_batch(
+                str(product_id), product_url, batch.product_info, batch.reviews, batch.loaded_count,
+                max_reviews=max_reviews
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ 크롤링 체크포인트 저장 실패: {e}")
+
+    def _clear_checkpoint(self, product_id: Any):
+        if self.checkpoints is None:
+            return
+        try:
+            self.checkpoints.delete_checkpoint(str(product_id))
+        except Exception as e:
+            logger.warning(f"⚠️ 크롤링 체크포인트 삭제 실패: {e}")
+
+    async def _index_batch(self, batch: ReviewBatch, product_id: Any, result: PipelineResult):
+        result.batches += 1
+        if not batch.reviews:
+            return
+        # 임베딩은 CPU 작업이므로 워커 스레드에서 실행해 크롤러(이벤트 루프)를 막지 않는다
+        await asyncio.to_thread(self.vector_store.add_reviews, batch.reviews, product_id, batch.product_info)
+        result.reviews.extend(batch.reviews)
+        result.indexed_reviews += len(batch.reviews)
@@ -7,19 +7,19 @@ import re
 from typing import Dict, Any, List, Optional
 from loguru import logger
 
-from app.infrastructure.crawler.danawa_crawler import DanawaCrawler
+from app.infrastructure.crawler.http_review_fetcher import crawl_product_with_fallback
+from app.infrastructure.crawler.worker_pool import crawler_worker_pool
 from app.infrastructure.unified_product_repository import unified_product_repository
-from app.infrastructure.ai.vector_store import VectorStore
-from app.models.schemas import CrawlRequest, CrawlResponse
+from app.infrastructure.ai.vector_store import get_vector_store
+from app.models.schemas import CrawlRequest, CrawlResponse, ReviewData
 
 
 class CrawlProductReviewService:
     """통합 상품 리뷰 크롤링 서비스"""
     
     def __init__(self):
-        self.crawler = DanawaCrawler()
         self.product_repository = unified_product_repository
-        self.vector_store = VectorStore()
+        self.vector_store = get_vector_store()
     
     async def crawl_product_reviews(self, request: CrawlRequest) -> CrawlResponse:
         """상품 리뷰 크롤링 메인 플로우 (일반 상품 및 특가 상품 통합 처리)"""
@@ -44,13 +44,31 @@ class CrawlProductReviewService:
                     reviews_found=0
                 )
             
-            # 3. 상품 상세 정보 크롤링 및 업데이트
-            product_info = await self._crawl_product_info(request.product_url)
-            if product_info:
-                await self._update_product_details(product_id, product_info, request.is_special)
+            # 3. 상품 페이지 1회 로드로 상세 정보 + 리뷰 크롤링
+            # (워커 프로세스 풀이 켜져 있으면 API 프로세스 밖에서, 아니면 HTTP 경로 → 브라우저 순으로 시도)
+            crawl = crawler_worker_pool.crawl_product if crawler_worker_pool.is_running else crawl_product_with_fallback
+            result = await crawl(str(request.product_url), request.max_reviews)
+            logger.info(f"⏱️ 크롤링 측정 지표: {result.metrics}")
+            if not result.success:
+                return CrawlResponse(
+                    success=False,
+                    message=result.error_message or "리뷰 크롤링에 실패했습니다.",
+                    reviews_found=0,
+                    product_id=product_id,
+                    error_message=result.error_message
+                )
+            
+            # 4. 같은 페이지에서 추출한 상품 상세 정보 업데이트
+            product_info = result.product_info
+            await self._update_product_details(product_id, {
+                'name': result.product_name,
+                'image_url': result.product_image,
+                'price': result.product_price,
+                'brand': result.product_brand
+            }, request.is_special)
             
-            # 4. 리뷰 크롤링
-            reviews = await self._crawl_reviews(request.product_url, request.max_reviews)
+            reviews = result.reviews
+            logger.info(f"리뷰 크롤링 완료: {len(reviews)}개")
             
             if not reviews:
                 self.product_repository.update_crawl_status(product_id, True, 0)
@@ -62,7 +80,7 @@ class CrawlProductReviewService:
                 )
             
             # 5. 벡터 스토어에 리뷰 저장
-            stored_count = await self._store_reviews_to_vector(product_id, reviews)
+            stored_count = await self._store_reviews_to_vector(product_id, reviews, product_info)
             
             # 6. 상품 크롤링 상태 업데이트
             self.product_repository.update_crawl_status(product_id, True, stored_count)
@@ -120,19 +138,6 @@ class CrawlProductReviewService:
             logger.error(f"기본 상품 정보 생성 실패: {e}")
             return None
     
-    async def _crawl_product_info(self, product_url: str) -> Optional[Dict[str, Any]]:
-        """상품 상세 정보 크롤링"""
-        try:
-            # DanawaCrawler를 사용하여 상품 정보 크롤링
-            product_info = await asyncio.to_thread(
-                self.crawler.get_product_info, product_url
-            )
-            return product_info
-            
-        except Exception as e:
-            logger.error(f"상품 정보 크롤링 실패: {e}")
-            return None
-    
     async def _update_product_details(self, product_id: str, product_info: Dict[str, Any], is_special: bool) -> bool:
         """상품 상세 정보 업데이트"""
         try:
@@ -154,49 +159,17 @@ class CrawlProductReviewService:
             logger.error(f"상품 상세 정보 업데이트 실패: {e}")
             return False
     
-    async def _crawl_reviews(self, product_url: str, max_reviews: int) -> List[Dict[str, Any]]:
-        """리뷰 크롤링"""
-        try:
-            reviews = await asyncio.to_thread(
-                self.crawler.crawl_reviews, product_url, max_reviews
-            )
-            
-            logger.info(f"리뷰 크롤링 완료: {len(reviews)}개")
-            return reviews
-            
-        except Exception as e:
-            logger.error(f"리뷰 크롤링 실패: {e}")
-            return []
-    
-    async def _store_reviews_to_vector(self, product_id: str, reviews: List[Dict[str, Any]]) -> int:
+    async def _store_reviews_to_vector(
+        self,
+        product_id: str,
+        reviews: List[ReviewData],
+        product_info: Optional[Dict[str, Any]] = None
+    ) -> int:
         """벡터 스토어에 리뷰 저장"""
         try:
-            stored_count = 0
-            
-            for review in reviews:
-                try:
-                    # 벡터 스토어에 리뷰 추가
-                    success = self.vector_store.add_review(
-                        product_id=product_id,
-                        review_text=review.get('content', ''),
-                        metadata={
-                            'product_id': product_id,
-                            'review_id': review.get('id'),
-                            'rating': review.get('rating'),
-                            'author': review.get('author'),
-                            'date': review.get('date')
-                        }
-                    )
-                    
-                    if success:
-                        stored_count += 1
-                        
-                except Exception as e:
-                    logger.warning(f"개별 리뷰 저장 실패: {e}")
-                    continue
-            
-            logger.info(f"벡터 스토어 저장 완료: {stored_count}/{len(reviews)}개")
-            return stored_count
+            await asyncio.to_thread(self.vector_store.add_reviews, reviews, product_id, product_info)
+            logger.info(f"벡터 스토어 저장 완료: {len(reviews)}개")
+            return len(reviews)
             
         except Exception as e:
             logger.error(f"벡터 스토어 저장 실패: {e}")
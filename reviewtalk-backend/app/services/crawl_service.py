@@ -1,15 +1,71 @@
 import asyncio
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from urllib.parse import urlparse
 from loguru import logger
 
-from app.infrastructure.crawler.danawa_crawler import DanawaCrawler
 from app.infrastructure.unified_product_repository import unified_product_repository
-from app.infrastructure.crawler.danawa_crawler import crawl_danawa_reviews
+from app.infrastructure.crawler.danawa_crawler import ProgressCallback
 from app.models.schemas import CrawlRequest, CrawlResponse, CrawlSpecialProductsRequest
 from app.services.ai_service import AIService
 from app.utils.url_utils import extract_product_id
 from app.services.special_deals_service import special_deals_service
+from app.services.crawl_pipeline import CrawlIndexPipeline, PipelineEventCallback
+from app.infrastructure.crawl_checkpoint_repository import crawl_checkpoint_repository
+from app.core.config import settings
+from app.utils.singleflight import SingleFlight
+
+
+# 상품별 크롤링 중복 실행 방지 (CrawlService 는 요청마다 생성되므로 모듈 전역으로 공유)
+crawl_singleflight: SingleFlight[CrawlResponse] = SingleFlight(
+    ttl=settings.crawl_result_ttl,
+    cacheable=lambda response: response.success
+)
+
+
+class CrawlProgressFanout:
+    """크롤링 1건의 진행 콜백을 합류한 요청들에게도 전달
+
+    같은 상품 크롤링에 합류한 요청은 shared 이벤트와 마지막 진행 단계를 먼저 받고,
+    이후 진행/색인 이벤트는 작업을 시작한 요청과 똑같이 받는다.
+    """
+
+    def __init__(
+        self,
+        product_id: str,
+        on_progress: Optional[ProgressCallback] = None,
+        on_event: Optional[PipelineEventCallback] = None
+    ):
+        self.product_id = product_id
+        self.listeners: List[Tuple[Optional[ProgressCallback], Optional[PipelineEventCallback]]] = [
+            (on_progress, on_event)
+        ]
+        self.last_progress: Optional[Tuple[str, int]] = None
+
+    def join(self, on_progress: Optional[ProgressCallback] = None, on_event: Optional[PipelineEventCallback] = None):
+        """진행 중인 크롤링에 합류한 요청의 콜백 등록"""
+        if on_event:
+            reviews_found = self.last_progress[1] if self.last_progress else 0
+            on_event("shared", {"product_id": self.product_id, "reviews_found": reviews_found})
+        if on_progress and self.last_progress:
+            on_progress(*self.last_progress)
+        self.listeners.append((on_progress, on_event))
+
+    def on_progress(self, stage: str, reviews_found: int):
+        self.last_progress = (stage, reviews_found)
+        for on_progress, _ in list(self.listeners):
+            if on_progress:
+                try:
+                    on_progress(stage, reviews_found)
+                except Exception as e:
+                    logger.debug(f"진행 콜백 오류 ({stage}): {e}")
+
+    def on_event(self, event: str, data: Dict[str, Any]):
+        for _, on_event in list(self.listeners):
+            if on_event:
+                try:
+                    on_event(event, data)
+                except Exception as e:
+                    logger.debug(f"파이프라인 이벤트 콜백 오류 ({event}): {e}")
 
 
 class CrawlService:
@@ -17,7 +73,6 @@ class CrawlService:
     
     def __init__(self):
         """크롤링 서비스 초기화"""
-        self.crawler = DanawaCrawler()
         self.ai_service = AIService()
         self.product_repository = unified_product_repository
     
@@ -61,17 +116,6 @@ class CrawlService:
             logger.error(f"상품 상세 정보 업데이트 실패: {e}")
             return False
 
-    async def _crawl_product_info(self, product_url: str) -> Optional[Dict[str, Any]]:
-        """상품 상세 정보 크롤링"""
-        try:
-            # DanawaCrawler를 사용하여 상품 정보 크롤링
-            product_info = await self.crawler.extract_product_info(product_url)
-            return product_info
-
-        except Exception as e:
-            logger.error(f"상품 정보 크롤링 실패: {e}")
-            return None
-        
     def _get_product_info(self, product_id: str) -> Optional[Dict[str, Any]]:
         """상품 정보 조회"""
         return self.product_repository.get_product_by_id(product_id)
@@ -94,10 +138,20 @@ class CrawlService:
             return None
 
 
-    async def crawl_product_reviews(self, request: CrawlRequest) -> CrawlResponse:
-        """상품 리뷰 크롤링 메인 함수 (특가 상품 리뷰도 함께 처리)"""
+    async def crawl_product_reviews(
+        self,
+        request: CrawlRequest,
+        on_progress: Optional[ProgressCallback] = None,
+        on_event: Optional[PipelineEventCallback] = None
+    ) -> CrawlResponse:
+        """상품 리뷰 크롤링 메인 함수 (특가 상품 리뷰도 함께 처리)
+
+        on_progress 로 크롤링 단계와 지금까지 찾은 리뷰 수를, on_event 로 배치별 색인 이벤트를 전달한다.
+        같은 상품을 같거나 더 많은 max_reviews 로 크롤링 중이면 그 작업에 합류해 shared 이벤트 후
+        진행 상황을 함께 받고, 결과를 공유한다. 더 적은 max_reviews 로 크롤링 중이면 그 작업이 끝난 뒤
+        (체크포인트에서 이어서) 크롤링하므로 같은 상품의 브라우저 크롤링이 동시에 돌지 않는다.
+        """
         product_url = str(request.product_url)
-        max_reviews = request.max_reviews
         
         # URL 유효성 검증
         if not CrawlService.validate_url(product_url):
@@ -119,6 +173,26 @@ class CrawlService:
                 reviews_found=0
             )
 
+        # 같은 상품을 요청 이상의 리뷰 수로 크롤링 중이면 그 결과를 기다리고, 최근 결과가 있으면 재사용
+        fanout = CrawlProgressFanout(product_id, on_progress, on_event)
+        return await crawl_singleflight.do(
+            (product_id, request.is_special),
+            lambda: self._crawl_and_store_product(product_id, request, fanout.on_progress, fanout.on_event),
+            size=request.max_reviews,
+            context=fanout,
+            on_join=lambda leader: leader.join(on_progress, on_event)
+        )
+
+    async def _crawl_and_store_product(
+        self,
+        product_id: str,
+        request: CrawlRequest,
+        on_progress: Optional[ProgressCallback] = None,
+        on_event: Optional[PipelineEventCallback] = None
+    ) -> CrawlResponse:
+        """상품 정보 저장 → 리뷰 크롤링 + 배치별 임베딩/색인 (상품별로 동시에 1회만 실행)"""
+        product_url = str(request.product_url)
+        max_reviews = request.max_reviews
         
         # 2. 기본 상품 정보 생성/업데이트
         product_data = await self._create_or_update_product(product_id, request.product_url, request.is_special)
@@ -132,64 +206,54 @@ class CrawlService:
         logger.info(f"기본 상품 정보 생성/업데이트 : {product_data}")
         
         
-        # 3. 상품 상세 정보 크롤링 및 업데이트
-        product_info = await self._crawl_product_info(request.product_url)
-        logger.info(f"상품 상세 정보 크롤링 및 업데이트 : {product_info}")
-        if product_info:
-            await self._update_product_details(product_id, product_info, request.is_special)
-
         try:
-            # 1. 입력된 상품 리뷰 크롤링 (메인 작업)
+            # 3. 상품 페이지 1회 로드로 상세 정보 + 리뷰 크롤링, 더보기 배치마다 바로 임베딩/색인 (메인 작업)
             logger.info(f"🔍 메인 상품 리뷰 크롤링 시작: {product_url}")
+            product_id_int = int(product_id) if product_id is not None else None
+            # 시간 초과/브라우저 오류로 중단되면 색인한 배치까지 체크포인트에 남아 다음 요청이 이어서 크롤링한다
+            checkpoints = crawl_checkpoint_repository if settings.crawl_checkpoint_enabled else None
             result = await asyncio.wait_for(
-                crawl_danawa_reviews(product_url, max_reviews),
+                CrawlIndexPipeline(self.ai_service.vector_store, checkpoints=checkpoints).run(
+                    product_url,
+                    product_id_int,
+                    max_reviews,
+                    on_progress=on_progress,
+                    on_event=on_event
+                ),
                 timeout=600.0
             )
             
             # 크롤링 결과를 새로운 CrawlResponse 구조로 변환
-            if result.get('success', False):
-                reviews = result.get('reviews', [])
-                review_count = len(reviews)
+            if result.success:
+                # 같은 페이지에서 추출한 상품 상세 정보로 업데이트
+                product_info = result.product_info
+                await self._update_product_details(product_id, {
+                    'name': product_info.get('product_name'),
+                    'image_url': product_info.get('product_image'),
+                    'price': product_info.get('product_price'),
+                    'brand': product_info.get('product_brand')
+                }, request.is_special)
+
+                review_count = len(result.reviews)
+                logger.info(
+                    f"🤖 메인 상품 색인 결과: {result.indexed_reviews}개 리뷰, 배치 {result.batches}개, "
+                    f"첫 배치 색인까지 {result.first_indexed_seconds or 0:.1f}s"
+                )
                 
                 crawl_response = CrawlResponse(
                     success=True,
                     message=f"리뷰 크롤링이 완료되었습니다. (총 {review_count}개)",
                     reviews_found=review_count,
                     product_id=product_id,
-                    product_info={
-                        "product_name": result.get('product_name'),
-                        "product_image": result.get('product_image'),
-                        "product_price": result.get('product_price'),
-                        "product_brand": result.get('product_brand')
-                    }
+                    product_info=product_info
                 )
-                
-                # AI 서비스에 리뷰 저장
-                if reviews:
-                    try:
-                        product_info = {
-                            "product_name": result.get('product_name'),
-                            "product_image": result.get('product_image'),
-                            "product_price": result.get('product_price'),
-                            "product_brand": result.get('product_brand')
-                        }
-
-                        product_id_int = int(product_id) if product_id is not None else None
-                        ai_result = self.ai_service.process_and_store_reviews(
-                            reviews=reviews,
-                            product_id=product_id_int,
-                            product_info=product_info
-                        )
-                        logger.info(f"🤖 메인 상품 AI 저장 결과: {ai_result['message']}")
-                    except Exception as ai_error:
-                        logger.warning(f"⚠️ 메인 상품 AI 저장 실패 (크롤링은 성공): {ai_error}")
             else:
                 crawl_response = CrawlResponse(
                     success=False,
-                    message=result.get('error_message', '리뷰 크롤링에 실패했습니다.'),
-                    reviews_found=0,
+                    message=result.error_message or '리뷰 크롤링에 실패했습니다.',
+                    reviews_found=result.indexed_reviews,
                     product_id=product_id,
-                    error_message=result.get('error_message', '리뷰 크롤링에 실패했습니다.')
+                    error_message=result.error_message or '리뷰 크롤링에 실패했습니다.'
                 )
 
             # 2. 백그라운드에서 특가 상품 리뷰 크롤링 트리거 (비동기로 실행)
@@ -200,7 +264,7 @@ class CrawlService:
         except asyncio.TimeoutError:
             return CrawlResponse(
                 success=False,
-                message="크롤링 시간 초과 (600초)",
+                message="크롤링 시간 초과 (600초) - 다시 요청하면 수집한 리뷰 이후부터 이어서 크롤링합니다.",
                 reviews_found=0,
                 product_id=product_id,
                 error_message="크롤링 시간 초과 (600초)"
@@ -10,7 +10,7 @@ from typing import List, Dict, Any, Optional
 from loguru import logger
 from pydantic import HttpUrl
 
-from app.infrastructure.crawler.special_deals_crawler import SpecialDealsCrawler
+from app.infrastructure.crawler.special_deals_crawler import crawl_special_deals
 from app.infrastructure.unified_product_repository import unified_product_repository
 from app.services.crawl_product_review_service import CrawlProductReviewService
 from app.models.schemas import CrawlRequest
@@ -20,7 +20,6 @@ class SpecialDealsManageService:
     """특가 상품 관리 서비스"""
     
     def __init__(self):
-        self.special_crawler = SpecialDealsCrawler()
         self.product_repository = unified_product_repository
         self.crawl_service = CrawlProductReviewService()
         self._scheduler_running = False
@@ -32,9 +31,7 @@ class SpecialDealsManageService:
             logger.info(f"특가 상품 발견 시작 (최대 {limit}개)")
             
             # 1. 특가 상품 크롤링
-            special_products = await asyncio.to_thread(
-                self.special_crawler.crawl_special_deals, limit
-            )
+            special_products = await crawl_special_deals(limit)
             
             if not special_products:
                 return {
@@ -117,9 +114,6 @@ class SpecialDealsManageService:
                     if result.success:
                         crawled_count += 1
                     
-                    # 너무 빠른 요청 방지
-                    await asyncio.sleep(2)
-                    
                 except Exception as e:
                     logger.error(f"특가 상품 {product['product_id']} 크롤링 실패: {e}")
                     crawl_results.append({
@@ -2,12 +2,13 @@
 특가 상품 서비스 - 비즈니스 로직 처리
 """
 import asyncio
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Set
 from datetime import datetime
 
 from loguru import logger
 
 from app.models.schemas import (
+    ProductCrawlResult,
     SpecialProduct, 
     SpecialProductsResponse, 
     CrawlSpecialProductsRequest,
@@ -15,9 +16,12 @@ from app.models.schemas import (
 )
 from app.infrastructure.unified_product_repository import unified_product_repository
 from app.infrastructure.crawler.special_deals_crawler import crawl_special_deals
-from app.infrastructure.crawler.danawa_crawler import crawl_danawa_reviews
+from app.infrastructure.crawler.http_review_fetcher import crawl_product_with_fallback
+from app.infrastructure.crawler.worker_pool import crawl_capacity, crawler_worker_pool
 from app.infrastructure.ai.vector_store import get_vector_store
 from app.infrastructure.conversation_repository import conversation_repository
+from app.utils.crawl_executor import CrawlExecutor, CrawlTaskResult
+from app.core.config import settings
 
 
 class SpecialDealsService:
@@ -26,6 +30,10 @@ class SpecialDealsService:
     def __init__(self):
         self.repository = unified_product_repository
     
+    def _review_executor(self) -> CrawlExecutor:
+        """리뷰 일괄 크롤링 실행기 (동시 실행 수는 브라우저 풀/워커 용량을 넘지 않음)"""
+        return CrawlExecutor(max_workers=min(settings.crawl_executor_max_workers, crawl_capacity()))
+    
     async def crawl_and_save_special_deals(
         self, 
         request: CrawlSpecialProductsRequest
@@ -54,61 +62,33 @@ class SpecialDealsService:
             saved_count = self.repository.save_special_products(special_products)
             logger.info(f"✅ {saved_count}개의 특가 상품 저장 완료")
             
-            # 3. 각 상품별 리뷰 크롤링 (옵션)
-            products_with_reviews = 0
-            total_reviews = 0
+            # 3. 각 상품별 리뷰 크롤링 (옵션) - 동시 크롤링 실행기로 병렬 처리
+            summary = self._summarize_review_results([])
             
             if request.crawl_reviews:
-                logger.info("📝 각 상품별 리뷰 크롤링 시작...")
+                logger.info(f"📝 각 상품별 리뷰 크롤링 시작... (증분 모드: {request.incremental})")
                 
-                for i, product in enumerate(special_products):
-                    try:
-                        logger.info(f"📖 상품 {i+1}/{len(special_products)}: {product.product_name}")
-                        
-                        # 리뷰 크롤링
-                        review_result = await crawl_danawa_reviews(
-                            product.product_url, 
-                            request.max_reviews_per_product
-                        )
-                        
-                        if review_result.get("success") and review_result.get("reviews"):
-                            reviews = review_result["reviews"]
-                            review_count = len(reviews)
-                            
-                            product_id_int = int(product.product_id) if product.product_id is not None else None
-                            # 벡터 저장소에 리뷰 저장
-                            await self._save_reviews_to_vector_store(
-                                product_id_int,
-                                product.product_name,
-                                reviews
-                            )
-                            
-                            # 크롤링 상태 업데이트
-                            self.repository.update_crawl_status(
-                                product.product_id, 
-                                True, 
-                                review_count
-                            )
-                            
-                            products_with_reviews += 1
-                            total_reviews += review_count
-                            
-                            logger.info(f"✅ {product.product_name}: {review_count}개 리뷰 저장")
-                        else:
-                            logger.warning(f"⚠️ {product.product_name}: 리뷰 크롤링 실패")
-                        
-                        # 각 상품 처리 후 잠시 대기 (서버 부하 방지)
-                        await asyncio.sleep(2)
-                        
-                    except Exception as e:
-                        logger.error(f"❌ 상품 리뷰 크롤링 오류 ({product.product_name}): {e}")
-                        continue
+                results = await self._review_executor().run(
+                    special_products,
+                    lambda product: self._crawl_product_reviews(
+                        product,
+                        request.max_reviews_per_product,
+                        request.incremental,
+                        int(product.product_id) if product.product_id is not None else None
+                    ),
+                    url_of=lambda product: product.product_url,
+                    label_of=lambda product: product.product_name
+                )
+                summary = self._summarize_review_results(results)
             
             return CrawlSpecialProductsResponse(
                 success=True,
                 total_products=saved_count,
-                products_with_reviews=products_with_reviews,
-                total_reviews=total_reviews
+                products_with_reviews=summary["products_with_reviews"],
+                total_reviews=summary["total_reviews"],
+                new_reviews=summary["new_reviews"],
+                skipped_reviews=summary["skipped_reviews"],
+                failed_products=summary["failed_products"]
             )
             
         except Exception as e:
@@ -149,12 +129,91 @@ class SpecialDealsService:
             if documents:
                 vector_store = get_vector_store()
                 product_info = {"product_name": product_name}
-                vector_store.add_reviews(reviews, product_id, product_info)
+                await asyncio.to_thread(vector_store.add_reviews, reviews, product_id, product_info)
                 logger.info(f"✅ {len(documents)}개 리뷰를 벡터 저장소에 저장")
             
         except Exception as e:
             logger.error(f"❌ 벡터 저장소 저장 오류: {e}")
     
+    async def _crawl_product_reviews(
+        self,
+        product: SpecialProduct,
+        max_reviews: int,
+        incremental: bool,
+        vector_product_id: Any
+    ) -> ProductCrawlResult:
+        """상품 1건의 리뷰 크롤링 → 새 리뷰 벡터 저장 → 크롤링 상태 갱신 (동시 크롤링 워커)"""
+        known_review_ids = await self._get_known_review_ids(product.product_id) if incremental else None
+        
+        crawl = crawler_worker_pool.crawl_product if crawler_worker_pool.is_running else crawl_product_with_fallback
+        review_result = await crawl(
+            product.product_url,
+            max_reviews,
+            known_review_ids=known_review_ids
+        )
+        
+        if not (review_result.success and (review_result.reviews or review_result.skipped_reviews)):
+            logger.warning(f"⚠️ {product.product_name}: 리뷰 크롤링 실패")
+            return review_result
+        
+        # 벡터 저장소에 새 리뷰만 저장
+        reviews = review_result.reviews
+        if reviews:
+            await self._save_reviews_to_vector_store(vector_product_id, product.product_name, reviews)
+        
+        # 크롤링 상태 업데이트
+        self.repository.update_crawl_status(
+            product.product_id,
+            True,
+            self._stored_review_count(known_review_ids, reviews, len(reviews) + review_result.skipped_reviews)
+        )
+        
+        logger.info(
+            f"✅ {product.product_name}: 새 리뷰 {len(reviews)}개 저장, "
+            f"기존 리뷰 {review_result.skipped_reviews}개 건너뜀"
+        )
+        return review_result
+    
+    @staticmethod
+    def _has_reviews(result: CrawlTaskResult) -> bool:
+        crawl = result.value
+        return result.success and crawl is not None and crawl.success and bool(crawl.reviews or crawl.skipped_reviews)
+    
+    @classmethod
+    def _summarize_review_results(cls, results: List[CrawlTaskResult]) -> Dict[str, int]:
+        """동시 크롤링 결과를 응답용 집계값으로 변환"""
+        summary = {
+            "products_with_reviews": 0,
+            "total_reviews": 0,
+            "new_reviews": 0,
+            "skipped_reviews": 0,
+            "failed_products": 0
+        }
+        for result in results:
+            if not cls._has_reviews(result):
+                summary["failed_products"] += 1
+                continue
+            crawl = result.value
+            summary["products_with_reviews"] += 1
+            summary["new_reviews"] += len(crawl.reviews)
+            summary["skipped_reviews"] += crawl.skipped_reviews
+            summary["total_reviews"] += len(crawl.reviews) + crawl.skipped_reviews
+        return summary
+    
+    async def _get_known_review_ids(self, product_id: str) -> Set[str]:
+        """벡터 저장소에 이미 저장된 상품 리뷰 ID 조회 (증분 크롤링용)"""
+        if product_id is None:
+            return set()
+        vector_store = get_vector_store()
+        return await asyncio.to_thread(vector_store.get_review_ids, str(product_id))
+    
+    @staticmethod
+    def _stored_review_count(known_review_ids: Optional[Set[str]], reviews: List[Any], crawled_count: int) -> int:
+        """크롤링 후 상품에 저장된 전체 리뷰 수 (증분 모드는 기존 리뷰 포함)"""
+        if known_review_ids is None:
+            return crawled_count
+        return len(known_review_ids) + len(reviews)
+    
     def get_special_products(self, limit: int = 50, offset: int = 0) -> SpecialProductsResponse:
         """특가 상품 목록 조회"""
         try:
@@ -184,9 +243,13 @@ class SpecialDealsService:
             logger.error(f"❌ 특가 상품 조회 오류: {e}")
             return None
     
-    async def process_uncrawled_products(self, batch_size: int = 5) -> Dict[str, Any]:
-        """아직 리뷰가 크롤링되지 않은 상품들을 배치로 처리"""
-        logger.info(f"🔄 미크롤링 상품 배치 처리 시작 (배치 크기: {batch_size})")
+    async def process_uncrawled_products(self, batch_size: int = 5, incremental: bool = True) -> Dict[str, Any]:
+        """아직 리뷰가 크롤링되지 않은 상품들을 배치로 처리
+
+        incremental=True 이면 벡터 저장소에 이미 있는 리뷰를 만나는 즉시 더보기를 멈추고
+        새 리뷰만 임베딩한다.
+        """
+        logger.info(f"🔄 미크롤링 상품 배치 처리 시작 (배치 크기: {batch_size}, 증분 모드: {incremental})")
         
         try:
             # 미크롤링 상품 조회
@@ -196,60 +259,36 @@ class SpecialDealsService:
                 return {
                     "success": True,
                     "processed_count": 0,
+                    "new_reviews": 0,
+                    "skipped_reviews": 0,
                     "message": "처리할 미크롤링 상품이 없습니다."
                 }
             
-            processed_count = 0
-            total_reviews = 0
+            results = await self._review_executor().run(
+                uncrawled_products,
+                lambda product: self._crawl_product_reviews(product, 100, incremental, product.product_id),
+                url_of=lambda product: product.product_url,
+                label_of=lambda product: product.product_name
+            )
+            
+            # 실패/타임아웃 상품도 상태는 업데이트 (재시도 방지)
+            for result in results:
+                if not self._has_reviews(result):
+                    self.repository.update_crawl_status(result.item.product_id, True, 0)
             
-            for product in uncrawled_products:
-                try:
-                    logger.info(f"📝 리뷰 크롤링: {product.product_name}")
-                    
-                    # 리뷰 크롤링
-                    review_result = await crawl_danawa_reviews(product.product_url, 100)
-                    
-                    if review_result.get("success") and review_result.get("reviews"):
-                        reviews = review_result["reviews"]
-                        review_count = len(reviews)
-                        
-                        # 벡터 저장소에 저장
-                        await self._save_reviews_to_vector_store(
-                            product.product_id,
-                            product.product_name,
-                            reviews
-                        )
-                        
-                        # 크롤링 상태 업데이트
-                        self.repository.update_crawl_status(
-                            product.product_id, 
-                            True, 
-                            review_count
-                        )
-                        
-                        processed_count += 1
-                        total_reviews += review_count
-                        
-                        logger.info(f"✅ {product.product_name}: {review_count}개 리뷰 처리 완료")
-                    else:
-                        # 실패해도 상태는 업데이트 (재시도 방지)
-                        self.repository.update_crawl_status(product.product_id, True, 0)
-                        logger.warning(f"⚠️ {product.product_name}: 리뷰 크롤링 실패")
-                    
-                    # 각 상품 처리 후 대기
-                    await asyncio.sleep(3)
-                    
-                except Exception as e:
-                    logger.error(f"❌ 상품 처리 오류 ({product.product_name}): {e}")
-                    # 오류가 발생해도 상태 업데이트
-                    self.repository.update_crawl_status(product.product_id, True, 0)
-                    continue
+            summary = self._summarize_review_results(results)
+            processed_count = summary["products_with_reviews"]
+            new_reviews = summary["new_reviews"]
+            skipped_reviews = summary["skipped_reviews"]
             
             return {
                 "success": True,
                 "processed_count": processed_count,
-                "total_reviews": total_reviews,
-                "message": f"{processed_count}개 상품의 리뷰를 처리했습니다."
+                "failed_count": summary["failed_products"],
+                "total_reviews": summary["total_reviews"],
+                "new_reviews": new_reviews,
+                "skipped_reviews": skipped_reviews,
+                "message": f"{processed_count}개 상품의 리뷰를 처리했습니다. (새 리뷰 {new_reviews}개, 건너뜀 {skipped_reviews}개)"
             }
             
         except Exception as e:
@@ -258,6 +297,8 @@ class SpecialDealsService:
                 "success": False,
                 "processed_count": 0,
                 "total_reviews": 0,
+                "new_reviews": 0,
+                "skipped_reviews": 0,
                 "error_message": str(e)
             }
     
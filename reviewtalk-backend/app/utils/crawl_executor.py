@@ -0,0 +1,93 @@
+"""
+동시 크롤링 실행기 - 워커 수 제한, 호스트별 예의(politeness) 제한, 상품별 타임아웃, 실패 격리
+"""
+import asyncio
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Generic, List, Optional, Sequence, TypeVar
+from urllib.parse import urlparse
+
+from loguru import logger
+
+from app.core.config import settings
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass
+class CrawlTaskResult(Generic[T, R]):
+    """작업 1건의 실행 결과 (예외/타임아웃은 success=False 로 격리)"""
+
+    item: T
+    success: bool
+    value: Optional[R] = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+    timed_out: bool = False
+
+
+class CrawlExecutor:
+    """제한된 동시성으로 크롤링 작업을 병렬 실행
+
+    - max_workers: 전체 동시 실행 작업 수
+    - per_host_limit: 같은 호스트에 동시에 보내는 작업 수 상한
+    - task_timeout: 작업 1건의 최대 실행 시간 (초), 초과 시 취소하고 실패로 기록
+
+    요청 속도(초당 요청 수)는 크롤러가 요청마다 거치는 host_rate_limiter 가 제한한다.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        per_host_limit: Optional[int] = None,
+        task_timeout: Optional[float] = None
+    ):
+        self.max_workers = max(1, max_workers or settings.crawl_executor_max_workers)
+        self.per_host_limit = max(1, per_host_limit or settings.crawl_executor_per_host_limit)
+        self.task_timeout = settings.crawl_executor_task_timeout if task_timeout is None else task_timeout
+
+    async def run(
+        self,
+        items: Sequence[T],
+        worker: Callable[[T], Awaitable[R]],
+        url_of: Callable[[T], str],
+        label_of: Callable[[T], str] = str
+    ) -> List[CrawlTaskResult[T, R]]:
+        """items 를 worker 로 병렬 처리하고 입력 순서대로 결과 반환"""
+        if not items:
+            return []
+
+        worker_slots = asyncio.Semaphore(self.max_workers)
+        host_slots: Dict[str, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(self.per_host_limit))
+
+        async def run_one(index: int, item: T) -> CrawlTaskResult[T, R]:
+            host = urlparse(str(url_of(item))).netloc or "unknown"
+            label = label_of(item)
+            async with worker_slots, host_slots[host]:
+                started = time.perf_counter()
+                try:
+                    value = await asyncio.wait_for(worker(item), timeout=self.task_timeout)
+                    return CrawlTaskResult(item=item, success=True, value=value, elapsed=time.perf_counter() - started)
+                except asyncio.TimeoutError:
+                    logger.warning(f"⏰ 작업 시간 초과 ({self.task_timeout:.0f}s): {label}")
+                    return CrawlTaskResult(
+                        item=item, success=False, error="timeout",
+                        elapsed=time.perf_counter() - started, timed_out=True
+                    )
+                except Exception as e:
+                    logger.error(f"❌ 작업 실패 ({label}): {e}")
+                    return CrawlTaskResult(item=item, success=False, error=str(e), elapsed=time.perf_counter() - started)
+                finally:
+                    logger.debug(f"🧵 작업 {index + 1}/{len(items)} 종료: {label}")
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(run_one(i, item) for i, item in enumerate(items)))
+        failed = sum(1 for result in results if not result.success)
+        logger.info(
+            f"🧵 동시 크롤링 완료: {len(results)}건 (실패 {failed}건), "
+            f"워커 {self.max_workers}개, {time.perf_counter() - started:.1f}s"
+        )
+        return list(results)
@@ -0,0 +1,142 @@
+"""
+호스트별 토큰 버킷 요청 속도 제한기 - 다나와로 나가는 모든 요청이 공유
+"""
+import asyncio
+import time
+from threading import Lock
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+from loguru import logger
+
+from app.core.config import settings
+
+
+class TokenBucket:
+    """초당 rate 개씩 채워지고 최대 burst 개까지 쌓이는 토큰 버킷
+
+    토큰이 부족하면 다음 토큰이 채워질 시각을 예약하고 그만큼 대기한다(FIFO).
+    상태를 스레드 락으로 보호하므로 스케줄러 스레드의 별도 이벤트 루프에서도 공유할 수 있다.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = max(rate, 0.001)
+        self.burst = max(1, int(burst))
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.waiting = 0
+        self.acquired = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.lock = Lock()
+
+    def reserve(self) -> float:
+        """토큰 1개를 예약하고 대기해야 할 시간(초) 반환"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(float(self.burst), self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            self.acquired += 1
+            delay = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            self.total_wait += delay
+            self.max_wait = max(self.max_wait, delay)
+            return delay
+
+    async def acquire(self) -> float:
+        delay = self.reserve()
+        if delay > 0:
+            with self.lock:
+                self.waiting += 1
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                with self.lock:
+                    self.waiting -= 1
+        return delay
+
+    def get_status(self) -> Dict[str, Any]:
+        with self.lock:
+            available = min(float(self.burst), self.tokens + (time.monotonic() - self.updated) * self.rate)
+            return {
+                "rate_per_second": self.rate,
+                "burst": self.burst,
+                "available_tokens": round(max(available, 0.0), 2),
+                "queue_depth": self.waiting,
+                "acquired": self.acquired,
+                "total_wait_seconds": round(self.total_wait, 3),
+                "max_wait_seconds": round(self.max_wait, 3)
+            }
+
+
+class HostRateLimiter:
+    """호스트(m.danawa.com, img.danawa.com, prod.danawa.com 등)별 토큰 버킷 모음
+
+    호스트별 속도/버스트는 settings.rate_limit_hosts 로 설정하고, 목록에 없는 호스트는 기본값을 쓴다.
+    """
+
+    def __init__(
+        self,
+        host_limits: Optional[Dict[str, Dict[str, float]]] = None,
+        default_rate: Optional[float] = None,
+        default_burst: Optional[int] = None,
+        enabled: Optional[bool] = None
+    ):
+        self.host_limits = settings.rate_limit_hosts if host_limits is None else host_limits
+        self.default_rate = settings.rate_limit_default_rate if default_rate is None else default_rate
+        self.default_burst = settings.rate_limit_default_burst if default_burst is None else default_burst
+        self.enabled = settings.rate_limit_enabled if enabled is None else enabled
+        self._buckets: Dict[str, TokenBucket] = {}
+        self.lock = Lock()
+
+    @staticmethod
+    def host_of(url_or_host: str) -> str:
+        value = str(url_or_host)
+        return (urlparse(value).netloc if "://" in value else value).lower()
+
+    def bucket(self, host: str) -> TokenBucket:
+        with self.lock:
+            if host not in self._buckets:
+                limits = self.host_limits.get(host, {})
+                self._buckets[host] = TokenBucket(
+                    rate=limits.get("rate", self.default_rate),
+                    burst=int(limits.get("burst", self.default_burst))
+                )
+            return self._buckets[host]
+
+    async def acquire(self, url_or_host: str) -> float:
+        """URL(또는 호스트)에 요청을 보내기 전 호출 - 토큰이 생길 때까지 대기 후 대기 시간 반환"""
+        if not self.enabled:
+            return 0.0
+        host = self.host_of(url_or_host)
+        delay = await self.bucket(host).acquire()
+        if delay > 0:
+            logger.debug(f"🚦 {host} 요청 속도 제한 대기 {delay:.2f}s")
+        return delay
+
+    def scale(self, factor: float) -> None:
+        """모든 호스트의 허용 속도에 factor 를 곱함 (크롤러 워커 프로세스와 전체 속도를 나눠 쓸 때)"""
+        with self.lock:
+            self.host_limits = {
+                host: {**limits, "rate": limits.get("rate", self.default_rate) * factor}
+                for host, limits in self.host_limits.items()
+            }
+            self.default_rate *= factor
+            buckets = list(self._buckets.values())
+        for bucket in buckets:
+            with bucket.lock:
+                bucket.rate = max(bucket.rate * factor, 0.001)
+
+    def get_status(self) -> Dict[str, Any]:
+        """호스트별 설정값, 가용 토큰, 현재 대기열 길이, 누적 대기 시간"""
+        with self.lock:
+            buckets = dict(self._buckets)
+        return {
+            "enabled": self.enabled,
+            "hosts": {host: bucket.get_status() for host, bucket in buckets.items()},
+            "queue_depth": sum(bucket.waiting for bucket in buckets.values())
+        }
+
+
+# 전역 호스트 속도 제한기 인스턴스
+host_rate_limiter = HostRateLimiter()
@@ -6,6 +6,7 @@ import schedule
 import time
 from datetime import datetime
 from threading import Thread
+from typing import Optional
 
 from loguru import logger
 from app.models.schemas import CrawlSpecialProductsRequest
@@ -18,6 +19,7 @@ class CrawlingScheduler:
     def __init__(self):
         self.is_running = False
         self.scheduler_thread = None
+        self.loop = None  # 앱 이벤트 루프 (브라우저 풀/워커 풀이 묶여 있는 루프)
     
     async def daily_special_deals_crawling(self):
         """매일 실행되는 특가 상품 크롤링 작업"""
@@ -28,19 +30,26 @@ class CrawlingScheduler:
             request = CrawlSpecialProductsRequest(
                 max_products=50,
                 crawl_reviews=True,  # 리뷰도 함께 크롤링으로 변경
-                max_reviews_per_product=100
+                max_reviews_per_product=100,
+                incremental=True  # 이미 저장된 리뷰를 만나면 더보기 중단, 새 리뷰만 임베딩
             )
             
             result = await special_deals_service.crawl_and_save_special_deals(request)
             
             if result.success:
-                logger.info(f"✅ [스케줄러] 특가 상품 {result.total_products}개 수집 완료")
+                logger.info(
+                    f"✅ [스케줄러] 특가 상품 {result.total_products}개 수집 완료 "
+                    f"(새 리뷰 {result.new_reviews}개, 건너뛴 리뷰 {result.skipped_reviews}개)"
+                )
                 
                 # 2. 기존 미크롤링 상품들의 리뷰 배치 처리
-                batch_result = await special_deals_service.process_uncrawled_products(batch_size=10)
+                batch_result = await special_deals_service.process_uncrawled_products(batch_size=10, incremental=True)
                 
                 if batch_result.get("success"):
-                    logger.info(f"✅ [스케줄러] 배치 처리 완료: {batch_result.get('processed_count', 0)}개 상품")
+                    logger.info(
+                        f"✅ [스케줄러] 배치 처리 완료: {batch_result.get('processed_count', 0)}개 상품 "
+                        f"(새 리뷰 {batch_result.get('new_reviews', 0)}개, 건너뛴 리뷰 {batch_result.get('skipped_reviews', 0)}개)"
+                    )
                 else:
                     logger.warning(f"⚠️ [스케줄러] 배치 처리 실패: {batch_result.get('error_message', '알 수 없는 오류')}")
                 
@@ -63,7 +72,7 @@ class CrawlingScheduler:
         
         try:
             # 미크롤링 상품들의 리뷰를 소량씩 처리
-            batch_result = await special_deals_service.process_uncrawled_products(batch_size=5)
+            batch_result = await special_deals_service.process_uncrawled_products(batch_size=5, incremental=True)
             
             if batch_result.get("success"):
                 processed = batch_result.get('processed_count', 0)
@@ -91,7 +100,13 @@ class CrawlingScheduler:
     def _run_async_job(self, async_func):
         """비동기 함수를 동기 스케줄러에서 실행"""
         try:
-            # 새로운 이벤트 루프에서 실행
+            if self.loop is not None and self.loop.is_running():
+                # 앱 이벤트 루프로 넘겨 실행해야 브라우저 풀(공유 Chromium)과 워커 풀을 그대로 쓴다
+                # (스케줄러 스레드의 새 루프에서는 상품마다 1회용 브라우저를 띄움)
+                asyncio.run_coroutine_threadsafe(async_func(), self.loop).result()
+                return
+
+            # 앱 루프가 없으면 (단독 실행 등) 새로운 이벤트 루프에서 실행
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
             loop.run_until_complete(async_func())
@@ -99,12 +114,13 @@ class CrawlingScheduler:
         except Exception as e:
             logger.error(f"❌ [스케줄러] 비동기 작업 실행 오류: {e}")
     
-    def start_scheduler(self):
-        """스케줄러 시작"""
+    def start_scheduler(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """스케줄러 시작 (loop: 작업을 실행할 앱 이벤트 루프)"""
         if self.is_running:
             logger.warning("⚠️ [스케줄러] 이미 실행 중입니다")
             return
         
+        self.loop = loop
         self.is_running = True
         self.schedule_daily_jobs()
         
@@ -158,10 +174,10 @@ class CrawlingScheduler:
 crawler_scheduler = CrawlingScheduler()
 
 
-def init_scheduler():
-    """애플리케이션 시작시 스케줄러 초기화"""
+def init_scheduler(loop: Optional[asyncio.AbstractEventLoop] = None):
+    """애플리케이션 시작시 스케줄러 초기화 (loop: 스케줄 작업을 실행할 앱 이벤트 루프)"""
     try:
-        crawler_scheduler.start_scheduler()
+        crawler_scheduler.start_scheduler(loop)
         logger.info("✅ 자동 크롤링 스케줄러가 초기화되었습니다")
     except Exception as e:
         logger.error(f"❌ 스케줄러 초기화 실패: {e}")
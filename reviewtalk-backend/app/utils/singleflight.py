@@ -0,0 +1,142 @@
+"""
+SingleFlight - 같은 키의 동시 작업을 1회만 실행하고 결과를 공유 (최근 결과는 TTL 동안 재사용)
+"""
+import asyncio
+import time
+from threading import Lock
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, NamedTuple, Optional, Tuple, TypeVar
+
+from loguru import logger
+
+
+T = TypeVar("T")
+
+
+class _Flight(NamedTuple):
+    """진행 중 작업 (size: 작업이 다루는 범위, context: 합류한 요청에 넘길 객체)"""
+
+    loop: asyncio.AbstractEventLoop
+    task: "asyncio.Task"
+    size: int
+    context: Any
+
+
+class SingleFlight(Generic[T]):
+    """키별 진행 중 작업 레지스트리
+
+    - 같은 키로 작업이 진행 중이면 새 작업을 시작하지 않고 진행 중인 결과를 기다린다.
+    - cacheable(result) 가 참인 결과는 ttl 초 동안 보관해 바로 반환한다 (ttl=0 이면 보관하지 않음).
+    - size 를 주면 진행 중/보관 중인 작업의 size 가 요청 이상일 때만 재사용한다
+      (예: 리뷰 50개 크롤링 결과를 200개 요청에 돌려주지 않음).
+      더 작은 작업이 진행 중이면 끝날 때까지 기다렸다가 실행하므로 같은 키의 작업이 동시에 돌지 않는다.
+    - 진행 중 작업에 합류하면 on_join(context) 로 작업을 시작한 요청의 context 를 전달한다 (진행 상황 공유용).
+    - 진행 중 작업은 이벤트 루프에 묶이므로 다른 루프(스케줄러 스레드)에서 온 요청은 공유하지 않고 직접 실행한다.
+    """
+
+    def __init__(self, ttl: float = 0.0, cacheable: Callable[[T], bool] = lambda result: True):
+        self.ttl = ttl
+        self.cacheable = cacheable
+        self._inflight: Dict[Hashable, _Flight] = {}
+        self._results: Dict[Hashable, Tuple[float, int, T]] = {}
+        self.stats = {"executions": 0, "shared": 0, "cache_hits": 0}
+        self.lock = Lock()
+
+    def get_cached(self, key: Hashable, size: int = 0) -> Optional[T]:
+        with self.lock:
+            entry = self._results.get(key)
+            if entry is None:
+                return None
+            stored_at, stored_size, result = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._results[key]
+                return None
+            if stored_size < size:
+                return None
+            return result
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[T]],
+        size: int = 0,
+        context: Any = None,
+        on_join: Optional[Callable[[Any], None]] = None
+    ) -> T:
+        """key 에 대해 fn 을 최대 1회만 실행하고 결과를 반환
+
+        같은 키의 진행 중 작업이 요청보다 작으면 새 작업을 동시에 시작하지 않고
+        그 작업이 끝나길 기다린 뒤 다시 확인한다 (같은 키의 작업은 한 번에 하나만 실행).
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            cached = self.get_cached(key, size)
+            if cached is not None:
+                with self.lock:
+                    self.stats["cache_hits"] += 1
+                logger.info(f"♻️ 최근 결과 재사용: {key}")
+                return cached
+
+            smaller = None
+            with self.lock:
+                inflight = self._inflight.get(key)
+                if inflight is not None and inflight.loop is loop:
+                    if inflight.size >= size:
+                        flight = inflight
+                        self.stats["shared"] += 1
+                        shared = True
+                    else:
+                        smaller = inflight.task
+                else:
+                    flight = _Flight(loop, loop.create_task(self._run(key, size, fn)), size, context)
+                    if inflight is None:
+                        self._inflight[key] = flight
+                    self.stats["executions"] += 1
+                    shared = False
+
+            if smaller is None:
+                break
+            logger.info(f"⏳ 진행 중인 더 작은 작업이 끝난 뒤 실행: {key}")
+            try:
+                await asyncio.shield(smaller)
+            except Exception:
+                pass
+
+        if shared:
+            logger.info(f"🔗 진행 중인 작업 결과 대기: {key}")
+            if on_join:
+                try:
+                    on_join(flight.context)
+                except Exception as e:
+                    logger.debug(f"작업 합류 콜백 오류 ({key}): {e}")
+        # 요청 하나가 취소되어도 공유 중인 작업은 계속 진행
+        return await asyncio.shield(flight.task)
+
+    async def _run(self, key: Hashable, size: int, fn: Callable[[], Awaitable[T]]) -> T:
+        try:
+            result = await fn()
+            if self.ttl > 0 and self.cacheable(result):
+                with self.lock:
+                    # 늦게 끝난 작은 작업이 더 큰 최근 결과를 덮어쓰지 않게 한다
+                    entry = self._results.get(key)
+                    if entry is None or entry[1] <= size or time.monotonic() - entry[0] > self.ttl:
+                        self._results[key] = (time.monotonic(), size, result)
+            return result
+        finally:
+            with self.lock:
+                inflight = self._inflight.get(key)
+                if inflight is not None and inflight.task is asyncio.current_task():
+                    del self._inflight[key]
+
+    def forget(self, key: Hashable) -> None:
+        """보관 중인 결과 삭제"""
+        with self.lock:
+            self._results.pop(key, None)
+
+    def get_status(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                "in_flight": len(self._inflight),
+                "cached_results": len(self._results),
+                "ttl_seconds": self.ttl,
+                **self.stats
+            }
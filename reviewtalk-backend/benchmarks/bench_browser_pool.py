@@ -0,0 +1,58 @@
+"""
+브라우저 풀 벤치마크 - 상품당 크롤링 지연시간 비교 (1회용 브라우저 vs 공유 풀)
+
+사용법 (reviewtalk-backend 디렉터리에서):
+    uv run python -m benchmarks.bench_browser_pool --runs 10
+    uv run python -m benchmarks.bench_browser_pool --runs 5 --url "https://m.danawa.com/product/product.html?code=..."
+
+--url 을 주지 않으면 네트워크 없이 페이지 임대 + 빈 페이지 렌더링 비용만 측정한다.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.infrastructure.crawler.browser_pool import BrowserPool
+from app.infrastructure.crawler.danawa_crawler import DanawaCrawler, crawl_danawa_reviews
+
+
+async def _run_once(pool: BrowserPool, url: str, max_reviews: int) -> float:
+    started = time.perf_counter()
+    if url:
+        await crawl_danawa_reviews(url, max_reviews, pool=pool)
+    else:
+        async with DanawaCrawler(pool=pool) as crawler:
+            await crawler.page.set_content("<html><body><p>benchmark</p></body></html>")
+    return time.perf_counter() - started
+
+
+async def _measure(label: str, pool: BrowserPool, runs: int, url: str, max_reviews: int):
+    latencies = [await _run_once(pool, url, max_reviews) for _ in range(runs)]
+    print(
+        f"{label:<12} runs={runs} "
+        f"mean={statistics.mean(latencies) * 1000:.0f}ms "
+        f"p50={statistics.median(latencies) * 1000:.0f}ms "
+        f"max={max(latencies) * 1000:.0f}ms "
+        f"launches={pool.stats['browser_launches']}"
+    )
+
+
+async def main(runs: int, url: str, max_reviews: int):
+    # 기존 방식: 풀을 시작하지 않으면 임대마다 1회용 브라우저를 띄운다
+    await _measure("standalone", BrowserPool(), runs, url, max_reviews)
+
+    pool = BrowserPool(max_concurrency=1)
+    await pool.start()
+    try:
+        await _measure("pooled", pool, runs, url, max_reviews)
+    finally:
+        await pool.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="브라우저 풀 지연시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--url", default="", help="실제 크롤링할 다나와 상품 URL (생략 시 오프라인 측정)")
+    parser.add_argument("--max-reviews", type=int, default=30)
+    args = parser.parse_args()
+    asyncio.run(main(args.runs, args.url, args.max_reviews))
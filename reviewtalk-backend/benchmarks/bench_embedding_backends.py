@@ -0,0 +1,113 @@
+"""
+임베딩 백엔드 벤치마크 - PyTorch SentenceTransformer vs int8 양자화 ONNX Runtime
+(모델 로드 시간, 질의 1건 지연, 배치 처리량, 최대 RSS, PyTorch 출력과의 코사인 일치도)
+
+백엔드마다 별도 프로세스에서 측정해 import/메모리가 섞이지 않게 한다.
+
+사용법 (reviewtalk-backend 디렉터리에서, ONNX 모델을 먼저 내보낸 뒤):
+    uv run python -m app.infrastructure.ai.encoders
+    uv run python -m benchmarks.bench_embedding_backends --repeat 20
+"""
+import argparse
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+
+CORPUS = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "embedding_corpus.txt"
+
+
+def _max_rss_mb() -> float:
+    """현재 프로세스 최대 RSS (MB, Linux 는 KB / macOS 는 byte 단위)"""
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+
+
+def load_corpus(repeat: int):
+    lines = [line for line in CORPUS.read_text(encoding="utf-8").splitlines() if line.strip()]
+    return ["query: " + line for line in lines], ["query: " + line for line in lines * repeat]
+
+
+def run_backend(backend: str, repeat: int, output: str) -> Dict[str, float]:
+    """한 백엔드 측정 (자식 프로세스에서 실행)"""
+    started = time.perf_counter()
+    from app.core.config import settings
+    settings.embedding_backend = backend
+    from app.infrastructure.ai.encoders import create_encoder
+    encoder, _ = create_encoder()
+    load_seconds = time.perf_counter() - started
+
+    corpus, bulk = load_corpus(repeat)
+    embeddings = encoder.encode(corpus, batch_size=settings.embedding_batch_size, convert_to_numpy=True)
+    np.save(output, np.asarray(embeddings, dtype=np.float32))
+
+    latencies = []
+    for text in corpus:
+        query_started = time.perf_counter()
+        encoder.encode([text], convert_to_numpy=True)
+        latencies.append(time.perf_counter() - query_started)
+
+    bulk_started = time.perf_counter()
+    encoder.encode(bulk, batch_size=settings.embedding_batch_size, convert_to_numpy=True)
+    bulk_seconds = time.perf_counter() - bulk_started
+
+    return {
+        "load_seconds": load_seconds,
+        "query_p50_ms": statistics.median(latencies) * 1000,
+        "query_p95_ms": sorted(latencies)[int(len(latencies) * 0.95)] * 1000,
+        "texts_per_second": len(bulk) / bulk_seconds,
+        "max_rss_mb": _max_rss_mb()
+    }
+
+
+def main(repeat: int):
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for backend in ("torch", "onnx"):
+            output = str(Path(tmp_dir) / f"{backend}.npy")
+            completed = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_embedding_backends",
+                 "--worker", backend, "--repeat", str(repeat), "--output", output],
+                capture_output=True, text=True
+            )
+            if completed.returncode != 0:
+                print(f"{backend:<6} 실패: {completed.stderr.strip().splitlines()[-1:]}")
+                continue
+            results[backend] = json.loads(completed.stdout.strip().splitlines()[-1])
+            results[backend]["embeddings"] = np.load(output)
+
+    for backend, result in results.items():
+        print(
+            f"{backend:<6} load={result['load_seconds']:.1f}s "
+            f"query_p50={result['query_p50_ms']:.1f}ms p95={result['query_p95_ms']:.1f}ms "
+            f"throughput={result['texts_per_second']:.0f} texts/s max_rss={result['max_rss_mb']:.0f}MB"
+        )
+
+    if "torch" in results and "onnx" in results:
+        reference = results["torch"]["embeddings"]
+        reference = reference / np.linalg.norm(reference, axis=1, keepdims=True)
+        agreement = (reference * results["onnx"]["embeddings"]).sum(axis=1)
+        print(
+            f"cosine agreement (onnx vs torch, {len(agreement)} texts): "
+            f"mean={agreement.mean():.4f} min={agreement.min():.4f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="임베딩 백엔드(torch/onnx) 벤치마크")
+    parser.add_argument("--repeat", type=int, default=20, help="처리량 측정용 코퍼스 반복 횟수")
+    parser.add_argument("--worker", choices=["torch", "onnx"], help=argparse.SUPPRESS)
+    parser.add_argument("--output", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.worker:
+        print(json.dumps(run_backend(args.worker, args.repeat, args.output)))
+    else:
+        main(args.repeat)
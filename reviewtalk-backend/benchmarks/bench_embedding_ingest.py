@@ -0,0 +1,73 @@
+"""
+임베딩 색인 벤치마크 - 리뷰 전체를 한 번에 upsert vs 청크 단위 임베딩/upsert (초당 리뷰 수와 메모리)
+
+사용법 (reviewtalk-backend 디렉터리에서):
+    uv run python -m benchmarks.bench_embedding_ingest --reviews 2000 --chunk-size 256
+    # 한 번에 upsert 하는 기존 방식과 비교 (max_rss 가 섞이지 않도록 모드별로 따로 실행)
+    uv run python -m benchmarks.bench_embedding_ingest --reviews 2000 --mode single
+"""
+import argparse
+import resource
+import sys
+import tempfile
+import time
+
+from app.core.config import settings
+from app.models.schemas import ReviewData
+
+
+def _max_rss_mb() -> float:
+    """현재 프로세스 최대 RSS (MB, Linux 는 KB / macOS 는 byte 단위)"""
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+
+
+def build_reviews(count: int) -> list:
+    """합성 리뷰 N개 (길이를 조금씩 다르게 해 실제 배치 패딩 비용을 반영)"""
+    return [
+        ReviewData(
+            review_id=f"bench_{i}",
+            content=f"배송이 빠르고 품질이 좋아요. 리뷰 번호 {i} 입니다. " + "가성비도 훌륭하고 재구매 의사 있습니다. " * (i % 4 + 1),
+            rating=i % 5 + 1,
+            author=f"user{i}",
+            date="2024-05-01"
+        )
+        for i in range(count)
+    ]
+
+
+def main(review_count: int, chunk_size: int, mode: str):
+    with tempfile.TemporaryDirectory() as chroma_dir:
+        # 실제 색인 데이터와 섞이지 않도록 임시 경로 사용
+        settings.chroma_db_path = chroma_dir
+        from app.infrastructure.ai.vector_store import VectorStore
+
+        started = time.perf_counter()
+        store = VectorStore()
+        load_seconds = time.perf_counter() - started
+        reviews = build_reviews(review_count)
+        product_info = {"product_name": "벤치마크 상품", "product_url": "https://m.danawa.com/product/product.html?code=0"}
+
+        # 모델 첫 호출 비용(토크나이저/그래프 초기화)을 측정에서 제외
+        store.embedding_function.embed(["warm up"])
+
+        # single: 기존처럼 리뷰 전체를 청크 하나로 처리
+        effective_chunk = review_count if mode == "single" else chunk_size
+        started = time.perf_counter()
+        store.add_reviews(reviews, "bench", product_info, chunk_size=effective_chunk)
+        seconds = time.perf_counter() - started
+
+        print(
+            f"{mode:<8} reviews={review_count} chunk={effective_chunk} batch={store.embedding_function.batch_size} "
+            f"model_load={load_seconds:.1f}s ingest={seconds:.2f}s "
+            f"throughput={review_count / seconds:.0f} reviews/s max_rss={_max_rss_mb():.0f}MB"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="리뷰 임베딩/색인 벤치마크")
+    parser.add_argument("--reviews", type=int, default=2000, help="합성 리뷰 수")
+    parser.add_argument("--chunk-size", type=int, default=settings.vector_store_chunk_size)
+    parser.add_argument("--mode", choices=["chunked", "single"], default="chunked")
+    args = parser.parse_args()
+    main(args.reviews, args.chunk_size, args.mode)
@@ -0,0 +1,101 @@
+"""
+HTTP 경로 벤치마크 - httpx 리뷰 수집 vs Playwright 크롤링 (상품 1건당 시간과 메모리)
+
+사용법 (reviewtalk-backend 디렉터리에서):
+    # 실제 다나와 페이지로 비교 (네트워크 필요)
+    uv run python -m benchmarks.bench_http_fast_path --url "https://m.danawa.com/product/product.html?code=..." --runs 3
+    # 네트워크 없이 합성 픽스처로 비교 (httpx 는 MockTransport, 브라우저는 재생 아카이브 사용)
+    uv run python -m benchmarks.bench_http_fast_path --synthetic --reviews 50
+"""
+import argparse
+import asyncio
+import resource
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+import httpx
+
+from app.core.config import settings
+from app.infrastructure.crawler.browser_pool import BrowserPool
+from app.infrastructure.crawler.danawa_crawler import DanawaCrawler
+from app.infrastructure.crawler.http_review_fetcher import HttpReviewFetcher
+from app.utils.rate_limiter import host_rate_limiter
+from benchmarks.bench_replay import SYNTHETIC_URL, _build_synthetic_archive
+from benchmarks.fixtures import build_review_page
+
+
+def _max_rss_mb() -> float:
+    """현재 프로세스 최대 RSS (MB, Linux 는 KB / macOS 는 byte 단위)"""
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+
+
+def _report(label: str, samples: List[Dict[str, float]]):
+    def median(key: str) -> float:
+        return statistics.median(sample[key] for sample in samples)
+
+    print(
+        f"{label:<10} runs={len(samples)} reviews={median('reviews'):.0f} "
+        f"per_product={median('seconds') * 1000:.0f}ms max_rss={_max_rss_mb():.0f}MB"
+    )
+
+
+async def bench_http(url: str, max_reviews: int, runs: int, synthetic_reviews: int) -> List[Dict[str, float]]:
+    fetcher = HttpReviewFetcher()
+    if synthetic_reviews:
+        html = build_review_page(synthetic_reviews)
+        # 고정 HTML 을 응답하는 transport 로 교체해 네트워크 없이 파싱 비용만 측정
+        fetcher._new_client = lambda: httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, text=html))
+        )
+
+    samples = []
+    try:
+        for _ in range(runs):
+            started = time.perf_counter()
+            result = await fetcher.fetch_product(url, max_reviews)
+            samples.append({"seconds": time.perf_counter() - started, "reviews": len(result.reviews)})
+    finally:
+        await fetcher.close()
+    return samples
+
+
+async def bench_browser(url: str, max_reviews: int, runs: int) -> List[Dict[str, float]]:
+    pool = BrowserPool(max_concurrency=1)
+    await pool.start()
+    samples = []
+    try:
+        for _ in range(runs):
+            started = time.perf_counter()
+            async with DanawaCrawler(pool=pool) as crawler:
+                result = await crawler.crawl_product(url, max_reviews)
+            samples.append({"seconds": time.perf_counter() - started, "reviews": len(result.reviews)})
+    finally:
+        await pool.stop()
+    return samples
+
+
+async def main(url: str, max_reviews: int, runs: int, synthetic_reviews: int):
+    if synthetic_reviews:
+        url = SYNTHETIC_URL
+        settings.crawler_replay_mode = "replay"
+        settings.crawler_replay_archive = str(_build_synthetic_archive(synthetic_reviews).path)
+        # 합성 픽스처는 실제 사이트에 요청하지 않으므로 속도 제한 불필요
+        host_rate_limiter.enabled = False
+
+    # HTTP 경로를 먼저 측정해야 max_rss 가 브라우저 프로세스 없이 기록된다 (Chromium 은 별도 프로세스라 포함되지 않음)
+    _report("http", await bench_http(url, max_reviews, runs, synthetic_reviews))
+    _report("playwright", await bench_browser(url, max_reviews, runs))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HTTP 경로 vs Playwright 크롤링 벤치마크")
+    parser.add_argument("--url", default=SYNTHETIC_URL, help="다나와 모바일 상품 URL")
+    parser.add_argument("--max-reviews", type=int, default=50)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--synthetic", action="store_true", help="합성 픽스처 사용 (네트워크 없음)")
+    parser.add_argument("--reviews", type=int, default=50, help="합성 픽스처 리뷰 수")
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.max_reviews, args.runs, args.reviews if args.synthetic else 0))
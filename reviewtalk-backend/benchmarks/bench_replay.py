@@ -0,0 +1,135 @@
+"""
+오프라인 재생 벤치마크 - 기록해 둔 아카이브로 네트워크 없이 크롤링을 반복해 추출 처리량, 대기 시간, 메모리 측정
+
+사용법 (reviewtalk-backend 디렉터리에서):
+    # 1. 실제 다나와 페이지를 아카이브에 기록 (네트워크 필요)
+    uv run python -m benchmarks.bench_replay record --url "https://m.danawa.com/product/product.html?code=..."
+    # 2. 네트워크 없이 재생 (--latency 로 응답 지연 주입)
+    uv run python -m benchmarks.bench_replay run --url "https://m.danawa.com/product/product.html?code=..." --latency 0.05
+    # 기록 없이 합성 픽스처 아카이브로 실행 (CI 용)
+    uv run python -m benchmarks.bench_replay run --synthetic --reviews 100
+"""
+import argparse
+import asyncio
+import resource
+import statistics
+import sys
+import tempfile
+from typing import Dict, List
+
+from playwright.async_api import Page
+
+from app.core.config import settings
+from app.infrastructure.crawler.browser_pool import BrowserPool
+from app.infrastructure.crawler.danawa_crawler import DanawaCrawler
+from app.infrastructure.crawler.replay import CrawlArchive, get_archive
+from app.utils.rate_limiter import host_rate_limiter
+from benchmarks.fixtures import build_review_page
+
+
+SYNTHETIC_URL = "https://m.danawa.com/product/product.html?code=99999999"
+
+
+def _build_synthetic_archive(review_count: int) -> CrawlArchive:
+    """fixtures.build_review_page 로 상품 페이지 1건짜리 아카이브 생성"""
+    archive = CrawlArchive(tempfile.mkdtemp(prefix="crawl_archive_"))
+    archive.put(
+        "GET", SYNTHETIC_URL, None, 200,
+        {"content-type": "text/html; charset=utf-8"},
+        build_review_page(review_count).encode("utf-8"),
+        "document"
+    )
+    archive.save()
+    return archive
+
+
+def _max_rss_mb() -> float:
+    """현재 프로세스 최대 RSS (MB, Linux 는 KB / macOS 는 byte 단위)"""
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+
+
+async def _js_heap_mb(page: Page) -> float:
+    """CDP Performance.getMetrics 의 JSHeapUsedSize (MB)"""
+    session = await page.context.new_cdp_session(page)
+    try:
+        await session.send("Performance.enable")
+        metrics = await session.send("Performance.getMetrics")
+        values = {item["name"]: item["value"] for item in metrics["metrics"]}
+        return values.get("JSHeapUsedSize", 0) / (1024 * 1024)
+    finally:
+        await session.detach()
+
+
+async def _crawl_once(pool: BrowserPool, url: str, max_reviews: int) -> Dict[str, float]:
+    async with DanawaCrawler(pool=pool) as crawler:
+        result = await crawler.crawl_product(url, max_reviews)
+        metrics = crawler.metrics.to_dict()
+        extract_seconds = metrics["stages"].get("extract_reviews", 0.0)
+        return {
+            "total": metrics["total_seconds"],
+            "wait": sum(wait["total_seconds"] for wait in metrics["waits"].values()),
+            "reviews": len(result.reviews),
+            "reviews_per_sec": len(result.reviews) / extract_seconds if extract_seconds else 0.0,
+            "js_heap_mb": await _js_heap_mb(crawler.page),
+        }
+
+
+async def record(url: str, max_reviews: int):
+    settings.crawler_replay_mode = "record"
+    archive = get_archive()
+    pool = BrowserPool(max_concurrency=1)
+    await pool.start()
+    try:
+        await _crawl_once(pool, url, max_reviews)
+    finally:
+        await pool.stop()
+        archive.save()
+    print(f"recorded {len(archive.entries)} responses -> {archive.path}")
+
+
+async def run(url: str, max_reviews: int, runs: int, latency: float, synthetic_reviews: int):
+    settings.crawler_replay_mode = "replay"
+    settings.crawler_replay_latency = latency
+    if synthetic_reviews:
+        archive = _build_synthetic_archive(synthetic_reviews)
+        settings.crawler_replay_archive = str(archive.path)
+        url = SYNTHETIC_URL
+    # 재생은 실제 사이트에 요청하지 않으므로 속도 제한 불필요
+    host_rate_limiter.enabled = False
+
+    pool = BrowserPool(max_concurrency=1)
+    await pool.start()
+    samples: List[Dict[str, float]] = []
+    try:
+        for _ in range(runs):
+            samples.append(await _crawl_once(pool, url, max_reviews))
+    finally:
+        await pool.stop()
+
+    def median(key: str) -> float:
+        return statistics.median(sample[key] for sample in samples)
+
+    print(
+        f"replay runs={runs} latency={latency * 1000:.0f}ms reviews={median('reviews'):.0f} "
+        f"total={median('total'):.2f}s wait={median('wait'):.2f}s "
+        f"extract={median('reviews_per_sec'):.0f} reviews/s "
+        f"js_heap={median('js_heap_mb'):.1f}MB max_rss={_max_rss_mb():.0f}MB"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="오프라인 재생 크롤링 벤치마크")
+    parser.add_argument("mode", choices=["record", "run"])
+    parser.add_argument("--url", default=SYNTHETIC_URL, help="다나와 모바일 상품 URL")
+    parser.add_argument("--max-reviews", type=int, default=50)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.0, help="재생 응답 지연 (초)")
+    parser.add_argument("--synthetic", action="store_true", help="합성 픽스처 아카이브 사용")
+    parser.add_argument("--reviews", type=int, default=100, help="합성 픽스처 리뷰 수")
+    args = parser.parse_args()
+
+    if args.mode == "record":
+        asyncio.run(record(args.url, args.max_reviews))
+    else:
+        asyncio.run(run(args.url, args.max_reviews, args.runs, args.latency, args.reviews if args.synthetic else 0))
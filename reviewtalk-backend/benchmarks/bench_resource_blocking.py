@@ -0,0 +1,55 @@
+"""
+리소스 차단 벤치마크 - 차단 정책 적용 전/후 요청 수, 수신 바이트, 페이지 준비 시간 비교
+
+사용법 (reviewtalk-backend 디렉터리에서, 실제 다나와 접속 필요):
+    uv run python -m benchmarks.bench_resource_blocking --url "https://m.danawa.com/product/product.html?code=..."
+"""
+import argparse
+import asyncio
+
+from app.infrastructure.crawler.browser_pool import BrowserPool
+from app.infrastructure.crawler.danawa_crawler import DanawaCrawler
+
+
+async def _crawl(pool: BrowserPool, url: str, max_reviews: int, resource_mode: str) -> dict:
+    async with DanawaCrawler(pool=pool, resource_mode=resource_mode) as crawler:
+        await crawler.crawl_product(url, max_reviews)
+        return crawler.metrics.to_dict()
+
+
+async def main(url: str, max_reviews: int):
+    pool = BrowserPool(max_concurrency=1)
+    await pool.start()
+    try:
+        baseline = await _crawl(pool, url, max_reviews, "allow_all")
+        blocked = await _crawl(pool, url, max_reviews, "review")
+    finally:
+        await pool.stop()
+
+    for label, metrics in (("allow_all", baseline), ("review", blocked)):
+        network = metrics["network"]
+        print(
+            f"{label:<10} requests={network['requests_allowed']} blocked={network['requests_blocked']} "
+            f"bytes={network['bytes_loaded'] / 1024:.0f}KB navigate={metrics['stages'].get('navigate', 0):.2f}s "
+            f"total={metrics['total_seconds']:.2f}s"
+        )
+
+    saved_requests = baseline["network"]["requests_allowed"] - blocked["network"]["requests_allowed"]
+    saved_bytes = baseline["network"]["bytes_loaded"] - blocked["network"]["bytes_loaded"]
+    print(f"saved: requests={saved_requests} bytes={saved_bytes / 1024:.0f}KB")
+
+    # 차단된 리소스 타입별 절약 바이트 = 차단 없이 받은 바이트 - 차단 후 받은 바이트 (URL 패턴 차단분 포함)
+    for resource_type, count in sorted(blocked["network"]["blocked_by_type"].items()):
+        saved = (
+            baseline["network"]["bytes_by_type"].get(resource_type, 0)
+            - blocked["network"]["bytes_by_type"].get(resource_type, 0)
+        )
+        print(f"  {resource_type:<12} blocked={count} saved={saved / 1024:.0f}KB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="리소스 차단 벤치마크")
+    parser.add_argument("--url", required=True, help="다나와 모바일 상품 URL")
+    parser.add_argument("--max-reviews", type=int, default=30)
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.max_reviews))
@@ -0,0 +1,72 @@
+"""
+리뷰 추출 벤치마크 - 요소별 round trip 방식 vs page.evaluate 1회 방식 (100개당 추출 시간)
+
+사용법 (reviewtalk-backend 디렉터리에서):
+    uv run python -m benchmarks.bench_review_extraction --reviews 100 --runs 5
+"""
+import argparse
+import asyncio
+import re
+import statistics
+import time
+
+from playwright.async_api import Page
+
+from app.infrastructure.crawler.browser_pool import BrowserPool
+from app.infrastructure.crawler.danawa_crawler import DanawaCrawler
+from benchmarks.fixtures import build_review_page
+
+
+async def _legacy_extract(page: Page, max_reviews: int) -> int:
+    """이전 구현: 리뷰마다 get_attribute / query_selector / inner_text 호출"""
+    count = 0
+    containers = await page.query_selector_all('[id*="productBlog-opinion-mall-list-listItem-"] > div')
+    for container in containers:
+        if count >= max_reviews:
+            break
+        container_id = await container.get_attribute('id')
+        if not container_id:
+            parent = await container.query_selector('xpath=..')
+            if parent:
+                container_id = await parent.get_attribute('id')
+        review_id = container_id.replace('productBlog-opinion-mall-list-listItem-', '')
+        text_element = await page.query_selector(f"#productBlog-opinion-mall-list-content-{review_id}")
+        rating_element = await page.query_selector(
+            f"#productBlog-opinion-mall-list-listItem-{review_id} > div > div > div:nth-child(1) > div > span > span"
+        )
+        text = (await text_element.inner_text()).strip() if text_element else ""
+        if rating_element:
+            re.search(r'(\d+)', await rating_element.inner_text())
+        if len(text) > 10:
+            count += 1
+    return count
+
+
+async def main(review_count: int, runs: int):
+    pool = BrowserPool(max_concurrency=1)
+    await pool.start()
+    try:
+        async with DanawaCrawler(pool=pool) as crawler:
+            await crawler.page.set_content(build_review_page(review_count))
+
+            for label, extract in (
+                ("legacy", lambda: _legacy_extract(crawler.page, review_count)),
+                ("evaluate", lambda: crawler._extract_mobile_reviews(review_count)),
+            ):
+                timings = []
+                for _ in range(runs):
+                    started = time.perf_counter()
+                    await extract()
+                    timings.append(time.perf_counter() - started)
+                per_100 = statistics.median(timings) / review_count * 100
+                print(f"{label:<9} reviews={review_count} runs={runs} per_100_reviews={per_100 * 1000:.1f}ms")
+    finally:
+        await pool.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="리뷰 추출 벤치마크")
+    parser.add_argument("--reviews", type=int, default=100)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.reviews, args.runs))
@@ -0,0 +1,96 @@
+"""
+앱 시작 시간 벤치마크 - `import app.main` 시간, 프로세스 시작 → 첫 응답(/health), → 준비 완료(/health/ready)
+
+사용법 (reviewtalk-backend 디렉터리에서):
+    uv run python -m benchmarks.bench_startup --runs 3
+    # 변경 전과 비교: 이전 커밋을 별도 작업 트리로 꺼내 같은 벤치마크 실행
+    git worktree add /tmp/reviewtalk-before <commit>
+    uv run python -m benchmarks.bench_startup --app-dir /tmp/reviewtalk-before/reviewtalk-backend
+
+/health/ready 가 없는 이전 버전은 ready 를 n/a 로 표시한다 (모델은 첫 채팅 요청 때 로드됨).
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+import httpx
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_import(app_dir: str) -> float:
+    """새 프로세스에서 app.main import 에 걸린 시간 (초)"""
+    code = "import time; t = time.perf_counter(); import app.main; print(time.perf_counter() - t)"
+    completed = subprocess.run([sys.executable, "-c", code], cwd=app_dir, capture_output=True, text=True, check=True)
+    return float(completed.stdout.strip().splitlines()[-1])
+
+
+def _wait_for(client: httpx.Client, url: str, started: float, timeout: float) -> Optional[float]:
+    """url 이 200 을 반환할 때까지 폴링 (404 면 엔드포인트 없음 → None)"""
+    while time.perf_counter() - started < timeout:
+        try:
+            response = client.get(url)
+            if response.status_code == 200:
+                return time.perf_counter() - started
+            if response.status_code == 404:
+                return None
+        except httpx.TransportError:
+            pass
+        time.sleep(0.05)
+    raise TimeoutError(f"{url} 응답 대기 시간 초과 ({timeout}s)")
+
+
+def measure_server(app_dir: str, timeout: float) -> Dict[str, Optional[float]]:
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    env = {**os.environ, "BROWSER_POOL_ENABLED": os.environ.get("BROWSER_POOL_ENABLED", "false")}
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port)],
+        cwd=app_dir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        with httpx.Client(timeout=5.0) as client:
+            first_response = _wait_for(client, f"{base_url}/health", started, timeout)
+            ready = _wait_for(client, f"{base_url}/health/ready", started, timeout)
+        return {"first_response": first_response, "ready": ready}
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def _format(samples: List[Optional[float]]) -> str:
+    values = [sample for sample in samples if sample is not None]
+    return f"{statistics.median(values):.2f}s" if values else "n/a"
+
+
+def main(app_dir: str, runs: int, timeout: float):
+    imports, first_responses, readies = [], [], []
+    for _ in range(runs):
+        imports.append(measure_import(app_dir))
+        result = measure_server(app_dir, timeout)
+        first_responses.append(result["first_response"])
+        readies.append(result["ready"])
+
+    print(
+        f"runs={runs} import_app_main={_format(imports)} "
+        f"start_to_first_response={_format(first_responses)} start_to_ready={_format(readies)}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="앱 시작 시간 벤치마크")
+    parser.add_argument("--app-dir", default=".", help="측정할 reviewtalk-backend 디렉터리")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--timeout", type=float, default=180.0)
+    args = parser.parse_args()
+    main(os.path.abspath(args.app_dir), args.runs, args.timeout)
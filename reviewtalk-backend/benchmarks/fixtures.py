@@ -0,0 +1,28 @@
+"""
+벤치마크용 합성 HTML 픽스처 - 모바일 다나와 DOM 구조를 흉내낸 페이지 생성
+"""
+
+
+def build_review_page(review_count: int, product_name: str = "벤치마크 상품") -> str:
+    """리뷰 N개가 로드된 모바일 상품 페이지 HTML"""
+    items = []
+    for i in range(review_count):
+        review_id = 9123372001990000000 + i
+        items.append(f"""
+        <li id="productBlog-opinion-mall-list-listItem-{review_id}">
+          <div><div>
+            <div><div><span><span>{i % 5 + 1}점</span></span></div></div>
+            <div id="productBlog-opinion-mall-list-content-{review_id}">
+              배송이 빠르고 품질이 좋아요. 리뷰 번호 {i} 입니다. 가성비도 훌륭하고 재구매 의사 있습니다.
+            </div>
+            <span class="date">24.05.{i % 28 + 1:02d}</span>
+          </div></div>
+        </li>""")
+
+    return f"""
+    <html><body>
+      <h1 id="productBlog-productName">{product_name}</h1>
+      <div id="productBlog-starsButton"><div class="text__review"><span class="text__number">{review_count}</span></div></div>
+      <ul id="productBlog-opinion-mall-list">{''.join(items)}</ul>
+    </body></html>
+    """
@@ -0,0 +1,112 @@
+import asyncio
+import threading
+
+from app.infrastructure.crawler import browser_pool as browser_pool_module
+from app.infrastructure.crawler.browser_pool import BrowserPool
+from app.infrastructure.crawler.session_state import SessionStateStore
+from app.utils.scheduler import CrawlingScheduler
+
+
+class FakePage:
+    def __init__(self):
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    async def new_page(self):
+        return FakePage()
+
+    async def close(self):
+        pass
+
+
+class FakeBrowser:
+    def on(self, event, handler):
+        pass
+
+    def is_connected(self):
+        return True
+
+    async def new_context(self, **options):
+        return FakeContext()
+
+    async def close(self):
+        pass
+
+
+class FakeChromium:
+    async def launch(self, **options):
+        return FakeBrowser()
+
+
+class FakePlaywright:
+    chromium = FakeChromium()
+
+    async def start(self):
+        return self
+
+    async def stop(self):
+        pass
+
+
+def _pool(tmp_path, monkeypatch):
+    monkeypatch.setattr(browser_pool_module, "async_playwright", FakePlaywright)
+    session_state = SessionStateStore(str(tmp_path / "state.json"), enabled=False)
+    return BrowserPool(max_concurrency=2, prewarm_contexts=1, session_state=session_state)
+
+
+def test_scheduler_jobs_from_another_thread_reuse_app_pool(tmp_path, monkeypatch):
+    """스케줄러 스레드(별도 루프)에서 시작한 작업도 앱 루프의 풀을 임대하고 1회용 브라우저를 띄우지 않음"""
+    pool = _pool(tmp_path, monkeypatch)
+    app_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=app_loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        asyncio.run_coroutine_threadsafe(pool.start(), app_loop).result(timeout=5)
+
+        async def crawl_products():
+            for _ in range(3):
+                async with pool.lease() as page:
+                    assert not page.is_closed()
+
+        scheduler = CrawlingScheduler()
+        scheduler.loop = app_loop
+        scheduler._run_async_job(crawl_products)
+
+        assert pool.stats["leases"] == 3
+        assert pool.stats["standalone_leases"] == 0
+        assert pool.stats["browser_launches"] == 1
+    finally:
+        asyncio.run_coroutine_threadsafe(pool.stop(), app_loop).result(timeout=5)
+        app_loop.call_soon_threadsafe(app_loop.stop)
+        thread.join(timeout=5)
+        app_loop.close()
+
+
+def test_lease_from_foreign_loop_falls_back_to_standalone(tmp_path, monkeypatch):
+    pool = _pool(tmp_path, monkeypatch)
+    app_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=app_loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        asyncio.run_coroutine_threadsafe(pool.start(), app_loop).result(timeout=5)
+
+        async def lease_once():
+            async with pool.lease():
+                pass
+
+        asyncio.run(lease_once())
+
+        assert pool.stats["standalone_leases"] == 1
+        assert pool.stats["leases"] == 0
+    finally:
+        asyncio.run_coroutine_threadsafe(pool.stop(), app_loop).result(timeout=5)
+        app_loop.call_soon_threadsafe(app_loop.stop)
+        thread.join(timeout=5)
+        app_loop.close()
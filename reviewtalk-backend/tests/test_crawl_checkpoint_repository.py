@@ -0,0 +1,65 @@
+import sqlite3
+
+from app.database_migration import MIGRATIONS
+from app.infrastructure.crawl_checkpoint_repository import CrawlCheckpointRepository
+from app.models.schemas import ReviewData
+
+
+PRODUCT_INFO = {"product_name": "테스트 상품", "product_image": None, "product_price": None, "product_brand": None}
+
+
+def _repo(tmp_path):
+    db_path = tmp_path / "checkpoints.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.executescript(MIGRATIONS[5]["up"])
+    return CrawlCheckpointRepository(db_path=str(db_path))
+
+
+def _reviews(*ids):
+    return [ReviewData(review_id=i, content=f"충분히 긴 리뷰 내용 {i}", rating=4, author="익명") for i in ids]
+
+
+def test_checkpoint_accumulates_batches(tmp_path):
+    repo = _repo(tmp_path)
+    url = "https://m.danawa.com/product/product.html?code=123"
+    assert repo.get_checkpoint("123") is None
+
+    repo.save_batch("123", url, PRODUCT_INFO, _reviews("1", "2"), 30, max_reviews=100)
+    repo.save_batch("123", url, PRODUCT_INFO, _reviews("3"), 60, max_reviews=100)
+
+    checkpoint = repo.get_checkpoint("123", max_age=3600)
+    assert [r.review_id for r in checkpoint["reviews"]] == ["1", "2", "3"]
+    assert checkpoint["reviews"][0].rating == 4
+    assert (checkpoint["loaded_count"], checkpoint["batches"]) == (60, 2)
+    assert checkpoint["max_reviews"] == 100
+    assert checkpoint["product_info"]["product_name"] == "테스트 상품"
+
+    repo.delete_checkpoint("123")
+    assert repo.get_checkpoint("123") is None
+
+
+def test_stale_checkpoint_is_ignored(tmp_path):
+    repo = _repo(tmp_path)
+    repo.save_batch("123", "https://m.danawa.com/product/product.html?code=123", PRODUCT_INFO, _reviews("1"), 30)
+    with sqlite3.connect(repo.db_path) as conn:
+        conn.execute("UPDATE crawl_checkpoints SET updated_at = datetime('now', '-2 hours')")
+
+    assert repo.get_checkpoint("123", max_age=3600) is None
+    assert repo.get_checkpoint("123") is not None
+
+
+def test_save_batch_appends_rows_without_rewriting_previous_batches(tmp_path):
+    repo = _repo(tmp_path)
+    url = "https://m.danawa.com/product/product.html?code=123"
+    repo.save_batch("123", url, PRODUCT_INFO, _reviews("1", "2"), 30)
+    # 재개 후 같은 리뷰가 다시 와도 중복 저장하지 않음
+    repo.save_batch("123", url, PRODUCT_INFO, _reviews("2", "3"), 60)
+
+    with sqlite3.connect(repo.db_path) as conn:
+        rows = conn.execute("SELECT review_id FROM crawl_checkpoint_reviews ORDER BY rowid").fetchall()
+    assert [row[0] for row in rows] == ["1", "2", "3"]
+    assert [r.review_id for r in repo.get_checkpoint("123")["reviews"]] == ["1", "2", "3"]
+
+    repo.delete_checkpoint("123")
+    with sqlite3.connect(repo.db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM crawl_checkpoint_reviews").fetchone()[0] == 0
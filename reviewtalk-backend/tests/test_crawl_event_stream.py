@@ -0,0 +1,48 @@
+import asyncio
+import json
+
+from app.models.schemas import CrawlResponse
+from app.services.crawl_event_stream import CrawlEventStream
+
+
+def _parse(chunks):
+    events = []
+    for chunk in chunks:
+        if chunk.startswith(":"):
+            continue
+        lines = chunk.strip().split("\n")
+        events.append((lines[0][len("event: "):], json.loads(lines[1][len("data: "):])))
+    return events
+
+
+def test_crawl_event_stream_emits_progress_then_done():
+    stream = CrawlEventStream()
+
+    async def crawl():
+        stream.on_progress("page_loaded", 0)
+        stream.on_progress("load_more", 60)
+        stream.on_event("batch_indexed", {"batch": 0, "indexed": 30})
+        stream.on_event("batch_indexed", {"batch": 1, "indexed": 60})
+        return CrawlResponse(success=True, message="완료", reviews_found=60, product_id="123")
+
+    async def collect():
+        return [chunk async for chunk in stream.stream(crawl())]
+
+    events = _parse(asyncio.run(collect()))
+    names = [name for name, _ in events]
+    assert names == ["started", "page_loaded", "click", "batch_indexed", "chat_ready", "batch_indexed", "done"]
+    assert events[2][1] == {"click": 1, "reviews_loaded": 60}
+    assert events[-1][1]["reviews_found"] == 60
+
+
+def test_crawl_event_stream_reports_error():
+    stream = CrawlEventStream()
+
+    async def crawl():
+        raise RuntimeError("브라우저 종료")
+
+    async def collect():
+        return [chunk async for chunk in stream.stream(crawl())]
+
+    events = _parse(asyncio.run(collect()))
+    assert events[-1] == ("error", {"error_message": "브라우저 종료"})
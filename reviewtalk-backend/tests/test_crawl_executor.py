@@ -0,0 +1,48 @@
+import asyncio
+
+from app.utils.crawl_executor import CrawlExecutor
+
+
+def test_crawl_executor_bounds_concurrency_and_isolates_failures():
+    running = {"now": 0, "peak": 0}
+
+    async def worker(item):
+        running["now"] += 1
+        running["peak"] = max(running["peak"], running["now"])
+        try:
+            if item == "boom":
+                raise ValueError("크롤링 실패")
+            if item == "slow":
+                await asyncio.sleep(1)
+            await asyncio.sleep(0.01)
+            return item.upper()
+        finally:
+            running["now"] -= 1
+
+    items = ["a", "boom", "slow", "b", "c", "d"]
+    executor = CrawlExecutor(max_workers=2, per_host_limit=2, task_timeout=0.2)
+    results = asyncio.run(executor.run(items, worker, url_of=lambda item: "https://m.danawa.com/product"))
+
+    assert [r.item for r in results] == items
+    assert running["peak"] <= 2
+    assert [r.value for r in results if r.success] == ["A", "B", "C", "D"]
+    assert results[1].error == "크롤링 실패"
+    assert results[2].timed_out
+
+
+def test_crawl_executor_per_host_limit():
+    running = {}
+    peak = {}
+
+    async def worker(url):
+        host = url.split("/")[2]
+        running[host] = running.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), running[host])
+        await asyncio.sleep(0.01)
+        running[host] -= 1
+
+    urls = [f"https://m.danawa.com/{i}" for i in range(4)] + [f"https://prod.danawa.com/{i}" for i in range(4)]
+    executor = CrawlExecutor(max_workers=4, per_host_limit=1, task_timeout=5)
+    asyncio.run(executor.run(urls, worker, url_of=lambda url: url))
+
+    assert peak == {"m.danawa.com": 1, "prod.danawa.com": 1}
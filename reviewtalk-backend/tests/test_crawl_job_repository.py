@@ -0,0 +1,47 @@
+import sqlite3
+
+from app.database_migration import MIGRATIONS
+from app.infrastructure.crawl_job_repository import CrawlJobRepository
+
+
+def _repo(tmp_path):
+    db_path = tmp_path / "jobs.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.executescript(MIGRATIONS[4]["up"])
+    return CrawlJobRepository(db_path=str(db_path))
+
+
+def test_crawl_job_lifecycle(tmp_path):
+    repo = _repo(tmp_path)
+    job_id = repo.create_job("https://prod.danawa.com/info/?pcode=123456", 50)
+
+    job = repo.get_job(job_id)
+    assert job["status"] == "queued"
+    assert job["reviews_found"] == 0
+
+    repo.mark_running(job_id)
+    repo.update_progress(job_id, "load_more", 30)
+    job = repo.get_job(job_id)
+    assert job["status"] == "running"
+    assert (job["stage"], job["reviews_found"]) == ("load_more", 30)
+
+    repo.mark_finished(job_id, True, result={"success": True, "message": "완료", "reviews_found": 42})
+    job = repo.get_job(job_id)
+    assert job["status"] == "succeeded"
+    assert job["reviews_found"] == 42
+    assert job["result"]["message"] == "완료"
+    assert job["finished_at"] is not None
+
+
+def test_requeue_unfinished_jobs(tmp_path):
+    repo = _repo(tmp_path)
+    running = repo.create_job("https://prod.danawa.com/info/?pcode=1", 10)
+    queued = repo.create_job("https://prod.danawa.com/info/?pcode=2", 10)
+    done = repo.create_job("https://prod.danawa.com/info/?pcode=3", 10)
+    repo.mark_running(running)
+    repo.mark_finished(done, False, error_message="실패")
+
+    requeued = repo.requeue_unfinished_jobs()
+    assert {job["id"] for job in requeued} == {running, queued}
+    assert all(job["status"] == "queued" for job in requeued)
+    assert repo.get_job(done)["status"] == "failed"
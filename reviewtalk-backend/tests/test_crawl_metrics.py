@@ -0,0 +1,40 @@
+from app.infrastructure.crawler.metrics import CrawlMetrics
+from app.infrastructure.crawler.waits import WaitStatistics
+
+
+def test_crawl_metrics_stage_and_waits():
+    metrics = CrawlMetrics()
+    with metrics.stage("navigate"):
+        metrics.navigations += 1
+    metrics.record_wait("load_more", 0.5, True)
+    metrics.record_wait("load_more", 1.5, False)
+    data = metrics.to_dict()
+    assert data["navigations"] == 1
+    assert "navigate" in data["stages"]
+    assert data["waits"]["load_more"]["count"] == 2
+    assert data["waits"]["load_more"]["timeouts"] == 1
+    assert data["waits"]["load_more"]["max_seconds"] == 1.5
+
+
+def test_crawl_metrics_network_bytes_by_type():
+    metrics = CrawlMetrics()
+    metrics.record_request("document", blocked=False, size=12000)
+    metrics.record_request("script", blocked=False, size=3000)
+    metrics.record_request("script", blocked=False, size=1000)
+    metrics.record_request("image", blocked=True)
+    network = metrics.to_dict()["network"]
+    assert network["bytes_loaded"] == 16000
+    assert network["bytes_by_type"] == {"document": 12000, "script": 4000}
+    assert network["blocked_by_type"] == {"image": 1}
+    assert "image" not in network["bytes_by_type"]
+
+
+def test_wait_statistics_snapshot():
+    stats = WaitStatistics(max_samples=3)
+    for elapsed in [0.1, 0.2, 0.3, 0.4]:
+        stats.record("page_ready", elapsed, True)
+    stats.record("page_ready", 10.0, False)
+    snapshot = stats.snapshot()["page_ready"]
+    assert snapshot["count"] == 5
+    assert snapshot["timeouts"] == 1
+    assert snapshot["max_seconds"] == 10.0
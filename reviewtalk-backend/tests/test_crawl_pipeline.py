@@ -0,0 +1,157 @@
+import asyncio
+
+from app.infrastructure.crawler.danawa_crawler import ReviewBatch
+from app.models.schemas import ReviewData
+from app.services import crawl_pipeline
+from app.services.crawl_pipeline import CrawlIndexPipeline
+
+
+PRODUCT_INFO = {"product_name": "테스트 상품", "product_image": None, "product_price": None, "product_brand": None}
+
+
+class FakeVectorStore:
+    def __init__(self):
+        self.calls = []
+
+    def add_reviews(self, reviews, product_id, product_info=None):
+        self.calls.append(([r.review_id for r in reviews], product_id))
+
+
+def _batch(index, ids):
+    reviews = [ReviewData(review_id=i, content=f"충분히 긴 리뷰 내용 {i}", rating=5, author="익명") for i in ids]
+    return ReviewBatch(index=index, product_id="123", product_info=PRODUCT_INFO, reviews=reviews, loaded_count=len(ids))
+
+
+def test_pipeline_indexes_each_batch_as_it_arrives(monkeypatch):
+    async def fake_batches(product_url, max_reviews, known_review_ids=None, on_progress=None, resume_from=0):
+        yield _batch(0, ["1", "2"])
+        yield _batch(1, ["3"])
+
+    monkeypatch.setattr(crawl_pipeline, "iter_danawa_review_batches", fake_batches)
+    store = FakeVectorStore()
+    events = []
+
+    result = asyncio.run(
+        CrawlIndexPipeline(store, queue_size=1).run(
+            "https://m.danawa.com/product/product.html?code=123", 123,
+            on_event=lambda event, data: events.append(event)
+        )
+    )
+
+    assert result.success
+    assert store.calls == [(["1", "2"], 123), (["3"], 123)]
+    assert result.indexed_reviews == 3 and result.batches == 2
+    assert result.product_info["product_name"] == "테스트 상품"
+    assert result.first_indexed_seconds is not None
+    assert events.count("batch_crawled") == 2
+    assert events.count("batch_indexed") == 2
+
+
+def test_pipeline_keeps_indexed_batches_when_crawl_fails(monkeypatch):
+    async def failing_batches(product_url, max_reviews, known_review_ids=None, on_progress=None, resume_from=0):
+        yield _batch(0, ["1"])
+        raise RuntimeError("더보기 클릭 실패")
+
+    monkeypatch.setattr(crawl_pipeline, "iter_danawa_review_batches", failing_batches)
+    store = FakeVectorStore()
+
+    result = asyncio.run(CrawlIndexPipeline(store).run("https://m.danawa.com/product/product.html?code=123", 123))
+
+    assert not result.success
+    assert result.error_message == "더보기 클릭 실패"
+    assert store.calls == [(["1"], 123)]
+
+
+class FakeCheckpoints:
+    def __init__(self, checkpoint=None):
+        self.checkpoint = checkpoint
+        self.saved = []
+        self.deleted = False
+
+    def get_checkpoint(self, product_id, max_age=None):
+        return self.checkpoint
+
+    def save_batch(self, product_id, product_url, product_info, reviews, loaded_count, max_reviews=0):
+        self.saved.append(([r.review_id for r in reviews], loaded_count))
+
+    def delete_checkpoint(self, product_id):
+        self.deleted = True
+
+
+def test_pipeline_resumes_from_checkpoint(monkeypatch):
+    calls = []
+
+    async def fake_batches(product_url, max_reviews, known_review_ids=None, on_progress=None, resume_from=0):
+        calls.append((max_reviews, resume_from))
+        yield _batch(0, ["3"])
+
+    monkeypatch.setattr(crawl_pipeline, "iter_danawa_review_batches", fake_batches)
+    store = FakeVectorStore()
+    checkpoints = FakeCheckpoints({
+        "product_info": PRODUCT_INFO,
+        "reviews": _batch(0, ["1", "2"]).reviews,
+        "loaded_count": 30,
+    })
+
+    result = asyncio.run(
+        CrawlIndexPipeline(store, checkpoints=checkpoints).run(
+            "https://m.danawa.com/product/product.html?code=123", 123, max_reviews=10
+        )
+    )
+
+    assert result.success
+    assert calls == [(8, 30)]
+    # 체크포인트 리뷰는 다시 색인하지 않고 결과에만 포함
+    assert store.calls == [(["3"], 123)]
+    assert [r.review_id for r in result.reviews] == ["1", "2", "3"]
+    assert (result.resumed_reviews, result.indexed_reviews) == (2, 3)
+    assert checkpoints.saved == [(["3"], 1)]
+    assert checkpoints.deleted
+
+
+def test_pipeline_keeps_checkpoint_when_crawl_fails(monkeypatch):
+    async def failing_batches(product_url, max_reviews, known_review_ids=None, on_progress=None, resume_from=0):
+        yield _batch(0, ["1"])
+        raise RuntimeError("브라우저 오류")
+
+    monkeypatch.setattr(crawl_pipeline, "iter_danawa_review_batches", failing_batches)
+    checkpoints = FakeCheckpoints()
+
+    result = asyncio.run(
+        CrawlIndexPipeline(FakeVectorStore(), checkpoints=checkpoints).run(
+            "https://m.danawa.com/product/product.html?code=123", 123
+        )
+    )
+
+    assert not result.success
+    assert checkpoints.saved == [(["1"], 1)]
+    assert not checkpoints.deleted
+
+
+def test_pipeline_ignores_checkpoint_from_larger_crawl(monkeypatch):
+    calls = []
+
+    async def fake_batches(product_url, max_reviews, known_review_ids=None, on_progress=None, resume_from=0):
+        calls.append((max_reviews, resume_from))
+        yield _batch(0, ["1", "2"])
+
+    monkeypatch.setattr(crawl_pipeline, "iter_danawa_review_batches", fake_batches)
+    checkpoints = FakeCheckpoints({
+        "product_info": PRODUCT_INFO,
+        "reviews": _batch(0, ["1", "2", "3", "4"]).reviews,
+        "max_reviews": 1000,
+        "loaded_count": 40,
+    })
+
+    result = asyncio.run(
+        CrawlIndexPipeline(FakeVectorStore(), checkpoints=checkpoints).run(
+            "https://m.danawa.com/product/product.html?code=123", 123, max_reviews=2
+        )
+    )
+
+    assert result.success
+    assert calls == [(2, 0)]
+    assert [r.review_id for r in result.reviews] == ["1", "2"]
+    # 더 큰 크롤링이 이어갈 수 있도록 체크포인트는 건드리지 않음
+    assert checkpoints.saved == []
+    assert not checkpoints.deleted
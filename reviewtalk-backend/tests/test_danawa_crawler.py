@@ -0,0 +1,47 @@
+from app.infrastructure.crawler.danawa_crawler import extract_product_code, map_review_rows, split_known_reviews
+
+
+def test_map_review_rows():
+    rows = [
+        {"id": "1", "text": "  배송이 빠르고 품질이 좋아요  ", "rating": "5점", "date": "24.05.01"},
+        {"id": "2", "text": "짧음", "rating": "3점", "date": None},
+        {"id": "3", "text": "가성비가 정말 훌륭한 제품입니다", "rating": "", "date": None},
+        {"id": "4", "text": "재구매 의사 있습니다 추천해요", "rating": "4점", "date": None},
+    ]
+    reviews = map_review_rows(rows, max_reviews=2)
+    assert [r.review_id for r in reviews] == ["1", "3"]
+    assert reviews[0].content == "배송이 빠르고 품질이 좋아요"
+    assert reviews[0].rating == 5
+    assert reviews[0].date == "24.05.01"
+    assert reviews[1].rating is None
+
+
+def test_map_review_rows_rating_matches_element_extraction():
+    # 0점은 별점 없음으로 유지, 검증 범위(1~5)를 벗어난 별점의 리뷰는 기존처럼 건너뜀
+    rows = [
+        {"id": "1", "text": "별점이 표시되지 않은 리뷰입니다", "rating": "0점", "date": None},
+        {"id": "2", "text": "별점이 잘못 파싱된 리뷰입니다", "rating": "10점", "date": None},
+        {"id": "3", "text": "별점이 정상인 리뷰입니다 좋아요", "rating": "1점", "date": None},
+    ]
+    reviews = map_review_rows(rows, max_reviews=10)
+    assert [(r.review_id, r.rating) for r in reviews] == [("1", None), ("3", 1)]
+
+
+def test_split_known_reviews():
+    reviews = map_review_rows([
+        {"id": "10", "text": "새로 올라온 리뷰입니다 좋아요", "rating": "5점", "date": None},
+        {"id": "9", "text": "예전에 저장된 리뷰입니다", "rating": "4점", "date": None},
+    ], max_reviews=10)
+
+    new_reviews, skipped = split_known_reviews(reviews, {"9", "8"})
+    assert [r.review_id for r in new_reviews] == ["10"]
+    assert skipped == 1
+
+    # 증분 모드가 아니면 그대로 반환
+    assert split_known_reviews(reviews, None) == (reviews, 0)
+
+
+def test_extract_product_code():
+    assert extract_product_code("https://m.danawa.com/product/product.html?code=12345678") == "12345678"
+    assert extract_product_code("https://prod.danawa.com/info/?pcode=87654321") == "87654321"
+    assert extract_product_code("https://example.com/product?code=1") is None
@@ -0,0 +1,98 @@
+import numpy as np
+
+from app.infrastructure.ai.embedding_cache import EmbeddingCache, QueryEmbeddingCache, cache_key
+
+
+MODEL = "intfloat/multilingual-e5-small"
+
+
+def _vectors(count, dim=4, offset=0.0):
+    return np.arange(count * dim, dtype=np.float32).reshape(count, dim) + offset
+
+
+def test_hits_and_misses_by_normalized_text(tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "cache.db"))
+    texts = ["query: 배송이 빨라요", "query: 품질이 좋아요"]
+    assert cache.get_many(MODEL, texts) == {}
+
+    cache.put_many(MODEL, texts, _vectors(2))
+    # 공백만 다른 텍스트는 같은 키
+    found = cache.get_many(MODEL, ["query:  배송이   빨라요 ", "query: 새 리뷰"])
+
+    assert list(found) == [0]
+    np.testing.assert_array_equal(found[0], _vectors(2)[0])
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 3
+
+
+def test_model_name_is_part_of_key(tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "cache.db"))
+    cache.put_many(MODEL, ["query: 리뷰"], _vectors(1))
+
+    assert cache.get_many("other-model", ["query: 리뷰"]) == {}
+    assert cache_key(MODEL, "query: 리뷰") != cache_key("other-model", "query: 리뷰")
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "cache.db"), max_entries=2)
+    cache.put_many(MODEL, ["a", "b"], _vectors(2))
+    cache.get_many(MODEL, ["a"])  # a 를 최근 사용으로 갱신
+    cache.put_many(MODEL, ["c"], _vectors(1, offset=100.0))
+
+    assert cache.size() == 2
+    assert cache.stats["evictions"] == 1
+    assert sorted(cache.get_many(MODEL, ["a", "b", "c"])) == [0, 2]
+
+
+def test_evicts_in_batches_below_the_limit(tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "cache.db"), max_entries=100)
+    cache.put_many(MODEL, [f"리뷰 {i}" for i in range(100)], _vectors(100))
+    assert cache.stats["evictions"] == 0
+
+    cache.put_many(MODEL, ["새 리뷰"], _vectors(1))
+    # 상한을 넘으면 95% 까지 한 번에 비워 다음 저장들은 COUNT/DELETE 없이 진행
+    assert cache.size() == 95
+    assert cache.stats["evictions"] == 6
+    assert list(cache.get_many(MODEL, ["새 리뷰"])) == [0]
+
+
+def test_disabled_cache_stores_nothing(tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "cache.db"), enabled=False)
+    cache.put_many(MODEL, ["a"], _vectors(1))
+
+    assert cache.get_many(MODEL, ["a"]) == {}
+    assert cache.size() == 0
+
+
+def test_query_cache_skips_encoder_on_repeat():
+    cache = QueryEmbeddingCache(max_entries=2)
+    calls = []
+
+    def embed(text):
+        calls.append(text)
+        return _vectors(1, offset=len(calls))[0]
+
+    first = cache.get_or_embed("배터리 어때요?", embed)
+    second = cache.get_or_embed("  배터리   어때요? ", embed)
+
+    assert calls == ["배터리 어때요?"]
+    np.testing.assert_array_equal(first, second)
+    status = cache.get_status()
+    assert status["hits"] == 1 and status["misses"] == 1
+    assert status["hit_rate"] == 0.5
+
+
+def test_query_cache_evicts_least_recently_used():
+    cache = QueryEmbeddingCache(max_entries=2)
+    calls = []
+
+    def embed(text):
+        calls.append(text)
+        return _vectors(1)[0]
+
+    for query in ["a", "b", "a", "c", "b"]:
+        cache.get_or_embed(query, embed)
+
+    # b 는 c 추가 시 밀려나 다시 계산
+    assert calls == ["a", "b", "c", "b"]
+    assert cache.stats["evictions"] == 2
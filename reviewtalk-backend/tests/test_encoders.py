@@ -0,0 +1,39 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.core.config import settings
+from app.infrastructure.ai.encoders import mean_pool_normalize
+
+
+CORPUS = Path(__file__).parent / "fixtures" / "embedding_corpus.txt"
+
+
+def test_mean_pool_ignores_padding():
+    token_embeddings = np.array([[[1.0, 0.0], [3.0, 0.0], [100.0, 100.0]]], dtype=np.float32)
+    attention_mask = np.array([[1, 1, 0]])
+
+    pooled = mean_pool_normalize(token_embeddings, attention_mask)
+
+    np.testing.assert_allclose(pooled, [[1.0, 0.0]])
+
+
+def test_onnx_encoder_agrees_with_pytorch():
+    """양자화 ONNX 모델이 PyTorch 출력과 방향이 거의 같은지 (로컬에 내보낸 모델이 있을 때만)"""
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("sentence_transformers")
+    if not (Path(settings.embedding_onnx_model_path) / settings.embedding_onnx_file).exists():
+        pytest.skip("ONNX 모델을 먼저 내보내야 합니다 (python -m app.infrastructure.ai.encoders)")
+
+    from sentence_transformers import SentenceTransformer
+    from app.infrastructure.ai.encoders import OnnxEncoder
+
+    texts = ["query: " + line for line in CORPUS.read_text(encoding="utf-8").splitlines() if line.strip()]
+    reference = SentenceTransformer(settings.embedding_model_name).encode(texts, convert_to_numpy=True)
+    onnx = OnnxEncoder(settings.embedding_onnx_model_path, settings.embedding_onnx_file).encode(texts)
+
+    reference = reference / np.linalg.norm(reference, axis=1, keepdims=True)
+    agreement = (reference * onnx).sum(axis=1)
+    assert agreement.min() > 0.97
+    assert agreement.mean() > 0.99
@@ -0,0 +1,71 @@
+import asyncio
+from pathlib import Path
+
+from app.core.config import settings
+from app.infrastructure.crawler import http_review_fetcher as fetcher_module
+from app.infrastructure.crawler.http_review_fetcher import (
+    parse_product_info_html,
+    parse_reviews_html,
+    parse_total_review_count,
+)
+
+
+# 실제 페이지가 아니라 크롤러 선택자에 맞춰 손으로 만든 HTML (파일 상단 주석 참고)
+FIXTURE_HTML = (Path(__file__).parent / "fixtures" / "danawa_mobile_product.html").read_text(encoding="utf-8")
+
+
+def test_parse_reviews_html_matches_crawler_output():
+    reviews = parse_reviews_html(FIXTURE_HTML)
+    # 10자 이하 리뷰("좋아요")는 DanawaCrawler 와 같이 제외
+    assert [review.review_id for review in reviews] == [
+        "9123372001990022352",
+        "9123372001990022353",
+        "9123372001990022355",
+    ]
+    assert reviews[0].content == "노이즈 캔슬링이 정말 좋아요. 지하철에서도 조용합니다."
+    assert [review.rating for review in reviews] == [5, 3, None]
+    assert [review.date for review in reviews] == ["24.05.13", "2024-05-02", None]
+    assert all(review.author == "익명" for review in reviews)
+
+
+def test_parse_reviews_html_respects_max_reviews():
+    assert len(parse_reviews_html(FIXTURE_HTML, max_reviews=2)) == 2
+    assert parse_reviews_html("<html><body></body></html>") == []
+
+
+def test_parse_product_info_html():
+    info = parse_product_info_html(FIXTURE_HTML)
+    assert info == {
+        "product_name": "삼성전자 갤럭시 버즈3 프로",
+        "image_url": "https://img.danawa.com/prod_img/500000/123/456/img/12345678_1.jpg",
+        "price": "239,000원",
+        "brand": "삼성전자",
+    }
+    assert parse_total_review_count(FIXTURE_HTML) == 4
+
+
+def test_fast_path_skipped_without_review_list_url(monkeypatch):
+    requested = []
+
+    async def fetch_product(*args, **kwargs):
+        requested.append(args)
+
+    monkeypatch.setattr(settings, "crawler_http_fast_path", True)
+    monkeypatch.setattr(settings, "crawler_http_review_list_url", "")
+    monkeypatch.setattr(fetcher_module.http_review_fetcher, "fetch_product", fetch_product)
+
+    assert asyncio.run(fetcher_module._try_fast_path("https://m.danawa.com/product/product.html?code=1", 100, None)) is None
+    assert requested == []
+
+
+def test_fast_path_falls_back_on_unexpected_errors(monkeypatch):
+    async def fetch_product(*args, **kwargs):
+        return "{missing}".format(code="1", page=1)  # 잘못된 목록 주소 템플릿 → KeyError
+
+    monkeypatch.setattr(settings, "crawler_http_fast_path", True)
+    monkeypatch.setattr(settings, "crawler_http_review_list_url", "https://m.danawa.com/{missing}")
+    monkeypatch.setattr(fetcher_module.http_review_fetcher, "fetch_product", fetch_product)
+    fallbacks = fetcher_module.http_review_fetcher.stats["fallbacks"]
+
+    assert asyncio.run(fetcher_module._try_fast_path("https://m.danawa.com/product/product.html?code=1", 100, None)) is None
+    assert fetcher_module.http_review_fetcher.stats["fallbacks"] == fallbacks + 1
@@ -0,0 +1,51 @@
+from app.infrastructure.crawler.pagination import PaginationPlanner, parse_review_count
+
+
+def test_parse_review_count():
+    assert parse_review_count("1,234") == 1234
+    assert parse_review_count(" (87) ") == 87
+    assert parse_review_count("") is None
+    assert parse_review_count(None) is None
+
+
+def test_planner_computes_clicks_from_total():
+    planner = PaginationPlanner(target=100, total=70, loaded=30)
+    # 전체 70개 중 30개 로드, 첫 화면 기준 클릭당 30개 → 2회
+    assert planner.goal == 70
+    assert planner.planned_clicks == 2
+
+    planner.record_click(60)
+    assert planner.should_click()
+    planner.record_click(70)
+    assert not planner.should_click()
+    assert planner.stop_reason == "total_reached"
+    assert planner.clicks == 2
+
+
+def test_planner_uses_observed_page_size():
+    planner = PaginationPlanner(target=200, loaded=20)
+    planner.record_click(70)
+    assert planner.page_size == 50
+    assert planner.remaining_clicks() == 3
+
+
+def test_planner_stops_when_list_stops_growing():
+    planner = PaginationPlanner(target=200, loaded=30)
+    planner.record_click(60)
+    planner.record_click(60)
+    assert not planner.should_click()
+    assert planner.stop_reason == "stalled"
+
+
+def test_planner_stops_without_more_button_or_after_max_clicks():
+    planner = PaginationPlanner(target=200, loaded=30)
+    planner.record_click(None)
+    assert not planner.should_click()
+    assert planner.stop_reason == "no_more_button"
+
+    planner = PaginationPlanner(target=1000, loaded=30, max_clicks=2)
+    planner.record_click(60)
+    planner.record_click(90)
+    assert not planner.should_click()
+    assert planner.stop_reason == "max_clicks"
+    assert planner.to_dict()["loaded"] == 90
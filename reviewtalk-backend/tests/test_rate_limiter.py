@@ -0,0 +1,55 @@
+import asyncio
+
+from app.utils.rate_limiter import HostRateLimiter, TokenBucket
+
+
+def test_token_bucket_burst_then_rate():
+    bucket = TokenBucket(rate=10.0, burst=2)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    # 버스트 소진 후에는 1/rate 간격으로 예약
+    assert abs(bucket.reserve() - 0.1) < 0.01
+    assert abs(bucket.reserve() - 0.2) < 0.01
+
+
+def test_host_rate_limiter_keys_by_host_and_reports_queue_depth():
+    limiter = HostRateLimiter(
+        host_limits={"m.danawa.com": {"rate": 20.0, "burst": 1}},
+        default_rate=100.0,
+        default_burst=10,
+        enabled=True
+    )
+
+    async def scenario():
+        tasks = [asyncio.create_task(limiter.acquire("https://m.danawa.com/product/1")) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        depth = limiter.get_status()["hosts"]["m.danawa.com"]["queue_depth"]
+        delays = await asyncio.gather(*tasks)
+        other = await limiter.acquire("https://img.danawa.com/a.jpg")
+        return depth, delays, other
+
+    depth, delays, other = asyncio.run(scenario())
+    assert depth == 2
+    assert delays[0] == 0.0 and delays[2] > delays[1] > 0
+    assert other == 0.0
+    status = limiter.get_status()
+    assert status["hosts"]["m.danawa.com"]["burst"] == 1
+    assert status["hosts"]["img.danawa.com"]["rate_per_second"] == 100.0
+    assert status["queue_depth"] == 0
+
+
+def test_host_rate_limiter_disabled():
+    limiter = HostRateLimiter(host_limits={}, default_rate=0.001, default_burst=1, enabled=False)
+    assert asyncio.run(limiter.acquire("m.danawa.com")) == 0.0
+    assert limiter.get_status()["hosts"] == {}
+
+
+def test_host_rate_limiter_scale_applies_to_existing_and_new_buckets():
+    limiter = HostRateLimiter(host_limits={"m.danawa.com": {"rate": 4.0, "burst": 2}}, default_rate=2.0, enabled=True)
+    existing = limiter.bucket("m.danawa.com")
+
+    limiter.scale(0.5)
+
+    assert existing.rate == 2.0
+    assert limiter.bucket("img.danawa.com").rate == 1.0
+    assert limiter.host_limits["m.danawa.com"]["rate"] == 2.0
@@ -0,0 +1,46 @@
+import asyncio
+
+from app.infrastructure.crawler.replay import CrawlArchive, request_key
+
+
+def test_request_key_distinguishes_method_and_body():
+    url = "https://m.danawa.com/api/opinion?code=1"
+    assert request_key("get", url) == request_key("GET", url)
+    assert request_key("GET", url) != request_key("POST", url)
+    assert request_key("POST", url, "page=1") != request_key("POST", url, "page=2")
+
+
+def test_crawl_archive_put_save_and_reload(tmp_path):
+    archive = CrawlArchive(str(tmp_path))
+    url = "https://m.danawa.com/product/product.html?code=1"
+    archive.put(
+        "GET", url, None, 200,
+        {"Content-Type": "text/html", "Content-Encoding": "gzip", "Content-Length": "10"},
+        "<html>상품</html>".encode("utf-8"),
+        "document"
+    )
+    archive.save()
+
+    reloaded = CrawlArchive(str(tmp_path))
+    entry = reloaded.get("GET", url)
+    assert entry["status"] == 200
+    assert entry["headers"] == {"Content-Type": "text/html"}
+    assert reloaded.read_body(entry).decode("utf-8") == "<html>상품</html>"
+    assert reloaded.get("GET", url + "&page=2") is None
+
+
+def test_flush_waits_for_pending_recordings_before_save(tmp_path):
+    archive = CrawlArchive(str(tmp_path))
+    url = "https://m.danawa.com/api/opinion?code=1"
+
+    async def record_later():
+        await asyncio.sleep(0.05)  # response.body() 대기
+        archive.put("GET", url, None, 200, {}, b"{}", "xhr")
+
+    async def scenario():
+        archive.track(asyncio.ensure_future(record_later()))
+        await archive.flush()
+
+    asyncio.run(scenario())
+
+    assert CrawlArchive(str(tmp_path)).get("GET", url) is not None
@@ -0,0 +1,24 @@
+from app.infrastructure.crawler.resource_policy import (
+    ALLOW_ALL_POLICY,
+    ResourcePolicy,
+    get_resource_policy,
+)
+
+
+def test_resource_policy_should_block():
+    policy = ResourcePolicy(
+        name="test",
+        blocked_resource_types=frozenset({"image", "font"}),
+        blocked_url_patterns=(r"google-analytics\.com",)
+    )
+    assert policy.should_block("image", "https://img.danawa.com/a.jpg")
+    assert policy.should_block("script", "https://www.google-analytics.com/analytics.js")
+    assert not policy.should_block("document", "https://m.danawa.com/product/product.html?code=1")
+    assert not policy.should_block("xhr", "https://m.danawa.com/api/opinion")
+
+
+def test_get_resource_policy_modes():
+    review = get_resource_policy("review")
+    assert review.name in ("review", ALLOW_ALL_POLICY.name)
+    assert get_resource_policy("allow_all") is ALLOW_ALL_POLICY
+    assert not ALLOW_ALL_POLICY.should_block("image", "https://img.danawa.com/a.jpg")
@@ -1,4 +1,4 @@
-from app.models.schemas import ChatRequest, ChatResponse
+from app.models.schemas import ChatRequest, ChatResponse, ProductCrawlResult, ReviewData
 import pytest
 
 def test_chat_request_valid():
@@ -15,4 +15,20 @@ def test_chat_request_invalid(field, value):
     data = {"user_id": "u1", "product_id": "p1", "question": "질문?"}
     data[field] = value
     with pytest.raises(Exception):
-        ChatRequest(**data) 
\ No newline at end of file
+        ChatRequest(**data) 
+
+def test_product_crawl_result_product_info():
+    result = ProductCrawlResult(
+        success=True,
+        product_id="123",
+        product_name="상품",
+        product_price="10,000원",
+        reviews=[ReviewData(review_id="r1", content="좋아요 정말 만족합니다")]
+    )
+    assert result.product_info == {
+        "product_name": "상품",
+        "product_image": None,
+        "product_price": "10,000원",
+        "product_brand": None
+    }
+    assert len(result.reviews) == 1
@@ -0,0 +1,50 @@
+import asyncio
+import json
+import os
+import time
+
+from app.infrastructure.crawler.session_state import SessionStateStore
+
+
+class FakeContext:
+    def __init__(self, state):
+        self.state = state
+
+    async def storage_state(self, path=None):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f)
+        return self.state
+
+
+def test_save_and_load_storage_state(tmp_path):
+    store = SessionStateStore(str(tmp_path / "state" / "browser_state.json"), max_age=3600, refresh_interval=60)
+    assert store.load_path() is None
+    assert store.needs_refresh()
+
+    assert asyncio.run(store.save(FakeContext({"cookies": [{"name": "consent", "value": "1"}], "origins": []})))
+    assert store.load_path() == str(store.path)
+    assert json.loads(store.path.read_text(encoding="utf-8"))["cookies"][0]["name"] == "consent"
+    assert not store.needs_refresh()
+    assert store.get_status()["saves"] == 1
+
+
+def test_stale_storage_state_is_not_loaded(tmp_path):
+    path = tmp_path / "browser_state.json"
+    path.write_text('{"cookies": [], "origins": []}', encoding="utf-8")
+    stale = time.time() - 7200
+    os.utime(path, (stale, stale))
+
+    store = SessionStateStore(str(path), max_age=3600, refresh_interval=1800)
+    assert store.load_path() is None
+    assert store.needs_refresh()
+    assert SessionStateStore(str(path), enabled=False).load_path() is None
+
+
+def test_navigation_stats_by_session():
+    store = SessionStateStore("unused.json")
+    store.record_navigation("cold", 2.0)
+    store.record_navigation("warm", 0.5)
+    store.record_navigation("warm", 0.7)
+    navigations = store.get_status()["navigations"]
+    assert navigations["cold"] == {"count": 1, "mean_seconds": 2.0}
+    assert navigations["warm"] == {"count": 2, "mean_seconds": 0.6}
@@ -0,0 +1,108 @@
+import asyncio
+
+from app.utils.singleflight import SingleFlight
+
+
+def test_singleflight_shares_in_flight_result():
+    calls = []
+
+    async def crawl():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"success": True, "reviews": 10}
+
+    async def scenario():
+        flight = SingleFlight(ttl=0)
+        results = await asyncio.gather(*(flight.do("123", crawl) for _ in range(3)))
+        return flight, results
+
+    flight, results = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert flight.get_status()["shared"] == 2
+    assert flight.get_status()["in_flight"] == 0
+
+
+def test_singleflight_reuses_fresh_results_only_when_cacheable():
+    calls = []
+
+    async def crawl():
+        calls.append(1)
+        return {"success": len(calls) > 1}
+
+    async def scenario():
+        flight = SingleFlight(ttl=60, cacheable=lambda result: result["success"])
+        first = await flight.do("123", crawl)   # 실패 결과는 보관하지 않음
+        second = await flight.do("123", crawl)  # 재실행 후 성공 결과 보관
+        third = await flight.do("123", crawl)   # 보관된 결과 재사용
+        return flight, first, second, third
+
+    flight, first, second, third = asyncio.run(scenario())
+    assert len(calls) == 2
+    assert not first["success"] and second["success"]
+    assert third is second
+    assert flight.get_status()["cache_hits"] == 1
+
+
+def test_singleflight_propagates_errors_and_clears_in_flight():
+    async def crawl():
+        raise RuntimeError("브라우저 오류")
+
+    async def scenario():
+        flight = SingleFlight(ttl=60)
+        outcomes = await asyncio.gather(flight.do("123", crawl), flight.do("123", crawl), return_exceptions=True)
+        return flight, outcomes
+
+    flight, outcomes = asyncio.run(scenario())
+    assert all(isinstance(outcome, RuntimeError) for outcome in outcomes)
+    assert flight.get_status()["in_flight"] == 0
+    assert flight.get_status()["cached_results"] == 0
+
+
+def test_singleflight_runs_larger_request_after_smaller_in_flight_work():
+    calls = []
+    running = []
+    overlaps = []
+
+    async def crawl(size):
+        calls.append(size)
+        if running:
+            overlaps.append((running[-1], size))
+        running.append(size)
+        await asyncio.sleep(0.05)
+        running.remove(size)
+        return {"success": True, "max_reviews": size}
+
+    async def scenario():
+        flight = SingleFlight(ttl=60)
+        small, large, joined = await asyncio.gather(
+            flight.do("123", lambda: crawl(50), size=50),
+            flight.do("123", lambda: crawl(200), size=200),   # 50개 작업이 끝난 뒤 실행
+            flight.do("123", lambda: crawl(100), size=100)    # 200개 작업에 합류
+        )
+        cached = await flight.do("123", lambda: crawl(80), size=80)
+        return small, large, joined, cached
+
+    small, large, joined, cached = asyncio.run(scenario())
+    assert calls == [50, 200]
+    assert overlaps == []
+    assert small["max_reviews"] == 50
+    assert joined is large and cached is large
+
+
+def test_singleflight_passes_leader_context_to_joiners():
+    joined_contexts = []
+
+    async def crawl():
+        await asyncio.sleep(0.05)
+        return {"success": True}
+
+    async def scenario():
+        flight = SingleFlight(ttl=0)
+        await asyncio.gather(
+            flight.do("123", crawl, context="leader", on_join=joined_contexts.append),
+            flight.do("123", crawl, context="joiner", on_join=joined_contexts.append)
+        )
+
+    asyncio.run(scenario())
+    assert joined_contexts == ["leader"]
@@ -0,0 +1,29 @@
+from app.infrastructure.crawler.special_deals_crawler import SpecialDealsCrawler
+
+
+def test_map_product_rows():
+    rows = [
+        {
+            "url": "/product/product.html?code=12345678",
+            "image": "//img.danawa.com/prod_img/12345678.jpg",
+            "title": "삼성전자 갤럭시 버즈3 프로",
+            "price": "199,000원",
+            "original_price": "239,000원",
+            "discount_rate": "16%",
+        },
+        {"url": None, "image": None, "title": "링크 없는 카드", "price": None, "original_price": None, "discount_rate": None},
+        {"url": "https://m.danawa.com/event/deal", "image": None, "title": None, "price": None, "original_price": None, "discount_rate": None},
+    ]
+
+    products = SpecialDealsCrawler().map_product_rows(rows)
+
+    assert len(products) == 2
+    first = products[0]
+    assert first.product_id == "12345678"
+    assert first.product_url == "https://m.danawa.com/product/product.html?code=12345678"
+    assert first.image_url == "https://img.danawa.com/prod_img/12345678.jpg"
+    assert (first.price, first.original_price, first.discount_rate) == ("199,000원", "239,000원", "16%")
+    assert first.category == "특가상품"
+    # 상품 ID 를 URL 에서 찾지 못하면 임시 ID, 상품명이 없으면 순번 이름
+    assert products[1].product_id.startswith("special_2_")
+    assert products[1].product_name == "특가상품 3"
@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.infrastructure.ai import vector_store as vector_store_module
+from app.infrastructure.ai.vector_store import VectorStoreWarmup, require_vector_store_ready
+
+
+class FakeEmbeddingFunction:
+    def __init__(self):
+        self.calls = []
+
+    def embed(self, texts, use_cache=True):
+        self.calls.append((texts, use_cache))
+
+
+class FakeStore:
+    def __init__(self):
+        self.embedding_function = FakeEmbeddingFunction()
+
+
+@pytest.mark.asyncio
+async def test_warmup_loads_store_in_background(monkeypatch):
+    store = FakeStore()
+    monkeypatch.setattr(vector_store_module, "get_vector_store", lambda: store)
+    warmup = VectorStoreWarmup()
+
+    assert not warmup.ready
+    warmup.start()
+    await warmup.wait()
+
+    assert warmup.ready
+    assert warmup.get_status()["state"] == "ready"
+    assert store.embedding_function.calls == [(["warm up"], False)]
+
+
+@pytest.mark.asyncio
+async def test_warmup_failure_is_reported(monkeypatch):
+    def fail():
+        raise RuntimeError("model missing")
+
+    monkeypatch.setattr(vector_store_module, "get_vector_store", fail)
+    warmup = VectorStoreWarmup()
+    warmup.start()
+    await warmup.wait()
+
+    assert not warmup.ready
+    assert warmup.get_status() == {"state": "failed", "seconds": warmup.seconds, "error": "model missing"}
+
+
+@pytest.mark.asyncio
+async def test_failed_warmup_recovers_when_store_loads_later(monkeypatch):
+    attempts = []
+
+    def flaky_store():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("model missing")
+        return FakeStore()
+
+    warmup = VectorStoreWarmup()
+    monkeypatch.setattr(vector_store_module, "vector_store", None)
+    monkeypatch.setattr(vector_store_module, "VectorStore", flaky_store)
+    monkeypatch.setattr(vector_store_module, "vector_store_warmup", warmup)
+    warmup.start()
+    await warmup.wait()
+    assert warmup.get_status()["state"] == "failed"
+
+    # 이후 요청 경로에서 로드에 성공하면 /health/ready 도 다시 준비 상태가 된다
+    vector_store_module.get_vector_store()
+
+    assert warmup.ready
+    assert warmup.get_status()["error"] is None
+
+
+@pytest.mark.asyncio
+async def test_disabled_warmup_is_ready_without_loading():
+    warmup = VectorStoreWarmup()
+    warmup.start(enabled=False)
+    await warmup.wait()
+
+    assert warmup.ready
+
+
+@pytest.mark.asyncio
+async def test_wait_gives_up_after_timeout_without_cancelling_warmup(monkeypatch):
+    store = FakeStore()
+    release = asyncio.Event()
+
+    def slow_store():
+        return store
+
+    async def slow_to_thread(fn, *args):
+        await release.wait()
+        return fn(*args)
+
+    monkeypatch.setattr(vector_store_module, "get_vector_store", slow_store)
+    monkeypatch.setattr(vector_store_module.asyncio, "to_thread", slow_to_thread)
+    warmup = VectorStoreWarmup()
+    warmup.start()
+
+    assert await warmup.wait(timeout=0.05) is False
+    assert warmup.get_status()["state"] == "warming"
+
+    release.set()
+    assert await warmup.wait(timeout=1) is True
+    assert warmup.ready
+
+
+@pytest.mark.asyncio
+async def test_require_vector_store_ready_returns_503_while_warming(monkeypatch):
+    class SlowWarmup:
+        async def wait(self, timeout=None):
+            return False
+
+    monkeypatch.setattr(vector_store_module, "vector_store_warmup", SlowWarmup())
+
+    with pytest.raises(HTTPException) as exc_info:
+        await require_vector_store_ready()
+
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.headers == {"Retry-After": "5"}
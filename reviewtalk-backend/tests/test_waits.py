@@ -0,0 +1,47 @@
+import asyncio
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from app.infrastructure.crawler.metrics import CrawlMetrics
+from app.infrastructure.crawler.waits import SCROLL_STATE_SCRIPT, WaitEngine
+
+
+class FakeScrollPage:
+    """스크롤할 때마다 항목이 page_size 개씩 늘다가 total 에서 멈추는 페이지"""
+
+    def __init__(self, total, page_size=10):
+        self.total = total
+        self.page_size = page_size
+        self.count = min(total, page_size)
+        self.pending = False
+
+    async def evaluate(self, script, arg=None):
+        if script == SCROLL_STATE_SCRIPT:
+            return {"count": self.count, "height": self.count * 100}
+        self.pending = self.count < self.total
+        return None
+
+    async def wait_for_function(self, script, arg=None, timeout=None):
+        if not self.pending:
+            raise PlaywrightTimeoutError("변화 없음")
+        self.count = min(self.total, self.count + self.page_size)
+        self.pending = False
+
+
+def test_scroll_stops_when_content_stops_growing():
+    page = FakeScrollPage(total=30)
+    result = asyncio.run(WaitEngine(page, CrawlMetrics()).scroll_until_stable(".item", max_scrolls=10))
+    # 10 → 20 → 30 으로 늘어난 뒤 마지막 스크롤에서 변화가 없어 중단
+    assert result["scrolls"] == 3
+    assert result["items"] == 30
+    assert result["stop_reason"] == "converged"
+
+
+def test_scroll_stops_at_target_items():
+    page = FakeScrollPage(total=100)
+    metrics = CrawlMetrics()
+    result = asyncio.run(WaitEngine(page, metrics).scroll_until_stable(".item", target_items=25, max_scrolls=10))
+    assert result["scrolls"] == 2
+    assert result["items"] == 30
+    assert result["stop_reason"] == "target_reached"
+    assert metrics.waits["scroll_settle"]["count"] == 2
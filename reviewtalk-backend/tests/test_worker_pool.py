@@ -0,0 +1,150 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from app.infrastructure.crawler.worker_pool import CrawlerWorkerPool, process_tree_rss_mb
+
+
+class FakeWorker:
+    def __init__(self, index=0):
+        self.index = index
+        self.jobs = 0
+        self.pid = None
+        self.last_rss_mb = 0.0
+        self.restarts = 0
+
+    def is_alive(self):
+        return True
+
+    def stop(self, graceful=True):
+        pass
+
+    def start(self):
+        self.restarts += 1
+        self.jobs = 0
+
+
+def _running_pool(**kwargs) -> CrawlerWorkerPool:
+    pool = CrawlerWorkerPool(workers=1, max_rss_mb=0, **kwargs)
+    pool._running = True
+    return pool
+
+
+def _wait_idle(pool: CrawlerWorkerPool):
+    deadline = time.time() + 2
+    while not pool._idle and time.time() < deadline:
+        time.sleep(0.01)
+    return pool._idle.popleft()
+
+
+def test_disabled_pool():
+    pool = CrawlerWorkerPool(workers=0)
+    assert not pool.enabled
+    assert pool.get_status()["workers"] == []
+
+
+def test_finished_job_returns_worker_to_idle_queue():
+    pool = _running_pool(max_jobs=10)
+    worker = FakeWorker()
+    pool._release(worker, finished=True)
+    assert pool._idle.popleft() is worker
+    assert worker.restarts == 0
+    assert pool.stats["jobs"] == 1
+
+
+def test_unfinished_job_restarts_worker():
+    pool = _running_pool(max_jobs=10)
+    worker = FakeWorker()
+    pool._release(worker, finished=False, succeeded=False)
+    assert _wait_idle(pool) is worker
+    assert worker.restarts == 1
+    assert pool.stats["failed_jobs"] == 1
+    assert pool.stats["crash_restarts"] == 1
+
+
+def test_worker_recycled_after_max_jobs():
+    pool = _running_pool(max_jobs=2)
+    worker = FakeWorker()
+    pool._release(worker, finished=True)
+    pool._idle.popleft()
+    pool._release(worker, finished=True)
+    assert _wait_idle(pool) is worker
+    assert worker.restarts == 1
+    assert pool.stats["job_recycles"] == 1
+
+
+def test_acquire_waits_for_worker_released_from_another_thread():
+    pool = _running_pool(max_jobs=10)
+    worker = FakeWorker()
+
+    async def scenario():
+        acquire = asyncio.ensure_future(pool._acquire())
+        await asyncio.sleep(0.05)
+        assert not acquire.done()
+        assert pool.get_status()["waiting_jobs"] == 1
+        # 워커 교체 스레드처럼 루프 밖에서 반납
+        threading.Thread(target=pool._put_idle, args=(worker,)).start()
+        return await asyncio.wait_for(acquire, timeout=2)
+
+    assert asyncio.run(scenario()) is worker
+    assert not pool._idle and not pool._waiters
+
+
+def test_cancelled_waiter_does_not_lose_worker():
+    pool = _running_pool(max_jobs=10)
+    worker = FakeWorker()
+
+    async def scenario():
+        acquire = asyncio.ensure_future(pool._acquire())
+        await asyncio.sleep(0.01)
+        acquire.cancel()
+        await asyncio.sleep(0)
+        pool._put_idle(worker)
+        await asyncio.sleep(0.01)
+
+    asyncio.run(scenario())
+    assert list(pool._idle) == [worker]
+
+
+def test_memory_check_runs_off_the_calling_thread(monkeypatch):
+    from app.infrastructure.crawler import worker_pool as worker_pool_module
+
+    measured_on = []
+
+    def fake_rss(pid):
+        measured_on.append(threading.current_thread())
+        return 10.0
+
+    monkeypatch.setattr(worker_pool_module, "process_tree_rss_mb", fake_rss)
+    pool = CrawlerWorkerPool(workers=1, max_rss_mb=100, max_jobs=10)
+    pool._running = True
+    worker = FakeWorker()
+    worker.pid = 1234
+
+    pool._release(worker, finished=True)
+
+    assert _wait_idle(pool) is worker
+    assert measured_on and measured_on[0] is not threading.current_thread()
+    assert worker.last_rss_mb == 10.0
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="/proc 필요")
+def test_process_tree_rss_includes_current_process():
+    assert process_tree_rss_mb(os.getpid()) > 0
+
+
+def test_crawl_capacity_follows_active_pool(monkeypatch):
+    from app.infrastructure.crawler import worker_pool as worker_pool_module
+
+    monkeypatch.setattr(worker_pool_module.browser_pool, "max_concurrency", 2)
+    monkeypatch.setattr(worker_pool_module, "crawler_worker_pool", CrawlerWorkerPool(workers=0))
+    assert worker_pool_module.crawl_capacity() == 2
+
+    workers = _running_pool()
+    workers.workers = 4
+    monkeypatch.setattr(worker_pool_module, "crawler_worker_pool", workers)
+    assert worker_pool_module.crawl_capacity() == 4